@@ -0,0 +1,228 @@
+# app/cli.py
+# 목적: 운영용 관리 명령 모음
+# 실행: python -m app.cli <명령>
+import argparse
+import functools
+from pathlib import Path
+
+from sqlalchemy import func, inspect, select, text
+
+from app.core.config import settings
+from app.database import SessionLocal, engine
+from app.core import search
+from app.models.post import KEEP_UPDATED_AT, Post
+from app.models.like import Like
+from app.models.comment import Comment
+
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+BASELINE_REVISION = "0001"  # create_all 시절 스키마와 같은 리비전
+
+
+def _alembic_config():
+    from alembic.config import Config  # 관리 명령에서만 필요 — 앱(워커) import 경로에 넣지 않음
+
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def migrate(revision: str = "head") -> None:
+    """스키마를 revision까지 올림. 앱은 기동 시 스키마를 만들지 않으므로 배포 때 워커보다 먼저 한 번 실행"""
+    from alembic import command
+
+    config = _alembic_config()
+    with engine.connect() as conn:
+        # SQLite batch 마이그레이션은 테이블을 새로 만들고 옛 테이블을 DROP — FK가 켜져 있으면 DROP이
+        # 자식 행까지 CASCADE로 지우므로 마이그레이션 동안은 끔 (트랜잭션 밖에서만 바뀌는 PRAGMA)
+        _sqlite_foreign_keys(conn, False)
+        try:
+            with conn.begin():
+                if conn.dialect.name == "sqlite":
+                    # pysqlite는 DDL 앞에 BEGIN을 보내지 않아 DDL이 바로 커밋됨 — 직접 열어 중간 실패 시 전부 롤백
+                    conn.exec_driver_sql("BEGIN")
+                tables = set(inspect(conn).get_table_names())
+                adopted = "alembic_version" in tables and conn.scalar(text("SELECT COUNT(*) FROM alembic_version"))
+                if "posts" in tables and not adopted:
+                    # 예전처럼 기동 시 create_all로 만든 DB (또는 표시 전에 중단된 DB) — 기준 리비전(0001)에 맞춘 뒤
+                    # 표시하고 이후 리비전 적용. create_all은 쓰지 않음: 지금 모델로 만들면 이후 리비전이 추가할 컬럼까지 생겨 충돌
+                    columns = {c["name"] for c in inspect(conn).get_columns("posts")}
+                    if "likes_count" not in columns:
+                        conn.execute(text("ALTER TABLE posts ADD COLUMN likes_count INTEGER NOT NULL DEFAULT 0"))
+                    _create_baseline(conn, config)
+                    # 컬럼이 없던 DB는 전부 0 — 표시 전에 실제 좋아요 수로 채움 (repair-likes와 같은 값)
+                    conn.execute(text(
+                        "UPDATE posts SET likes_count = "
+                        "(SELECT COUNT(*) FROM likes WHERE likes.post_id = posts.post_id)"
+                    ))
+                    config.attributes["connection"] = conn
+                    command.stamp(config, BASELINE_REVISION)
+                config.attributes["connection"] = conn
+                command.upgrade(config, revision)
+        finally:
+            _sqlite_foreign_keys(conn, settings.SQLITE_FOREIGN_KEYS)  # 풀로 돌아가는 연결은 원래 설정으로
+
+
+def _create_baseline(conn, config) -> None:
+    """기준 리비전(0001)을 다시 실행하되 이미 있는 테이블/인덱스는 건너뜀 (없는 것만 생성)"""
+    from alembic.operations import Operations
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    baseline = ScriptDirectory.from_config(config).get_revision(BASELINE_REVISION).module
+    with Operations.context(MigrationContext.configure(conn)) as ops:
+        def create_index(index_name, table_name, columns, unique=False, **kw):
+            # 예전 create_all 모델은 ix_users_email을 UNIQUE 없이 만듦 — 고유성이 다르면 다시 만듦
+            existing = {i["name"]: i for i in inspect(conn).get_indexes(table_name)}
+            if index_name in existing and bool(existing[index_name]["unique"]) != unique:
+                ops.drop_index(index_name, table_name=table_name)
+            Operations.create_index(ops, index_name, table_name, columns, unique=unique, if_not_exists=True, **kw)
+
+        # 마이그레이션의 op.create_table/create_index는 ops의 메서드를 부름 — 없는 것만 만들게 바꿔 끼움
+        ops.create_table = functools.partial(Operations.create_table, ops, if_not_exists=True)
+        ops.create_index = create_index
+        baseline.upgrade()
+
+
+def _sqlite_foreign_keys(conn, on: bool) -> None:
+    if conn.dialect.name == "sqlite":
+        conn.exec_driver_sql(f"PRAGMA foreign_keys={'ON' if on else 'OFF'}")
+        conn.commit()
+
+
+# 비정규화 카운터 → (컬럼, 실제 행 수 상관 서브쿼리)
+COUNTERS = {
+    "likes_count": (
+        Post.likes_count,
+        select(func.count(Like.like_id)).where(Like.post_id == Post.post_id).scalar_subquery(),
+    ),
+    "comments_count": (
+        Post.comments_count,
+        select(func.count(Comment.comment_id)).where(Comment.post_id == Post.post_id).scalar_subquery(),
+    ),
+}
+
+
+def check_counters(fix: bool = False, names: list[str] | None = None) -> dict[str, int]:
+    """카운터가 실제 행 수와 다른 글 수 {카운터: 건수}. fix면 실제 값으로 맞춤 (정리 중인 글은 제외)"""
+    result = {}
+    with SessionLocal() as db:
+        for name in names or COUNTERS:
+            column, actual = COUNTERS[name]
+            if fix:
+                result[name] = (
+                    db.query(Post)
+                      .filter(column != actual, Post.deleted_at.is_(None))
+                      .update({column: actual, Post.score_dirty: True, **KEEP_UPDATED_AT}, synchronize_session=False)
+                )
+            else:
+                result[name] = db.scalar(
+                    select(func.count()).select_from(Post).where(column != actual, Post.deleted_at.is_(None))
+                )
+        db.commit()
+    return result
+
+
+def repair_likes_count() -> int:
+    """posts.likes_count를 likes 테이블 기준으로 다시 계산"""
+    return check_counters(fix=True, names=["likes_count"])["likes_count"]
+
+
+def refresh_scores() -> int:
+    """score_dirty인 글의 인기 피드 점수를 모두 계산 (마이그레이션 직후 기존 글 채우기 등)"""
+    import asyncio
+
+    from app.core import ranking
+    from app.database import async_engine
+
+    async def run() -> int:
+        try:
+            return await ranking.refresh()
+        finally:
+            await async_engine.dispose()
+
+    return asyncio.run(run())
+
+
+def purge_posts() -> int:
+    """소프트 삭제된 글의 좋아요/댓글과 글 행을 모두 정리 (백그라운드 정리를 끈 배포용)"""
+    import asyncio
+
+    from app.core import purge
+    from app.database import async_engine
+
+    async def run() -> int:
+        try:
+            return await purge.purge()
+        finally:
+            await async_engine.dispose()
+
+    return asyncio.run(run())
+
+
+def rebuild_search() -> str | None:
+    """검색 인덱스를 (없으면 만들고) posts 전체로 다시 채움"""
+    backend = search.install(engine)
+    if backend:
+        search.rebuild(engine)
+    return backend
+
+
+def sync_replicas() -> list[str]:
+    """로컬 시험용: SQLite primary 파일을 DATABASE_REPLICA_URLS의 SQLite 파일들로 복사 (온라인 백업 API)
+    실제 복제본(Postgres 스트리밍 복제 등)은 DB가 복제하므로 필요 없음"""
+    import sqlite3
+
+    from sqlalchemy.engine import make_url
+
+    from app.database import REPLICA_URLS
+
+    urls = [make_url(settings.DATABASE_URL), *(make_url(url) for url in REPLICA_URLS)]
+    if any(url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:") for url in urls):
+        raise SystemExit("sync-replicas는 파일 SQLite primary/복제본에서만 사용")
+    primary, *replicas = (url.database for url in urls)
+    with sqlite3.connect(primary) as src:
+        for path in replicas:
+            with sqlite3.connect(path) as dst:
+                src.backup(dst)
+    return replicas
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    sub = parser.add_subparsers(dest="command", required=True)
+    migrate_parser = sub.add_parser("migrate", help="마이그레이션 적용 (스키마 생성/갱신)")
+    migrate_parser.add_argument("revision", nargs="?", default="head")
+    sub.add_parser("repair-likes", help="posts.likes_count를 likes 테이블에서 재계산")
+    sub.add_parser("rebuild-search", help="게시글 전문 검색 인덱스 재구축")
+    sub.add_parser("refresh-scores", help="인기 피드 점수(hot/top) 재계산 대기분 모두 처리")
+    sub.add_parser("purge-posts", help="소프트 삭제된 글(자식 행이 많은 글)의 정리 대기분 모두 처리")
+    sub.add_parser("sync-replicas", help="(로컬 시험용) SQLite primary를 복제본 파일로 복사")
+    check_parser = sub.add_parser("check-counters", help="likes_count/comments_count와 실제 행 수 비교")
+    check_parser.add_argument("--fix", action="store_true", help="어긋난 카운터를 실제 값으로 맞춤")
+
+    args = parser.parse_args(argv)
+    if args.command == "migrate":
+        migrate(args.revision)
+        print(f"마이그레이션 완료: {args.revision}")
+    elif args.command == "repair-likes":
+        print(f"likes_count 보정: {repair_likes_count()}건")
+    elif args.command == "rebuild-search":
+        backend = rebuild_search()
+        print(f"검색 인덱스 재구축: {backend}" if backend else "검색 인덱스 미지원 — LIKE 검색 사용")
+    elif args.command == "refresh-scores":
+        print(f"점수 갱신: {refresh_scores()}건")
+    elif args.command == "purge-posts":
+        print(f"글 정리: {purge_posts()}건")
+    elif args.command == "sync-replicas":
+        for path in sync_replicas():
+            print(f"복제본 갱신: {path}")
+    elif args.command == "check-counters":
+        result = check_counters(fix=args.fix)
+        for name, n in result.items():
+            print(f"{name}: {'보정' if args.fix else '불일치'} {n}건")
+        if not args.fix and any(result.values()):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+# app/core/batch.py
+# 목적: 배치 API 공용 — "1,2,3" 형식 ID 목록 파싱
+from fastapi import HTTPException, status
+
+# 한 요청에 받을 수 있는 ID 수 (IN 목록 길이 제한)
+MAX_BATCH_IDS = 100
+
+
+def parse_ids(value: str, name: str = "ids") -> list[int]:
+    """쉼표로 구분된 양의 정수 목록 (중복 제거, 순서 유지). 형식 오류/개수 초과는 400"""
+    try:
+        ids = list(dict.fromkeys(int(part) for part in value.split(",") if part.strip()))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid {name}")
+    if not ids or any(i < 1 for i in ids):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid {name}")
+    if len(ids) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=f"Too many {name} (max {MAX_BATCH_IDS})")
+    return ids
@@ -0,0 +1,191 @@
+# app/core/bulk.py
+# 목적: 게시글/댓글 대량 내보내기(NDJSON 스트리밍)와 가져오기 (백필/보관용, 한 줄 = JSON 객체 하나)
+# - 내보내기: 서버 측 커서(stream + yield_per)로 BULK_CHUNK_ROWS행씩 읽어 바로 전송 → 행 수와 무관한 메모리
+#   한 트랜잭션(읽기 스냅샷)으로 읽으므로 도중의 쓰기는 섞이지 않음. 끊기면 after=마지막 ID로 이어받기
+# - 가져오기: 줄마다 기존 PostCreate/CommentCreate로 검증, 유효한 행을 BULK_CHUNK_ROWS개씩 모아
+#   INSERT executemany + 커밋 (청크 단위 반영 — 실패해도 앞 청크는 남음)
+#   잘못된 줄은 건너뛰고 줄 번호/오류를 결과에 담음. 청크가 무결성 오류로 실패하면 그 청크만 한 행씩 다시 넣어 골라냄
+# - 대량 가져오기는 행마다 실시간 이벤트(/events)를 발행하지 않음
+from collections import Counter
+from typing import AsyncIterator, Awaitable, Callable
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import to_json
+from sqlalchemy import Select, case, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.purge import ALIVE, PURGING
+from app.database import AsyncSessionLocal
+from app.models.comment import Comment
+from app.models.post import KEEP_UPDATED_AT, Post
+from app.schemas.bulk import ImportResult, ImportRowError
+from app.schemas.comment import CommentCreate
+from app.schemas.post import PostCreate
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+_posts = Post.__table__
+_comments = Comment.__table__
+
+Pending = list[tuple[int, dict]]  # (줄 번호, INSERT 값)
+Failures = list[tuple[int, list[dict]]]
+
+
+def _error(type_: str, msg: str, loc: tuple = ()) -> dict:
+    return {"type": type_, "loc": list(loc), "msg": msg}
+
+
+# ------------------------------
+# 내보내기
+# ------------------------------
+def posts_query(after: int = 0, author_id: str | None = None) -> Select:
+    q = (
+        select(Post.post_id, Post.title, Post.content, Post.author_id, Post.likes_count,
+               Post.comments_count, Post.created_at, Post.updated_at)
+        .where(Post.post_id > after, ALIVE)
+        .order_by(Post.post_id)
+    )
+    return q.where(Post.author_id == author_id) if author_id else q
+
+
+def comments_query(after: int = 0, post_id: int | None = None) -> Select:
+    q = (
+        select(Comment.comment_id, Comment.post_id, Comment.author_id, Comment.content,
+               Comment.created_at, Comment.updated_at)
+        .where(Comment.comment_id > after, Comment.post_id.not_in(PURGING))
+        .order_by(Comment.comment_id)
+    )
+    return q.where(Comment.post_id == post_id) if post_id else q
+
+
+async def export_ndjson(stmt: Select) -> AsyncIterator[bytes]:
+    """stmt 결과를 한 줄에 한 행씩. BULK_CHUNK_ROWS행마다 bytes 하나
+    응답을 보내는 동안 실행되므로 요청 의존성(get_async_db)이 아닌 자체 세션 사용"""
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(stmt.execution_options(yield_per=settings.BULK_CHUNK_ROWS))
+        async for rows in result.partitions():
+            yield b"".join([to_json(row._asdict()) + b"\n" for row in rows])
+
+
+# ------------------------------
+# 가져오기
+# ------------------------------
+async def read_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, bytes | None]]:
+    """요청 본문 → (줄 번호, 줄). 빈 줄은 건너뜀, BULK_MAX_LINE_BYTES를 넘는 줄은 None
+    긴 줄을 끝까지 모으지 않으므로 메모리는 청크 + 한 줄 크기로 제한"""
+    limit = settings.BULK_MAX_LINE_BYTES
+    buf = b""
+    lineno = 0
+    too_long = False  # 버리는 중인 줄의 나머지가 아직 안 끝남
+    async for chunk in chunks:
+        buf += chunk
+        *lines, buf = buf.split(b"\n")
+        for line in lines:
+            lineno += 1
+            if too_long or len(line) > limit:
+                too_long = False
+                yield lineno, None
+            elif line.strip():
+                yield lineno, line
+        if len(buf) > limit:
+            too_long = True
+            buf = b""
+    if too_long:
+        yield lineno + 1, None
+    elif buf.strip():
+        yield lineno + 1, buf
+
+
+def _fail(result: ImportResult, lineno: int, errors: list[dict]) -> None:
+    result.failed += 1
+    if len(result.errors) < settings.BULK_MAX_ERRORS:
+        result.errors.append(ImportRowError(line=lineno, errors=errors))
+
+
+async def _flush(db: AsyncSession, pending: Pending, result: ImportResult,
+                 write: Callable[[AsyncSession, Pending], Awaitable[Failures]]) -> None:
+    """청크 한 트랜잭션. 무결성 오류면 되돌리고 한 행씩 다시 (문제 행만 실패로 보고)"""
+    try:
+        failures = await write(db, pending)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        failures = []
+        for item in pending:
+            try:
+                failures += await write(db, [item])
+                await db.commit()
+            except IntegrityError as exc:
+                await db.rollback()
+                failures.append((item[0], [_error("integrity_error", str(exc.orig))]))
+    result.inserted += len(pending) - len(failures)
+    for lineno, errors in sorted(failures):
+        _fail(result, lineno, errors)
+
+
+async def _import(db: AsyncSession, chunks: AsyncIterator[bytes], schema: type[BaseModel],
+                  to_row: Callable[[BaseModel], dict],
+                  write: Callable[[AsyncSession, Pending], Awaitable[Failures]]) -> ImportResult:
+    result = ImportResult()
+    pending: Pending = []
+    async for lineno, line in read_lines(chunks):
+        if line is None:
+            _fail(result, lineno, [_error("line_too_long", f"Line exceeds {settings.BULK_MAX_LINE_BYTES} bytes")])
+            continue
+        try:
+            payload = schema.model_validate_json(line)
+        except ValidationError as exc:
+            _fail(result, lineno, exc.errors(include_url=False, include_context=False, include_input=False))
+            continue
+        pending.append((lineno, to_row(payload)))
+        if len(pending) >= settings.BULK_CHUNK_ROWS:
+            await _flush(db, pending, result, write)
+            pending = []
+    if pending:
+        await _flush(db, pending, result, write)
+    return result
+
+
+async def _write_posts(db: AsyncSession, pending: Pending) -> Failures:
+    # 점수는 score_dirty 기본값(true)으로 다음 ranking.refresh()가 계산, 검색 인덱스는 트리거가 채움
+    await db.execute(insert(_posts), [row for _, row in pending])
+    return []
+
+
+async def _write_comments(db: AsyncSession, pending: Pending) -> Failures:
+    # 글별 댓글 수를 먼저 한 문장으로 올리고(UPDATE ... CASE ... RETURNING) 돌아온 글만 존재하는 것으로 봄
+    # — create_comment의 카운터 갱신(app.core.counters)과 같은 순서 (쓰기 잠금을 먼저 잡아 읽기→쓰기 승격 충돌 없음)
+    counts = Counter(row["post_id"] for _, row in pending)
+    found = set(await db.scalars(
+        update(Post)
+          .where(Post.post_id.in_(counts), ALIVE)
+          .values(comments_count=Post.comments_count + case(counts, value=Post.post_id),
+                  score_dirty=True, **KEEP_UPDATED_AT)
+          .returning(Post.post_id)
+          .execution_options(synchronize_session=False)
+    ))
+    rows, failures = [], []
+    for lineno, row in pending:
+        if row["post_id"] in found:
+            rows.append(row)
+        else:
+            failures.append((lineno, [_error("post_not_found", "Post not found", ("post_id",))]))
+    if rows:
+        await db.execute(insert(_comments), rows)
+    return failures
+
+
+async def import_posts(db: AsyncSession, chunks: AsyncIterator[bytes], author_id: str) -> ImportResult:
+    """PostCreate 줄들 → 작성자 author_id로 INSERT"""
+    return await _import(db, chunks, PostCreate,
+                         lambda p: {"title": p.title, "content": p.content, "author_id": author_id},
+                         _write_posts)
+
+
+async def import_comments(db: AsyncSession, chunks: AsyncIterator[bytes], author_id: str) -> ImportResult:
+    """CommentCreate 줄들 → 작성자 author_id로 INSERT, 글별 comments_count 함께 갱신"""
+    return await _import(db, chunks, CommentCreate,
+                         lambda c: {"post_id": c.post_id, "content": c.content, "author_id": author_id},
+                         _write_comments)
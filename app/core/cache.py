@@ -0,0 +1,131 @@
+# app/core/cache.py
+# 목적: 프로세스 내 LRU+TTL 캐시와 Redis 호환 공유 캐시 백엔드
+# - TTLCache: 동기, 프로세스 내 (이벤트 루프 스레드에서만 사용)
+# - LocalBackend / RedisBackend: 같은 비동기 인터페이스(get/set/delete/discard), 값은 bytes
+#   RedisBackend는 redis.asyncio 호환 클라이언트를 받으므로 테스트에서는 로컬 대역으로 바꿔 끼울 수 있음
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any
+
+# 이름 → 캐시 (/metrics에서 적중/실패 카운터 노출용)
+CACHES: dict[str, "TTLCache | LocalBackend | RedisBackend"] = {}
+
+
+class TTLCache:
+    """크기 제한(LRU) + 만료(TTL) 캐시. ttl=None이면 set 시 개별 ttl이 없을 때 만료 없음"""
+
+    def __init__(self, maxsize: int, ttl: float | None = None, name: str | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Any, tuple[float | None, Any]] = OrderedDict()
+        if name:
+            CACHES[name] = self
+
+    def get(self, key, default=None):
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return default
+        expires_at, value = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl is not None and ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + ttl if ttl is not None else None, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class LocalBackend:
+    """TTLCache를 비동기 백엔드 인터페이스로 감싼 것 (기본값, 워커별 캐시)"""
+
+    def __init__(self, maxsize: int, ttl: float, name: str | None = None):
+        self._cache = TTLCache(maxsize, ttl)
+        if name:
+            CACHES[name] = self
+
+    @property
+    def hits(self) -> int:
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cache.misses
+
+    async def get(self, key: str) -> bytes | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        self._cache.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+    def discard(self, key: str) -> None:
+        """동기 문맥(ORM 이벤트 등)에서 쓰는 즉시 삭제"""
+        self._cache.delete(key)
+
+
+class RedisBackend:
+    """redis.asyncio 호환 클라이언트(get / set(ex=) / delete) 위의 공유 캐시 (워커 간 공유)"""
+
+    def __init__(self, client, ttl: float, prefix: str, name: str | None = None):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        if name:
+            CACHES[name] = self
+
+    async def get(self, key: str) -> bytes | None:
+        value = await self.client.get(self.prefix + key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        await self.client.set(self.prefix + key, value, ex=max(int(ttl or self.ttl), 1))
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.prefix + key)
+
+    def discard(self, key: str) -> None:
+        """동기 문맥용 — 실행 중인 이벤트 루프가 있으면 삭제를 예약 (없으면 TTL 만료에 맡김)"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        loop.create_task(self.delete(key))
+
+
+def make_backend(url: str | None, *, maxsize: int, ttl: float, prefix: str, name: str | None = None):
+    """url이 없으면 프로세스 내 캐시, redis:// 계열이면 공유 캐시 (redis 패키지 필요)"""
+    if not url:
+        return LocalBackend(maxsize, ttl, name=name)
+    import redis.asyncio as redis  # 선택 의존성 — 공유 캐시를 쓸 때만 필요
+
+    return RedisBackend(redis.from_url(url), ttl, prefix, name=name)
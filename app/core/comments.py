@@ -0,0 +1,37 @@
+# app/core/comments.py
+# 목적: 댓글 수 카운터(posts.comments_count)와 여러 글의 댓글 일부를 한 번에 조회하는 쿼리
+# - 카운터는 댓글 생성/삭제와 같은 트랜잭션에서 app.core.counters로 (커밋은 호출한 쪽에서)
+# - 글별 앞쪽/최신 K개: ROW_NUMBER() 윈도 한 번 — 글 수와 무관하게 쿼리 1번
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.counters import adjust_counter
+from app.core.purge import PURGING
+from app.models.comment import Comment
+from app.models.post import Post
+
+
+async def adjust_count(db: AsyncSession, post_id: int, delta: int) -> int | None:
+    """글의 댓글 수를 delta만큼 바꾸고 새 값 반환. 글이 없으면(정리 중인 글 포함) None"""
+    return await adjust_counter(db, Post.comments_count, post_id, delta)
+
+
+async def per_post(db: AsyncSession, post_ids: list[int], limit: int,
+                   newest: bool = False) -> dict[int, list[Comment]]:
+    """{post_id: 댓글 목록} — 글마다 작성순 앞쪽(newest면 최신) limit개. 요청한 모든 글이 키로 들어감"""
+    # ix_comments_post_created (post_id, created_at) 인덱스 순서와 같은 정렬
+    order = (Comment.created_at.desc(), Comment.comment_id.desc()) if newest \
+        else (Comment.created_at.asc(), Comment.comment_id.asc())
+    ranked = (
+        select(Comment, func.row_number().over(partition_by=Comment.post_id, order_by=order).label("rn"))
+        .where(Comment.post_id.in_(post_ids), Comment.post_id.not_in(PURGING))
+        .subquery()
+    )
+    picked = aliased(Comment, ranked)
+    rows = await db.scalars(select(picked).where(ranked.c.rn <= limit).order_by(ranked.c.post_id, ranked.c.rn))
+
+    by_post: dict[int, list[Comment]] = {post_id: [] for post_id in post_ids}
+    for c in rows:
+        by_post[c.post_id].append(c)
+    return by_post
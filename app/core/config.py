@@ -6,6 +6,97 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     PROJECT_NAME: str = "FastAPI Board API"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    SEARCH_BACKEND: str = "auto"  # auto: FTS5/tsvector 사용, like: 항상 LIKE 검색
+
+    # 읽기 복제본: 쉼표로 구분한 URL (비우면 모든 쿼리가 DATABASE_URL로)
+    # 읽기 전용 엔드포인트만 복제본을 라운드로빈으로 사용, 검사(REPLICA_HEALTH_CHECK_SECONDS 주기, 0이면 끔)에
+    # 실패한 복제본은 건너뜀. 쓰기 후 READ_YOUR_WRITES_SECONDS 동안 그 사용자의 읽기는 primary로
+    DATABASE_REPLICA_URLS: str = ""
+    REPLICA_HEALTH_CHECK_SECONDS: float = 5.0
+    REPLICA_HEALTH_TIMEOUT_SECONDS: float = 1.0
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+
+    # DB 커넥션 풀 (엔진마다 적용, 기본값은 SQLAlchemy 기본값과 동일)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0     # 체크아웃 대기 한도(초), 넘으면 TimeoutError
+    DB_POOL_RECYCLE: int = -1         # 초, -1이면 재생성 안 함
+    DB_POOL_PRE_PING: bool = False
+
+    # 비밀번호 해시 (bcrypt)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2    # 전용 프로세스 수, 0이면 스레드풀에서 실행
+    PASSWORD_HASH_QUEUE: int = 32     # 실행+대기 한도, 넘으면 429
+
+    # 캐시 (CACHE_URL이 redis://... 이면 워커 간 공유, 없으면 프로세스 내)
+    CACHE_URL: str | None = None
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAXSIZE: int = 10_000
+    TOKEN_CACHE_MAXSIZE: int = 10_000
+    RESPONSE_CACHE_TTL_SECONDS: int = 5   # 익명 목록 응답 캐시, 0이면 끔
+    RESPONSE_CACHE_MAXSIZE: int = 1_000
+
+    # HTTP 캐시: 익명 GET 응답의 Cache-Control max-age(초)
+    HTTP_CACHE_MAX_AGE: int = 0
+
+    # 좋아요 쓰기 버퍼(write-behind): 요청은 메모리에만 기록, 주기/개수 도달 시 한 트랜잭션으로 반영
+    LIKE_BUFFER_ENABLED: bool = False
+    LIKE_BUFFER_FLUSH_MS: int = 200
+    LIKE_BUFFER_MAX_PENDING: int = 1_000
+
+    # 인기 피드(sort=hot|top) 점수: 주기적으로 변경된 글만 재계산(초, 0이면 백그라운드 갱신 끔)
+    # HOT_SCORE_DECAY_SECONDS만큼 늦게 쓰인 글은 참여(좋아요+댓글)가 10배여야 같은 점수
+    HOT_REFRESH_SECONDS: int = 30
+    HOT_SCORE_DECAY_SECONDS: int = 45_000
+
+    # 실시간 이벤트(/events): 구독자별 대기열 크기, 넘칠 때 정책(drop_oldest | disconnect),
+    # 좋아요 수 변화 묶음 간격(ms, 0이면 즉시), SSE 하트비트 간격(초)
+    EVENTS_QUEUE_SIZE: int = 100
+    EVENTS_OVERFLOW: str = "drop_oldest"
+    EVENTS_COALESCE_MS: int = 250
+    EVENTS_HEARTBEAT_SECONDS: float = 15.0
+
+    # 대량 내보내기/가져오기(/bulk): 한 번에 읽고/넣는 행 수(가져오기는 청크마다 커밋),
+    # 결과에 담는 오류 행 수 상한, 가져오기 한 줄 최대 크기(bytes)
+    BULK_CHUNK_ROWS: int = 1_000
+    BULK_MAX_ERRORS: int = 100
+    BULK_MAX_LINE_BYTES: int = 1_048_576
+
+    # 글 삭제: 좋아요+댓글 수가 POST_PURGE_THRESHOLD 이상이면 소프트 삭제 후 백그라운드에서
+    # POST_PURGE_CHUNK_ROWS행씩 정리 (0이면 항상 바로 삭제). 청크 사이 쉬는 시간(ms — SQLite에서 잠금을 기다리는
+    # 다른 쓰기의 재시도 간격이 최대 100ms라 그보다 짧으면 정리가 잠금을 계속 다시 잡음), 정리 주기(초, 0이면 백그라운드 정리 끔)
+    POST_PURGE_THRESHOLD: int = 10_000
+    POST_PURGE_CHUNK_ROWS: int = 5_000
+    POST_PURGE_PAUSE_MS: int = 100
+    POST_PURGE_SECONDS: int = 60
+
+    # 요청 계측: Server-Timing 헤더, 느린 쿼리 로그(ms, 0이면 끔), 쿼리 예산 초과 시 실패(테스트용)
+    SERVER_TIMING: bool = True
+    SLOW_QUERY_MS: int = 0
+    QUERY_BUDGET_ENFORCE: bool = False
+
+    # 운영 서버(python -m app.server)
+    # 워커 수(0이면 CPU 수), 바인드 주소, listen backlog, keep-alive 유휴 시간(초 — 앞단 LB의 유휴 타임아웃보다 길게)
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0
+    SERVER_BACKLOG: int = 2048
+    SERVER_KEEPALIVE_SECONDS: int = 65
+    # SIGTERM 후 진행 중인 요청을 마무리할 시간(초). 넘으면 남은 연결(SSE/WebSocket 등)을 끊음
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: int = 30
+    # 워커별 한도: 동시 연결(넘으면 503), 처리 요청 수(+0~지터 — 워커들이 한꺼번에 재시작하지 않게),
+    # RSS(MB). 요청 수/RSS 한도에 닿은 워커는 요청을 마무리하고 종료 → 새 워커로 교체. 0이면 끔
+    SERVER_LIMIT_CONCURRENCY: int = 0
+    SERVER_MAX_REQUESTS: int = 0
+    SERVER_MAX_REQUESTS_JITTER: int = 0
+    SERVER_MAX_RSS_MB: int = 0
+    SERVER_ACCESS_LOG: bool = False
+
+    # SQLite 전용 PRAGMA
+    SQLITE_WAL: bool = True
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_FOREIGN_KEYS: bool = True
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,20 @@
+# app/core/counters.py
+# 목적: posts의 비정규화 카운터(likes_count/comments_count) 갱신 — UPDATE ... RETURNING 한 문장
+# 좋아요(app.core.likes, like_buffer)와 댓글 쓰기가 같은 트랜잭션에서 호출 (커밋은 호출한 쪽에서)
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.purge import ALIVE
+from app.models.post import KEEP_UPDATED_AT, Post
+
+
+async def adjust_counter(db: AsyncSession, column, post_id: int, delta: int) -> int | None:
+    """글의 카운터 column(Post.likes_count 등)을 delta만큼 바꾸고 새 값 반환. 글이 없으면(정리 중인 글 포함) None"""
+    # score_dirty: 인기 피드 점수 재계산 대상 (app.core.ranking)
+    return await db.scalar(
+        update(Post)
+          .where(Post.post_id == post_id, ALIVE)
+          .values({column: column + delta, Post.score_dirty: True, **KEEP_UPDATED_AT})
+          .returning(column)
+          .execution_options(synchronize_session=False)
+    )
@@ -0,0 +1,165 @@
+# app/core/events.py
+# 목적: 게시글/댓글/좋아요 변경을 실시간으로 알리는 프로세스 내 pub/sub (SSE·WebSocket 엔드포인트가 구독)
+# - 토픽: 게시판 전체(post_id=None) 또는 글 하나(post_id) — 글 이벤트는 그 글 구독자 + 게시판 구독자에게만 전달
+# - 구독자마다 EVENTS_QUEUE_SIZE 크기의 대기열. 가득 차면 EVENTS_OVERFLOW 정책
+#   drop_oldest: 오래된 이벤트를 버리고 다음 전송 때 "lagged"(버린 수)를 먼저 보냄 → 클라이언트가 다시 조회
+#   disconnect: 느린 구독자를 끊음 (클라이언트가 재접속 후 다시 조회)
+# - 좋아요 수 변화는 글별로 EVENTS_COALESCE_MS 동안 모아 마지막 값 한 번만 발행 (인기 글 좋아요 폭주 대비)
+# - 이벤트는 발행 시 한 번만 JSON으로 만들고 모든 구독자가 같은 bytes를 공유
+# 워커(프로세스)별 — 다른 워커에서 일어난 변경은 그 워커의 구독자에게만 전달됨
+# 이벤트 루프 스레드에서만 사용 (publish는 await 없이 대기열에 넣기만 함)
+import asyncio
+import itertools
+from collections import deque
+
+from pydantic_core import to_json
+
+from app.core.config import settings
+
+LAGGED = "lagged"
+
+_ids = itertools.count(1)
+_board: set["Subscription"] = set()
+_by_post: dict[int, set["Subscription"]] = {}
+_likes: dict[int, int] = {}  # 모으는 중인 좋아요 수 {post_id: 최신 값}
+_likes_timer: asyncio.TimerHandle | None = None
+
+published_total = 0
+dropped_total = 0       # drop_oldest로 버린 이벤트 수 (구독자별 합)
+disconnected_total = 0  # disconnect 정책으로 끊은 구독자 수
+
+
+class Event:
+    """발행된 이벤트 하나 — 전송 형식(SSE/JSON)은 처음 필요할 때 한 번만 만듦"""
+    __slots__ = ("id", "type", "post_id", "data", "_json", "_sse")
+
+    def __init__(self, type_: str, post_id: int | None, data: dict):
+        self.id = next(_ids)
+        self.type = type_
+        self.post_id = post_id
+        self.data = data
+        self._json: bytes | None = None
+        self._sse: bytes | None = None
+
+    def json(self) -> bytes:
+        if self._json is None:
+            self._json = to_json({"id": self.id, "type": self.type, "post_id": self.post_id, "data": self.data})
+        return self._json
+
+    def sse(self) -> bytes:
+        if self._sse is None:
+            self._sse = b"id: %d\nevent: %s\ndata: %s\n\n" % (self.id, self.type.encode(), self.json())
+        return self._sse
+
+
+class SlowConsumer(Exception):
+    """disconnect 정책에서 대기열이 넘친 구독자"""
+
+
+class Subscription:
+    __slots__ = ("post_id", "_queue", "_ready", "dropped", "overflowed")
+
+    def __init__(self, post_id: int | None):
+        self.post_id = post_id
+        self._queue: deque[Event] = deque()
+        self._ready = asyncio.Event()
+        self.dropped = 0  # 아직 알리지 않은 버린 이벤트 수
+        self.overflowed = False
+
+    def offer(self, event: Event) -> None:
+        global dropped_total, disconnected_total
+        if self.overflowed:
+            return
+        if len(self._queue) >= settings.EVENTS_QUEUE_SIZE:
+            if settings.EVENTS_OVERFLOW == "disconnect":
+                self.overflowed = True
+                self._queue.clear()
+                disconnected_total += 1
+                self._ready.set()
+                return
+            self._queue.popleft()
+            self.dropped += 1
+            dropped_total += 1
+        self._queue.append(event)
+        self._ready.set()
+
+    async def get(self, timeout: float | None = None) -> Event | None:
+        """다음 이벤트. timeout 동안 없으면 None (하트비트용). 넘친 구독자는 SlowConsumer"""
+        if not self._queue and not self.overflowed:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        if self.overflowed:
+            raise SlowConsumer
+        if self.dropped:
+            lagged = Event(LAGGED, self.post_id, {"dropped": self.dropped})
+            self.dropped = 0
+            return lagged
+        return self._queue.popleft()
+
+
+# ------------------------------
+# 구독
+# ------------------------------
+def subscribe(post_id: int | None = None) -> Subscription:
+    sub = Subscription(post_id)
+    if post_id is None:
+        _board.add(sub)
+    else:
+        _by_post.setdefault(post_id, set()).add(sub)
+    return sub
+
+
+def unsubscribe(sub: Subscription) -> None:
+    if sub.post_id is None:
+        _board.discard(sub)
+        return
+    subs = _by_post.get(sub.post_id)
+    if subs is not None:
+        subs.discard(sub)
+        if not subs:
+            del _by_post[sub.post_id]
+
+
+def subscribers() -> int:
+    return len(_board) + sum(len(subs) for subs in _by_post.values())
+
+
+# ------------------------------
+# 발행
+# ------------------------------
+def publish(type_: str, post_id: int, **data) -> Event | None:
+    """구독자가 없으면 이벤트를 만들지도 않음"""
+    global published_total
+    post_subs = _by_post.get(post_id, ())
+    if not _board and not post_subs:
+        return None
+    event = Event(type_, post_id, {"post_id": post_id, **data})
+    for sub in _board:
+        sub.offer(event)
+    for sub in post_subs:
+        sub.offer(event)
+    published_total += 1
+    return event
+
+
+def likes_changed(post_id: int, likes_count: int) -> None:
+    """좋아요 수 변화 — EVENTS_COALESCE_MS 동안 모아 글별 마지막 값만 post.likes로 발행"""
+    global _likes_timer
+    if settings.EVENTS_COALESCE_MS <= 0:
+        publish("post.likes", post_id, likes_count=likes_count)
+        return
+    _likes[post_id] = likes_count
+    if _likes_timer is None:
+        _likes_timer = asyncio.get_running_loop().call_later(settings.EVENTS_COALESCE_MS / 1000, _flush_likes)
+
+
+def _flush_likes() -> None:
+    global _likes_timer
+    _likes_timer = None
+    pending = dict(_likes)
+    _likes.clear()
+    for post_id, likes_count in pending.items():
+        publish("post.likes", post_id, likes_count=likes_count)
@@ -0,0 +1,104 @@
+# app/core/hashing.py
+# 목적: 비밀번호 해시(bcrypt)를 전용 프로세스 풀에서 실행
+# bcrypt는 호출당 수백 ms의 CPU 작업이라 요청 스레드/이벤트 루프에서 돌리면 다른 요청까지 밀림
+# - 워커 수(PASSWORD_HASH_WORKERS)와 대기열 길이(PASSWORD_HASH_QUEUE)를 제한하고, 가득 차면 429로 거절
+# - PASSWORD_HASH_WORKERS=0이면 프로세스 풀 없이 스레드풀에서 실행
+# - 워커 프로세스가 죽으면(OOM kill 등) 풀 전체가 깨지므로 버리고 새 풀로 한 번 재시도, 그래도 실패하면 503
+# 워커 프로세스가 import하므로 DB/모델 등 무거운 모듈은 여기서 import하지 않음
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 라운드가 설정과 다른 기존 해시는 needs_update → 로그인 시 재해시
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+
+def get_password_hash(raw: str) -> str:
+    return pwd_context.hash(raw)
+
+def verify_password(raw: str, hashed: str) -> bool:
+    return pwd_context.verify(raw, hashed)
+
+def verify_and_update(raw: str, hashed: str) -> tuple[bool, str | None]:
+    """검증 + (필요하면) 현재 설정으로 다시 만든 해시"""
+    return pwd_context.verify_and_update(raw, hashed)
+
+
+_pool: ProcessPoolExecutor | None = None
+_pending = 0  # 실행 중 + 대기 중인 해시 작업 수 (이벤트 루프 스레드에서만 변경)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # fork는 부모의 DB 연결/스레드를 복제하므로 spawn으로 깨끗한 워커를 띄움
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """깨진 풀을 버림 — 다음 작업이 새 풀을 띄움 (같은 풀에서 실패한 동시 작업들은 한 번만 교체)"""
+    global _pool
+    if _pool is pool:
+        _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_in_pool(fn, *args):
+    for _ in range(2):
+        pool = _get_pool()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+        except BrokenProcessPool:
+            logger.warning("password hash worker died, restarting the pool")
+            _discard_pool(pool)
+    raise HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Password hashing is temporarily unavailable, retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
+async def _run(fn, *args):
+    global _pending
+    if _pending >= settings.PASSWORD_HASH_QUEUE:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many password operations in progress, retry shortly",
+            headers={"Retry-After": "1"},
+        )
+    _pending += 1
+    try:
+        if settings.PASSWORD_HASH_WORKERS <= 0:
+            return await run_in_threadpool(fn, *args)
+        return await _run_in_pool(fn, *args)
+    finally:
+        _pending -= 1
+
+
+async def hash_password_async(raw: str) -> str:
+    return await _run(get_password_hash, raw)
+
+
+async def verify_and_update_async(raw: str, hashed: str) -> tuple[bool, str | None]:
+    return await _run(verify_and_update, raw, hashed)
+
+
+def shutdown() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
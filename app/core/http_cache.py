@@ -0,0 +1,66 @@
+# app/core/http_cache.py
+# 목적: 조건부 GET (ETag / Last-Modified → 304) 과 Cache-Control 헤더
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+from app.core.config import settings
+
+
+def make_etag(*parts) -> str:
+    """응답 내용을 결정하는 값들(수정 시각, 카운터 등)로 만든 약한 ETag"""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite는 naive(UTC 기준 CURRENT_TIMESTAMP)로 돌려줌
+    value = value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def last_modified_of(*values: datetime | None) -> datetime | None:
+    present = [_as_utc(v) for v in values if v is not None]
+    return max(present) if present else None
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None = None) -> bool:
+    """
+    If-None-Match가 있으면 그것만 봄 (약한 비교). 없을 때만 If-Modified-Since 사용.
+    last_modified는 응답 전체가 그 시각 이후로 바뀌지 않았다고 보장될 때만 넘길 것
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        wanted = etag.removeprefix("W/")
+        return any(tag.strip().removeprefix("W/") == wanted for tag in if_none_match.split(","))
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if last_modified is None or if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return last_modified <= _as_utc(since)
+
+
+def cache_headers(etag: str, last_modified: datetime | None, private: bool) -> dict[str, str]:
+    """
+    익명 응답은 CDN/프록시가 저장 가능(public), 로그인 응답은 my_like 등 사용자별 값이 있어 private
+    """
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache" if private else f"public, max-age={settings.HTTP_CACHE_MAX_AGE}",
+        "Vary": "Authorization",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
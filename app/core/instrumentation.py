@@ -0,0 +1,143 @@
+# app/core/instrumentation.py
+# 목적: 요청 단위 성능 계측
+# - 라우트별 지연 히스토그램, SQL 문 수/DB 시간 (/metrics)
+# - Server-Timing 응답 헤더 (브라우저 개발자 도구에서 바로 확인)
+# - 느린 쿼리 로그 (SLOW_QUERY_MS)
+# - 쿼리 예산: 라우트에 dependencies=[query_budget(N)]로 요청당 SQL 문 수 상한 선언 (N+1 감시)
+#   넘으면 경고 로그, QUERY_BUDGET_ENFORCE(테스트용)면 예외로 요청 실패
+import logging
+import time
+from contextvars import ContextVar
+
+from fastapi import Depends
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+
+from app.core.config import settings
+from app.database import POOLS
+
+logger = logging.getLogger(__name__)
+
+# 초 단위 히스토그램 상한 (Prometheus le)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class RequestStats:
+    """요청 하나에서 실행한 SQL 통계"""
+    __slots__ = ("statements", "db_seconds", "budget")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.budget: int | None = None
+
+
+class RouteStats:
+    """라우트("GET /posts/{post_id}")별 누적 통계"""
+    __slots__ = ("requests", "buckets", "seconds_total", "statements_total", "db_seconds_total", "over_budget")
+
+    def __init__(self):
+        self.requests = 0
+        self.buckets = [0] * len(LATENCY_BUCKETS)  # 누적(cumulative) 아님 — 렌더링 때 합산
+        self.seconds_total = 0.0
+        self.statements_total = 0
+        self.db_seconds_total = 0.0
+        self.over_budget = 0
+
+    def observe(self, seconds: float, stats: RequestStats) -> None:
+        self.requests += 1
+        self.seconds_total += seconds
+        self.statements_total += stats.statements
+        self.db_seconds_total += stats.db_seconds
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+
+
+ROUTES: dict[str, RouteStats] = {}
+_current: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+def query_budget(limit: int):
+    """라우트 dependencies용 — 이 요청에서 실행할 SQL 문 수 상한 (인증 조회 포함)"""
+    async def declare():
+        stats = _current.get()
+        if stats is not None:
+            stats.budget = limit
+    return Depends(declare)
+
+
+# ------------------------------
+# SQLAlchemy 훅
+# ------------------------------
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._started_at
+    stats = _current.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.db_seconds += elapsed
+    if settings.SLOW_QUERY_MS and elapsed * 1000 >= settings.SLOW_QUERY_MS:
+        logger.warning("slow query (%.1fms): %s", elapsed * 1000, " ".join(statement.split())[:1000])
+
+
+def install() -> None:
+    """동기/비동기 엔진 모두에 훅 등록 (비동기 엔진은 내부 sync_engine)"""
+    for eng in POOLS.values():
+        if not event.contains(eng, "before_cursor_execute", _before_cursor_execute):
+            event.listen(eng, "before_cursor_execute", _before_cursor_execute)
+            event.listen(eng, "after_cursor_execute", _after_cursor_execute)
+
+
+# ------------------------------
+# ASGI 미들웨어
+# ------------------------------
+class RequestMetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            # 응답 시작 시점에는 핸들러가 끝났으므로 DB 시간/문 수가 확정됨
+            if message["type"] == "http.response.start" and settings.SERVER_TIMING:
+                total_ms = (time.perf_counter() - started) * 1000
+                MutableHeaders(scope=message).append(
+                    "Server-Timing",
+                    f'db;dur={stats.db_seconds * 1000:.2f};desc="{stats.statements} queries", '
+                    f"total;dur={total_ms:.2f}",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            route = scope.get("route")
+            label = f"{scope['method']} {route.path}" if route is not None else "unmatched"
+            route_stats = ROUTES.get(label)
+            if route_stats is None:
+                route_stats = ROUTES[label] = RouteStats()
+            route_stats.observe(time.perf_counter() - started, stats)
+
+        if stats.budget is not None and stats.statements > stats.budget:
+            route_stats.over_budget += 1
+            message = f"{label}: {stats.statements} SQL statements, budget {stats.budget}"
+            if settings.QUERY_BUDGET_ENFORCE:
+                raise QueryBudgetExceeded(message)
+            logger.warning("query budget exceeded — %s", message)
@@ -0,0 +1,208 @@
+# app/core/like_buffer.py
+# 목적: 좋아요 쓰기 버퍼(write-behind) — LIKE_BUFFER_ENABLED일 때 app.core.likes 대신 사용
+# 인기 글에 좋아요가 몰리면 요청마다 커밋(= SQLite 쓰기 잠금)이 줄을 서므로
+# - 요청은 (post_id, user_id)별 "원하는 최종 상태"만 메모리에 기록 (좋아요 후 취소는 상쇄되어 사라짐)
+# - LIKE_BUFFER_FLUSH_MS마다 또는 LIKE_BUFFER_MAX_PENDING개가 쌓이면 한 트랜잭션으로 반영
+# - 읽기(목록/상세/my-likes)는 count()/liked()로 아직 반영 안 된 상태를 덮어써서 보여 줌
+# 버퍼는 프로세스(워커)별 — 다른 워커의 쓰기는 반영 후 DB 값으로 보임
+# 이벤트 루프 스레드에서만 사용 (상태 변경 사이에 await 없음)
+import asyncio
+from collections import Counter
+
+from sqlalchemy import select, delete, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.likes import insert_for, adjust_count
+from app.core.periodic import PeriodicTask
+from app.core.purge import ALIVE
+from app.database import AsyncSessionLocal
+from app.models.like import Like
+from app.models.post import Post
+
+_Key = tuple[int, str]  # (post_id, user_id)
+CHUNK = 500  # 반영 시 한 문장에 넣는 행 수 (SQLite 변수 개수 제한 대비)
+
+# (DB에 반영된 상태, 원하는 상태). 둘이 같으면 변화 없음(조회해 둔 상태만 기억)
+_pending: dict[_Key, tuple[bool, bool]] = {}
+_flushing: dict[_Key, tuple[bool, bool]] = {}  # 반영 중인 묶음 — 커밋 전까지 읽기에 계속 반영
+# 버퍼 상태가 있는 글의 좋아요 수(버퍼 반영 후 값). 반영이 끝난 뒤 한 주기 더 유지하고 지움
+_counts: dict[int, int] = {}
+_settled: set[int] = set()
+flushed_total = 0  # 반영한 (글, 사용자) 변경 수 (/metrics)
+
+_flush_lock = asyncio.Lock()
+
+
+def enabled() -> bool:
+    return settings.LIKE_BUFFER_ENABLED
+
+
+def _state(key: _Key) -> bool | None:
+    entry = _pending.get(key) or _flushing.get(key)
+    return entry[1] if entry else None
+
+
+# ------------------------------
+# 읽기 오버레이
+# ------------------------------
+def count(post_id: int, stored: int) -> int:
+    """DB에서 읽은 좋아요 수에 버퍼 상태를 덮어쓴 값"""
+    return _counts.get(post_id, stored)
+
+
+def liked(post_id: int, user_id: str, stored: bool) -> bool:
+    state = _state((post_id, user_id))
+    return stored if state is None else state
+
+
+# ------------------------------
+# 쓰기 (app.core.likes와 같은 시그니처, 커밋 없음)
+# ------------------------------
+async def _load(db: AsyncSession, post_id: int, user_id: str) -> bool:
+    """(글, 사용자) 상태와 글의 좋아요 수를 메모리에 올림. 글이 없으면 False"""
+    key = (post_id, user_id)
+    if _state(key) is not None and post_id in _counts:
+        return True
+    has_like = select(Like.like_id).where(Like.post_id == post_id, Like.user_id == user_id).exists()
+    row = (await db.execute(select(Post.likes_count, has_like).where(Post.post_id == post_id, ALIVE))).first()
+    if row is None:
+        return False
+    # 조회하는 동안 다른 요청이 먼저 올렸으면 메모리 값이 최신
+    _counts.setdefault(post_id, row[0])
+    if _state(key) is None:
+        _pending[key] = (row[1], row[1])
+    return True
+
+
+def _set(post_id: int, user_id: str, desired: bool) -> bool:
+    key = (post_id, user_id)
+    current = _state(key)
+    if current == desired:
+        return False
+    # 반영 중인 묶음이 있으면 그 결과가 곧 DB 상태
+    base = _pending[key][0] if key in _pending else current
+    _pending[key] = (base, desired)
+    _counts[post_id] += 1 if desired else -1
+    _settled.discard(post_id)
+    if len(_pending) >= settings.LIKE_BUFFER_MAX_PENDING:
+        flusher.wake()
+    return True
+
+
+async def like(db: AsyncSession, post_id: int, user_id: str) -> tuple[bool, int | None]:
+    if not await _load(db, post_id, user_id):
+        return False, None
+    return _set(post_id, user_id, True), _counts[post_id]
+
+
+async def unlike(db: AsyncSession, post_id: int, user_id: str) -> tuple[bool, int | None]:
+    if not await _load(db, post_id, user_id):
+        return False, None
+    return _set(post_id, user_id, False), _counts[post_id]
+
+
+async def toggle(db: AsyncSession, post_id: int, user_id: str) -> tuple[bool, int | None]:
+    if not await _load(db, post_id, user_id):
+        return False, None
+    desired = not _state((post_id, user_id))
+    _set(post_id, user_id, desired)
+    return desired, _counts[post_id]
+
+
+def pending() -> int:
+    return sum(1 for base, want in _pending.values() if base != want)
+
+
+def forget_post(post_id: int) -> None:
+    """글 삭제 시 — 반영 대기/반영 중인 좋아요와 카운트 버림"""
+    for key in [key for key in _pending if key[0] == post_id]:
+        del _pending[key]
+    # 반영 중인 묶음(_flushing)은 flush()가 넘긴 batch와 같은 dict — 빼 두면 아직 쓰지 않은 행은 쓰지 않고,
+    # 반영이 실패해도 다시 대기열로 돌아오지 않음
+    for key in [key for key in _flushing if key[0] == post_id]:
+        del _flushing[key]
+    _counts.pop(post_id, None)
+    _settled.discard(post_id)
+
+
+# ------------------------------
+# 반영
+# ------------------------------
+async def _apply(db: AsyncSession, batch: dict[_Key, tuple[bool, bool]]) -> None:
+    # 그사이 삭제된 글의 좋아요는 버림 (조회하는 동안 forget_post가 batch에서 뺀 글도 — 아래는 await 없이 batch를 읽음)
+    existing = set(await db.scalars(select(Post.post_id).where(Post.post_id.in_({p for p, _ in batch}), ALIVE)))
+    adds = [{"post_id": p, "user_id": u} for (p, u), (_, want) in batch.items() if want and p in existing]
+    removes = [key for key, (_, want) in batch.items() if not want]
+
+    # 실제로 바뀐 행만 RETURNING으로 세어 카운터에 반영 (다른 워커가 먼저 바꿨어도 어긋나지 않음)
+    deltas: Counter = Counter()
+    for i in range(0, len(adds), CHUNK):
+        stmt = (
+            insert_for(db)(Like).values(adds[i:i + CHUNK])
+            .on_conflict_do_nothing(index_elements=[Like.post_id, Like.user_id])
+            .returning(Like.post_id)
+        )
+        deltas.update(await db.scalars(stmt))
+    for i in range(0, len(removes), CHUNK):
+        stmt = delete(Like).where(tuple_(Like.post_id, Like.user_id).in_(removes[i:i + CHUNK])).returning(Like.post_id)
+        deltas.subtract(await db.scalars(stmt))
+    for post_id, delta in deltas.items():
+        if delta:
+            await adjust_count(db, post_id, delta)
+
+
+async def flush() -> int:
+    """대기 중인 변경을 한 트랜잭션으로 반영. 반영한 (글, 사용자) 수 반환"""
+    global _flushing, flushed_total
+    async with _flush_lock:
+        batch = {key: entry for key, entry in _pending.items() if entry[0] != entry[1]}
+        _pending.clear()
+        if not batch:
+            _settle()
+            return 0
+        _flushing = batch
+        try:
+            async with AsyncSessionLocal() as db:
+                await _apply(db, batch)
+                await db.commit()
+        except BaseException:
+            # 실패(또는 종료 중 취소)하면 다음 반영 때 다시 시도 (오류 기록은 flusher가)
+            for key, (base, want) in batch.items():
+                newer = _pending.get(key)
+                _pending[key] = (base, newer[1] if newer else want)
+            _flushing = {}
+            raise
+        _flushing = {}
+        flushed_total += len(batch)
+        _settle()
+        return len(batch)
+
+
+def _settle() -> None:
+    # 직전 주기에 이미 반영이 끝난 글은 이제 DB 값이 최신 → 덮어쓰기 중단
+    # (반영 커밋 직전에 시작된 읽기가 옛 값을 보지 않도록 한 주기 늦게 지움)
+    busy = {post_id for post_id, _ in _pending}
+    for post_id in list(_counts):
+        if post_id in busy:
+            _settled.discard(post_id)
+        elif post_id in _settled:
+            del _counts[post_id]
+            _settled.discard(post_id)
+        else:
+            _settled.add(post_id)
+
+
+# LIKE_BUFFER_FLUSH_MS 주기, 대기 중인 변경이 LIKE_BUFFER_MAX_PENDING개를 넘으면 바로
+flusher = PeriodicTask(
+    "like buffer flush", flush,
+    interval=lambda: settings.LIKE_BUFFER_FLUSH_MS / 1000,
+    enabled=enabled,
+)
+
+
+async def drain() -> None:
+    """앱 종료 시 (flusher를 멈춘 뒤) 남은 변경을 모두 반영"""
+    while _pending:
+        if not await flush():
+            break
@@ -0,0 +1,69 @@
+# app/core/likes.py
+# 목적: 좋아요 추가/취소를 원자적 SQL로 처리 (SELECT 후 INSERT 경쟁 → uq_likes_post_user 위반 500 방지)
+# - 추가: INSERT ... SELECT FROM posts ... ON CONFLICT DO NOTHING RETURNING (글이 없거나 이미 있으면 0행)
+# - 취소: DELETE ... RETURNING
+# - 카운터: 같은 트랜잭션에서 UPDATE ... RETURNING likes_count
+# 커밋은 호출한 쪽에서 (결과 카운트가 None이면 글이 없음 → 404, 소프트 삭제돼 정리 중인 글도 없는 것으로)
+from sqlalchemy import select, delete, literal
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.counters import adjust_counter
+from app.core.purge import ALIVE
+from app.models.like import Like
+from app.models.post import Post
+
+
+def insert_for(db: AsyncSession):
+    """세션의 DB 방언에 맞는 INSERT (ON CONFLICT 지원). 방언 모듈은 쓸 때 import — 워커 기동 시간 절약"""
+    if db.bind.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+async def _add(db: AsyncSession, post_id: int, user_id: str) -> bool:
+    stmt = (
+        insert_for(db)(Like)
+        .from_select(["post_id", "user_id"],
+                     select(Post.post_id, literal(user_id)).where(Post.post_id == post_id, ALIVE))
+        .on_conflict_do_nothing(index_elements=[Like.post_id, Like.user_id])
+        .returning(Like.like_id)
+    )
+    return (await db.execute(stmt)).first() is not None
+
+
+async def _remove(db: AsyncSession, post_id: int, user_id: str) -> bool:
+    stmt = delete(Like).where(Like.post_id == post_id, Like.user_id == user_id).returning(Like.like_id)
+    return (await db.execute(stmt)).first() is not None
+
+
+async def adjust_count(db: AsyncSession, post_id: int, delta: int) -> int | None:
+    return await adjust_counter(db, Post.likes_count, post_id, delta)
+
+
+async def _current(db: AsyncSession, post_id: int) -> int | None:
+    return await db.scalar(select(Post.likes_count).where(Post.post_id == post_id, ALIVE))
+
+
+async def like(db: AsyncSession, post_id: int, user_id: str) -> tuple[bool, int | None]:
+    """(이번에 추가됐는지, 현재 좋아요 수) — 이미 좋아요 상태면 변경 없음"""
+    if await _add(db, post_id, user_id):
+        return True, await adjust_count(db, post_id, 1)
+    return False, await _current(db, post_id)
+
+
+async def unlike(db: AsyncSession, post_id: int, user_id: str) -> tuple[bool, int | None]:
+    """(이번에 취소됐는지, 현재 좋아요 수) — 좋아요가 없으면 변경 없음"""
+    if await _remove(db, post_id, user_id):
+        return True, await adjust_count(db, post_id, -1)
+    return False, await _current(db, post_id)
+
+
+async def toggle(db: AsyncSession, post_id: int, user_id: str) -> tuple[bool, int | None]:
+    """(토글 후 좋아요 상태, 현재 좋아요 수)"""
+    if await _remove(db, post_id, user_id):
+        return False, await adjust_count(db, post_id, -1)
+    # 동시에 같은 사용자의 추가가 먼저 들어갔으면 충돌 → 결과는 어차피 "좋아요" 상태
+    _, count = await like(db, post_id, user_id)
+    return True, count
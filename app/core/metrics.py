@@ -0,0 +1,119 @@
+# app/core/metrics.py
+# 목적: Prometheus 텍스트 포맷(/metrics) 렌더링
+from app.core import like_buffer, ranking, replicas, events, instrumentation, purge
+from app.core.cache import CACHES
+from app.database import POOLS, MeteredPoolMixin
+
+
+def _metric(lines: list[str], name: str, kind: str, help_text: str, samples: list[tuple[dict, float]]) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+    for labels, value in samples:
+        label_str = ",".join(f'{k}="{v}"' for k, v in labels.items())
+        lines.append(f"{name}{{{label_str}}} {value}" if label_str else f"{name} {value}")
+
+
+def _pool_metrics(lines: list[str]) -> None:
+    pools = {name: eng.pool for name, eng in POOLS.items() if isinstance(eng.pool, MeteredPoolMixin)}
+    if not pools:
+        return
+
+    def per_pool(fn):
+        return [({"pool": name}, fn(pool)) for name, pool in pools.items()]
+
+    _metric(lines, "db_pool_size", "gauge", "Configured pool size", per_pool(lambda p: p.size()))
+    _metric(lines, "db_pool_checked_out", "gauge", "Connections currently in use", per_pool(lambda p: p.checkedout()))
+    _metric(lines, "db_pool_overflow", "gauge", "Overflow connections currently open", per_pool(lambda p: max(p.overflow(), 0)))
+    _metric(lines, "db_pool_checkouts_total", "counter", "Connection checkouts", per_pool(lambda p: p.stats.checkouts))
+    _metric(lines, "db_pool_checkout_wait_seconds_sum", "counter", "Total time spent waiting for a connection",
+            per_pool(lambda p: round(p.stats.wait_seconds_total, 6)))
+    _metric(lines, "db_pool_checkout_wait_seconds_max", "gauge", "Longest single checkout wait",
+            per_pool(lambda p: round(p.stats.wait_seconds_max, 6)))
+    _metric(lines, "db_pool_overflow_events_total", "counter", "Checkouts served by an overflow connection",
+            per_pool(lambda p: p.stats.overflow_events))
+    _metric(lines, "db_pool_timeouts_total", "counter", "Checkouts that hit the pool timeout",
+            per_pool(lambda p: p.stats.timeouts))
+
+
+def _replica_metrics(lines: list[str]) -> None:
+    if not replicas.enabled():
+        return
+    _metric(lines, "db_replica_healthy", "gauge", "Read replica passed its last health check",
+            [({"replica": f"replica{i}"}, int(ok)) for i, ok in enumerate(replicas.healthy)])
+    _metric(lines, "db_read_routes_total", "counter", "Read-only sessions by routing decision",
+            [({"target": target}, n) for target, n in replicas.routed_total.items()])
+
+
+def _cache_metrics(lines: list[str]) -> None:
+    if not CACHES:
+        return
+    _metric(lines, "cache_hits_total", "counter", "Cache hits",
+            [({"cache": name}, c.hits) for name, c in CACHES.items()])
+    _metric(lines, "cache_misses_total", "counter", "Cache misses",
+            [({"cache": name}, c.misses) for name, c in CACHES.items()])
+
+
+def _like_buffer_metrics(lines: list[str]) -> None:
+    if not like_buffer.enabled():
+        return
+    _metric(lines, "like_buffer_pending", "gauge", "Like changes waiting to be flushed",
+            [({}, like_buffer.pending())])
+    _metric(lines, "like_buffer_flushed_total", "counter", "Like changes written by buffer flushes",
+            [({}, like_buffer.flushed_total)])
+
+
+def _ranking_metrics(lines: list[str]) -> None:
+    _metric(lines, "feed_scores_refreshed_total", "counter", "Posts whose hot/top scores were recomputed",
+            [({}, ranking.refreshed_total)])
+    _metric(lines, "posts_purged_total", "counter", "Soft-deleted posts removed by the background purge",
+            [({}, purge.purged_total["posts"])])
+    _metric(lines, "post_purge_rows_total", "counter", "Likes and comments deleted in purge chunks",
+            [({}, purge.purged_total["rows"])])
+
+
+def _event_metrics(lines: list[str]) -> None:
+    _metric(lines, "events_subscribers", "gauge", "Open SSE/WebSocket subscriptions", [({}, events.subscribers())])
+    _metric(lines, "events_published_total", "counter", "Events fanned out to at least one subscriber",
+            [({}, events.published_total)])
+    _metric(lines, "events_dropped_total", "counter", "Events dropped from full subscriber queues",
+            [({}, events.dropped_total)])
+    _metric(lines, "events_slow_consumers_total", "counter", "Subscribers disconnected for falling behind",
+            [({}, events.disconnected_total)])
+
+
+def _request_metrics(lines: list[str]) -> None:
+    routes = dict(instrumentation.ROUTES)
+    if not routes:
+        return
+    lines.append("# HELP http_request_duration_seconds Request latency per route")
+    lines.append("# TYPE http_request_duration_seconds histogram")
+    for label, r in routes.items():
+        cumulative = 0
+        for bound, n in zip(instrumentation.LATENCY_BUCKETS, r.buckets):
+            cumulative += n
+            lines.append(f'http_request_duration_seconds_bucket{{route="{label}",le="{bound}"}} {cumulative}')
+        lines.append(f'http_request_duration_seconds_bucket{{route="{label}",le="+Inf"}} {r.requests}')
+        lines.append(f'http_request_duration_seconds_sum{{route="{label}"}} {round(r.seconds_total, 6)}')
+        lines.append(f'http_request_duration_seconds_count{{route="{label}"}} {r.requests}')
+
+    def per_route(fn):
+        return [({"route": label}, fn(r)) for label, r in routes.items()]
+
+    _metric(lines, "http_db_statements_total", "counter", "SQL statements executed while serving the route",
+            per_route(lambda r: r.statements_total))
+    _metric(lines, "http_db_seconds_total", "counter", "Time spent in SQL while serving the route",
+            per_route(lambda r: round(r.db_seconds_total, 6)))
+    _metric(lines, "http_query_budget_exceeded_total", "counter", "Requests that ran more SQL than the route's budget",
+            per_route(lambda r: r.over_budget))
+
+
+def render() -> str:
+    lines: list[str] = []
+    _pool_metrics(lines)
+    _replica_metrics(lines)
+    _cache_metrics(lines)
+    _like_buffer_metrics(lines)
+    _ranking_metrics(lines)
+    _event_metrics(lines)
+    _request_metrics(lines)
+    return "\n".join(lines) + "\n"
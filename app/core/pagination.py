@@ -0,0 +1,49 @@
+# app/core/pagination.py
+# 목적: 키셋(커서) 페이지네이션용 불투명 커서 인코딩/디코딩
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException, status
+
+# 다음 페이지 커서를 실어 보내는 응답 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode(key, row_id: int) -> str:
+    raw = json.dumps([key, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str, parse_key):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return parse_key(key), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """(created_at, PK) → URL-safe 문자열"""
+    return _encode(created_at.isoformat(), row_id)
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """encode_cursor의 역변환. 형식이 틀리면 400"""
+    return _decode(cursor, datetime.fromisoformat)
+
+
+def encode_score_cursor(score: float, row_id: int) -> str:
+    """(점수, PK) → URL-safe 문자열 (sort=hot|top). float은 JSON에서 정확히 왕복"""
+    return _encode(score, row_id)
+
+
+def decode_score_cursor(cursor: str) -> tuple[float, int]:
+    return _decode(cursor, _parse_score)
+
+
+def _parse_score(value) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError("score must be a number")
+    return float(value)
@@ -0,0 +1,65 @@
+# app/core/periodic.py
+# 목적: 워커별 백그라운드 주기 작업 (좋아요 버퍼 반영, 인기 점수 갱신, 복제본 상태 검사, 삭제 글 정리)
+# - interval초마다(또는 wake()로 바로) 작업 실행. 예외는 기록하고 다음 주기에 다시 시도
+# - 간격/사용 여부는 매번 설정에서 읽음 (enabled()가 거짓이면 시작하지 않음)
+# - 시작/정지는 앱 lifespan(app.main)이 — 실행 중인 이벤트 루프 안에서
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    def __init__(self, name: str, fn: Callable[[], Awaitable[object]], interval: Callable[[], float],
+                 enabled: Callable[[], bool] = lambda: True, run_first: bool = False):
+        """run_first면 시작하자마자 한 번 실행, 아니면 한 주기를 기다린 뒤부터"""
+        self.name = name
+        self.fn = fn
+        self.interval = interval
+        self.enabled = enabled
+        self.run_first = run_first
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        if self._task is None and self.enabled():
+            self._wake = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run(), name=self.name)
+
+    def wake(self) -> None:
+        """다음 주기를 기다리지 않고 바로 실행 (실행 중이 아니면 무시)"""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def stop(self) -> None:
+        """작업 취소 — 실행 중이던 작업은 취소 지점에서 멈춤"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._wake = None
+
+    async def _run(self) -> None:
+        if not self.run_first:
+            await self._sleep()
+        while True:
+            try:
+                await self.fn()
+            except Exception:
+                logger.exception("%s failed", self.name)
+            await self._sleep()
+
+    async def _sleep(self) -> None:
+        try:
+            await asyncio.wait_for(self._wake.wait(), self.interval())
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
@@ -0,0 +1,84 @@
+# app/core/purge.py
+# 목적: 자식 행(좋아요/댓글)이 많은 글 삭제 — 소프트 삭제 후 백그라운드에서 조금씩 정리
+# - 보통 글: DELETE FROM posts 한 문장 — 자식은 DB의 ON DELETE CASCADE가 같은 문장 안에서 지움
+#   (ORM 관계는 passive_deletes라 자식을 메모리로 읽지 않음)
+# - 좋아요+댓글 수가 POST_PURGE_THRESHOLD 이상: posts.deleted_at만 찍고 바로 응답 (모든 조회/쓰기에서 빠짐)
+#   → purge()가 likes/comments를 POST_PURGE_CHUNK_ROWS행씩 지우고 청크마다 커밋 후 POST_PURGE_PAUSE_MS 쉼
+#   (쓰기 잠금을 짧게 나눠 잡아 다른 쓰기가 사이사이 진행), 자식이 다 지워지면 글 행 삭제
+# 정리는 워커마다 POST_PURGE_SECONDS 주기(소프트 삭제 직후에는 바로)로 돌고, 겹쳐도 같은 행을 지울 뿐이라 안전
+# 도중에 재시작해도 deleted_at이 남아 있어 이어서 정리 (python -m app.cli purge-posts로 수동 실행)
+import asyncio
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.periodic import PeriodicTask
+from app.database import AsyncSessionLocal
+from app.models.comment import Comment
+from app.models.like import Like
+from app.models.post import KEEP_UPDATED_AT, Post
+
+# 조회/쓰기 조건: 살아 있는 글 / 정리 대기 글 ID (ix_posts_deleted 부분 인덱스 — 대기 글 수만큼만 읽음)
+ALIVE = Post.deleted_at.is_(None)
+PURGING = select(Post.post_id).where(Post.deleted_at.is_not(None)).scalar_subquery()
+
+purged_total = {"posts": 0, "rows": 0}  # 정리한 글 수 / 자식 행 수 (/metrics)
+_CHILDREN = ((Like.__table__, Like.like_id), (Comment.__table__, Comment.comment_id))
+
+
+def should_defer(post: Post) -> bool:
+    """바로 지우기에는 자식 행이 많은 글인지"""
+    threshold = settings.POST_PURGE_THRESHOLD
+    return threshold > 0 and post.likes_count + post.comments_count >= threshold
+
+
+async def soft_delete(db: AsyncSession, post: Post) -> None:
+    """deleted_at 표시 후 커밋 — 자식 행은 백그라운드 정리가 지움"""
+    await db.execute(
+        update(Post)
+          .where(Post.post_id == post.post_id)
+          .values(deleted_at=func.now(), **KEEP_UPDATED_AT)
+          .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    purger.wake()
+
+
+async def _purge_post(db: AsyncSession, post_id: int) -> int:
+    """글 하나의 자식 행을 청크 단위로 지운 뒤 글 행 삭제. 지운 자식 행 수"""
+    chunk = settings.POST_PURGE_CHUNK_ROWS
+    total = 0
+    for table, pk in _CHILDREN:
+        while True:
+            ids = select(pk).where(table.c.post_id == post_id).limit(chunk).scalar_subquery()
+            n = (await db.execute(delete(table).where(pk.in_(ids)))).rowcount
+            await db.commit()
+            total += n
+            if n < chunk:
+                break
+            await asyncio.sleep(settings.POST_PURGE_PAUSE_MS / 1000)  # 잠금을 기다리던 다른 쓰기 먼저
+    # 남은 자식(그사이 끼어든 행)은 CASCADE로
+    await db.execute(delete(Post).where(Post.post_id == post_id, Post.deleted_at.is_not(None)))
+    await db.commit()
+    return total
+
+
+async def purge() -> int:
+    """소프트 삭제된 글을 모두 정리. 지운 글 수 반환"""
+    async with AsyncSessionLocal() as db:
+        post_ids = list(await db.scalars(select(Post.post_id).where(Post.deleted_at.is_not(None))))
+        await db.commit()
+        for post_id in post_ids:
+            purged_total["rows"] += await _purge_post(db, post_id)
+            purged_total["posts"] += 1
+    return len(post_ids)
+
+
+# 워커마다 POST_PURGE_SECONDS 주기 (0이면 끔), 소프트 삭제 직후에는 바로
+# 재시작 전에 남은 대기 글도 첫 주기에 정리. 정리 중에 멈춰도 지운 청크는 이미 커밋됐고 나머지는 다음 기동 때 이어서
+purger = PeriodicTask(
+    "post purge", purge,
+    interval=lambda: settings.POST_PURGE_SECONDS,
+    enabled=lambda: settings.POST_PURGE_SECONDS > 0,
+)
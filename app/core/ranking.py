@@ -0,0 +1,90 @@
+# app/core/ranking.py
+# 목적: 인기 피드(sort=hot|top) 점수를 미리 계산해 posts.hot_score/top_score에 저장
+# - top: 참여도 = 좋아요 + COMMENT_WEIGHT × 댓글
+# - hot: log10(1 + 참여도) + (작성 시각 - HOT_EPOCH) / HOT_SCORE_DECAY_SECONDS
+#   "모든 글의 참여도가 시간에 따라 같은 비율로 감쇠"하는 것과 순서가 같지만 값이 현재 시각에 의존하지 않으므로
+#   좋아요/댓글이 바뀐 글만 다시 계산하면 됨 (시간이 지났다고 전체를 재계산할 필요 없음)
+# - 좋아요/댓글 카운터를 바꾸는 UPDATE가 score_dirty=true로 표시 → refresh()가 부분 인덱스로 그 글만 골라 갱신
+# 갱신은 워커마다 HOT_REFRESH_SECONDS 주기로 돌지만, 카운터가 읽은 값과 같을 때만 표시를 지우므로 겹쳐도 안전
+import math
+from datetime import datetime, timezone
+
+from sqlalchemy import bindparam, select, true, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.periodic import PeriodicTask
+from app.database import AsyncSessionLocal
+from app.models.post import KEEP_UPDATED_AT, Post
+
+COMMENT_WEIGHT = 2  # 댓글 하나 = 좋아요 2개
+HOT_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+CHUNK = 1_000  # 한 번에 다시 계산하는 글 수
+
+SORT_COLUMNS = {"hot": Post.hot_score, "top": Post.top_score}
+
+refreshed_total = 0  # 다시 계산한 글 수 (/metrics)
+
+_posts = Post.__table__
+_apply = (
+    update(_posts)
+    .where(
+        _posts.c.post_id == bindparam("b_post_id"),
+        # 읽은 뒤 카운터가 또 바뀌었으면 표시를 남겨 다음 주기에 다시 계산
+        _posts.c.likes_count == bindparam("b_likes"),
+        _posts.c.comments_count == bindparam("b_comments"),
+    )
+    .values(hot_score=bindparam("b_hot"), top_score=bindparam("b_top"), score_dirty=False, **KEEP_UPDATED_AT)
+)
+
+
+def scores(likes_count: int, comments_count: int, created_at: datetime | None) -> tuple[float, float]:
+    """(hot_score, top_score)"""
+    engagement = likes_count + COMMENT_WEIGHT * comments_count
+    if created_at is None:
+        created_at = datetime.now(timezone.utc)
+    elif created_at.tzinfo is None:  # SQLite는 UTC 시각을 naive로 돌려줌
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    age = (created_at - HOT_EPOCH).total_seconds() / settings.HOT_SCORE_DECAY_SECONDS
+    return math.log10(1 + engagement) + age, float(engagement)
+
+
+async def _refresh_chunk(db: AsyncSession) -> int:
+    rows = (await db.execute(
+        select(Post.post_id, Post.likes_count, Post.comments_count, Post.created_at)
+        .where(Post.score_dirty == true())
+        .order_by(Post.post_id)
+        .limit(CHUNK)
+    )).all()
+    if not rows:
+        return 0
+    params = []
+    for post_id, likes_count, comments_count, created_at in rows:
+        hot, top = scores(likes_count, comments_count, created_at)
+        params.append({"b_post_id": post_id, "b_likes": likes_count, "b_comments": comments_count,
+                       "b_hot": hot, "b_top": top})
+    await db.execute(_apply, params)
+    await db.commit()
+    return len(rows)
+
+
+async def refresh() -> int:
+    """score_dirty인 글의 점수를 다시 계산. 처리한 글 수 반환"""
+    global refreshed_total
+    total = 0
+    async with AsyncSessionLocal() as db:
+        while True:
+            n = await _refresh_chunk(db)
+            total += n
+            if n < CHUNK:
+                break
+    refreshed_total += total
+    return total
+
+
+# 워커마다 HOT_REFRESH_SECONDS 주기 (0이면 끔)
+refresher = PeriodicTask(
+    "feed score refresh", refresh,
+    interval=lambda: settings.HOT_REFRESH_SECONDS,
+    enabled=lambda: settings.HOT_REFRESH_SECONDS > 0,
+)
@@ -0,0 +1,109 @@
+# app/core/replicas.py
+# 목적: 읽기 복제본 선택 — 라운드로빈 + 주기적 상태 검사 + 쓰기 직후 읽기 고정(read-your-writes)
+# - choose(): 정상 복제본을 돌아가며 하나. 없거나(미설정/모두 비정상) 쓰기 직후의 사용자면 None → primary
+# - 상태 검사: REPLICA_HEALTH_CHECK_SECONDS마다 복제본의 마이그레이션 버전(alembic_version)을 읽어
+#   primary와 같을 때만 정상 — 연결 실패/시간 초과/스키마가 뒤처진 복제본(새 컬럼 조회가 실패할)은 제외
+# - read-your-writes: 쓰기 요청을 한 사용자는 READ_YOUR_WRITES_SECONDS 동안 primary에서 읽음
+#   (복제 지연으로 방금 쓴 글/댓글이 안 보이는 일 방지). CACHE_URL이 있으면 워커 간 공유
+# 복제 자체(primary → 복제본)는 DB가 담당. 로컬 SQLite 파일로 시험할 때는 `python -m app.cli sync-replicas`
+import asyncio
+import itertools
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.cache import make_backend
+from app.core.config import settings
+from app.core.periodic import PeriodicTask
+from app.database import async_engine, replica_engines
+
+logger = logging.getLogger(__name__)
+
+_VERSION = text("SELECT version_num FROM alembic_version")
+
+healthy = [True] * len(replica_engines)  # 첫 검사 전에는 정상으로 간주
+routed_total = {"replica": 0, "primary_sticky": 0, "primary_unavailable": 0}  # 읽기 세션 라우팅 (/metrics)
+
+_rr = itertools.count()
+_recent_writers = make_backend(
+    settings.CACHE_URL,
+    maxsize=settings.USER_CACHE_MAXSIZE,
+    ttl=settings.READ_YOUR_WRITES_SECONDS,
+    prefix="ryw:",
+    name="read_your_writes",
+)
+
+
+def enabled() -> bool:
+    return bool(replica_engines)
+
+
+def _sticky_enabled() -> bool:
+    return enabled() and settings.READ_YOUR_WRITES_SECONDS > 0
+
+
+def pick() -> AsyncEngine | None:
+    """라운드로빈으로 정상 복제본 하나 (없으면 None)"""
+    n = len(replica_engines)
+    for _ in range(n):
+        i = next(_rr) % n
+        if healthy[i]:
+            return replica_engines[i]
+    return None
+
+
+async def mark_write(user_id: str) -> None:
+    """쓰기 요청 — 이 사용자의 읽기를 잠시 primary로"""
+    if _sticky_enabled():
+        await _recent_writers.set(user_id, b"1")
+
+
+async def choose(user_id: str | None) -> AsyncEngine | None:
+    """이 요청의 읽기 대상 (None이면 primary)"""
+    if not enabled():
+        return None
+    if user_id and _sticky_enabled() and await _recent_writers.get(user_id) is not None:
+        routed_total["primary_sticky"] += 1
+        return None
+    replica = pick()
+    routed_total["replica" if replica is not None else "primary_unavailable"] += 1
+    return replica
+
+
+# ------------------------------
+# 상태 검사
+# ------------------------------
+async def _version(engine: AsyncEngine) -> str | None:
+    async with engine.connect() as conn:
+        return await conn.scalar(_VERSION)
+
+
+async def check() -> list[bool]:
+    """복제본 상태 갱신 후 반환. primary를 읽지 못하면 예외 (상태는 그대로)"""
+    timeout = settings.REPLICA_HEALTH_TIMEOUT_SECONDS
+    expected = await asyncio.wait_for(_version(async_engine), timeout)
+    for i, engine in enumerate(replica_engines):
+        try:
+            ok = await asyncio.wait_for(_version(engine), timeout) == expected
+        except Exception:  # 연결 실패, 시간 초과, 스키마 없음
+            ok = False
+        if ok != healthy[i]:
+            logger.warning("read replica %d is now %s", i, "healthy" if ok else "unhealthy")
+        healthy[i] = ok
+    return list(healthy)
+
+
+# REPLICA_HEALTH_CHECK_SECONDS 주기 (0이면 끔) — 첫 검사는 바로
+checker = PeriodicTask(
+    "read replica health check", check,
+    interval=lambda: settings.REPLICA_HEALTH_CHECK_SECONDS,
+    enabled=lambda: enabled() and settings.REPLICA_HEALTH_CHECK_SECONDS > 0,
+    run_first=True,
+)
+
+
+async def dispose() -> None:
+    """앱 종료 시 복제본 풀 정리"""
+    for engine in replica_engines:
+        await engine.dispose()
@@ -0,0 +1,87 @@
+# app/core/response_cache.py
+# 목적: 익명 GET 응답(직렬화된 bytes + 헤더)을 캐시해 쿼리/직렬화를 건너뜀
+# - 백엔드는 app.core.cache의 LocalBackend / RedisBackend (CACHE_URL)
+# - 무효화는 세대(generation) 방식: 쓰기가 세대를 바꾸면 이전 세대 키는 더 이상 조회되지 않고 TTL/LRU로 사라짐
+#   (목록 페이지는 글 추가/삭제로 순서가 밀리므로 글 단위로 골라 지우기보다 전체를 넘기는 편이 정확함)
+# - 같은 키를 동시에 놓친 요청들은 하나만 다시 계산하고 나머지는 그 결과를 기다림 (프로세스 내 single-flight)
+import asyncio
+import json
+import uuid
+from typing import Awaitable, Callable
+
+from app.core.cache import CACHES, make_backend
+from app.core.config import settings
+
+_GENERATION_KEY = "gen"
+
+
+class ResponseCache:
+    def __init__(self, backend, ttl: float, name: str | None = None):
+        self.backend = backend
+        self.ttl = ttl
+        # 세대 키 조회는 빼고 응답 항목 기준으로 셈 (재계산 횟수 = misses)
+        self.hits = 0
+        self.misses = 0
+        self._locks: dict[str, asyncio.Lock] = {}
+        if name:
+            CACHES[name] = self
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    async def _generation(self) -> str:
+        value = await self.backend.get(_GENERATION_KEY)
+        return value.decode() if value is not None else "0"
+
+    async def invalidate(self) -> None:
+        """이 캐시의 모든 항목 무효화 (쓰기 커밋 직후 호출)"""
+        # 세대 키는 항목보다 오래 살아야 만료 후 옛 세대로 되돌아가지 않음
+        await self.backend.set(_GENERATION_KEY, uuid.uuid4().hex[:12].encode(), ttl=max(self.ttl * 100, 86_400))
+
+    async def get_or_build(
+        self, parts: tuple, build: Callable[[], Awaitable[tuple[dict[str, str], bytes]]]
+    ) -> tuple[dict[str, str], bytes]:
+        key = f"{await self._generation()}:{json.dumps(parts, default=str)}"
+        cached = await self.backend.get(key)
+        if cached is not None:
+            self.hits += 1
+            return _unpack(cached)
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # 기다리는 동안 앞선 요청이 채웠으면 그것을 사용
+                cached = await self.backend.get(key)
+                if cached is not None:
+                    self.hits += 1
+                    return _unpack(cached)
+                self.misses += 1
+                headers, body = await build()
+                await self.backend.set(key, _pack(headers, body), ttl=self.ttl)
+                return headers, body
+        finally:
+            if not lock.locked():
+                self._locks.pop(key, None)
+
+
+def _pack(headers: dict[str, str], body: bytes) -> bytes:
+    return json.dumps(headers).encode() + b"\n" + body
+
+
+def _unpack(value: bytes) -> tuple[dict[str, str], bytes]:
+    head, _, body = value.partition(b"\n")
+    return json.loads(head), body
+
+
+# 익명 게시글 목록 페이지
+post_pages = ResponseCache(
+    make_backend(
+        settings.CACHE_URL,
+        maxsize=settings.RESPONSE_CACHE_MAXSIZE,
+        ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+        prefix="resp:posts:",
+    ),
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+    name="post_pages",
+)
@@ -0,0 +1,217 @@
+# app/core/search.py
+# 목적: 게시글 전문 검색 인덱스 (SQLite FTS5 / Postgres tsvector)
+# - SQLite: posts를 외부 콘텐츠로 쓰는 FTS5(trigram) 가상 테이블 + 트리거로 동기화
+#   trigram은 기존 LIKE '%q%'와 같은 부분 문자열 매칭이라 조사 붙은 한글 검색도 그대로 동작
+# - Postgres: posts.search_vector 생성 컬럼 + GIN 인덱스
+# - 인덱스를 못 쓰는 경우(3글자 미만 검색어, FTS5 미지원 빌드, SEARCH_BACKEND=like)는 LIKE로 폴백
+import html
+
+from sqlalchemy import column, func, literal_column, select, table, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.database import async_engine, engine as sync_engine
+from app.models.post import Post
+
+FTS_TABLE = "posts_fts"
+HIGHLIGHT_OPEN, HIGHLIGHT_CLOSE = "<mark>", "</mark>"
+# DB가 발췌문에 넣는 일치 구간 표시 — 사용자 글을 HTML 이스케이프한 뒤 이 표시만 <mark>로 바꿈
+# (발췌문은 글 본문 그대로라 태그를 섞어 보내면 HTML로 그리는 클라이언트에서 XSS)
+# 사설 영역 문자라 보통 글에는 없고, 있더라도 결과에 생기는 것은 <mark> 태그뿐
+_MATCH_OPEN, _MATCH_CLOSE = "\ue000", "\ue001"
+SNIPPET_TOKENS = 64
+TRIGRAM_MIN_LEN = 3
+
+_SQLITE_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, content, content='posts', content_rowid='post_id', tokenize='trigram'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.post_id, new.title, new.content);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content) VALUES ('delete', old.post_id, old.title, old.content);
+    END""",
+    # 좋아요 수 등 다른 컬럼 갱신에는 반응하지 않도록 title/content만 감시
+    f"""CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE OF title, content ON posts BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content) VALUES ('delete', old.post_id, old.title, old.content);
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.post_id, new.title, new.content);
+    END""",
+]
+
+_POSTGRES_DDL = [
+    """ALTER TABLE posts ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(content, ''))) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_posts_search_vector ON posts USING GIN (search_vector)",
+]
+
+_POSTGRES_DROP = [
+    "DROP INDEX IF EXISTS ix_posts_search_vector",
+    "ALTER TABLE posts DROP COLUMN IF EXISTS search_vector",
+]
+
+# 사용할 백엔드 ("sqlite" | "postgresql" | None=LIKE만). 스키마는 마이그레이션(0002)이 만들고
+# 워커는 앱 시작(lifespan) 때 인덱스가 있는지만 한 번 확인 (DDL 없음) — 요청 경로에서 스키마 조회를 하지 않음
+_UNKNOWN = object()
+_backend = _UNKNOWN
+
+_fts = table(FTS_TABLE, column("rowid"))
+
+
+def _fts_exists(conn: Connection) -> bool:
+    return conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": FTS_TABLE}
+    ).first() is not None
+
+
+def ddl(dialect: str) -> list[str]:
+    """검색 인덱스 생성 DDL (마이그레이션 SQL 출력용 — 존재 확인/폴백 없이 그대로)"""
+    if dialect == "sqlite":
+        return [*_SQLITE_DDL, f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"]
+    if dialect == "postgresql":
+        return list(_POSTGRES_DDL)
+    return []
+
+
+def create_index(conn: Connection) -> str | None:
+    """검색 인덱스를 (없으면) 만듦. 새로 만든 SQLite 인덱스는 기존 글로 채움. 만든 백엔드 반환"""
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        existed = _fts_exists(conn)
+        try:
+            for ddl in _SQLITE_DDL:
+                conn.execute(text(ddl))
+        except OperationalError:
+            # FTS5/trigram 미지원 SQLite 빌드
+            return None
+        if not existed:
+            _rebuild(conn)
+        return dialect
+    if dialect == "postgresql":
+        for ddl in _POSTGRES_DDL:
+            conn.execute(text(ddl))
+        return dialect
+    return None
+
+
+def drop_index(conn: Connection) -> None:
+    if conn.dialect.name == "sqlite":
+        for name in ("posts_fts_ai", "posts_fts_ad", "posts_fts_au"):
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+        conn.execute(text(f"DROP TABLE IF EXISTS {FTS_TABLE}"))
+    elif conn.dialect.name == "postgresql":
+        for ddl in _POSTGRES_DROP:
+            conn.execute(text(ddl))
+
+
+def detect(conn: Connection) -> str | None:
+    """이미 만들어진 검색 인덱스의 백엔드 (없으면 None)"""
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        return dialect if _fts_exists(conn) else None
+    if dialect == "postgresql":
+        found = conn.execute(text(
+            "SELECT 1 FROM information_schema.columns WHERE table_name = 'posts' AND column_name = 'search_vector'"
+        )).first()
+        return dialect if found else None
+    return None
+
+
+async def load() -> str | None:
+    """앱 시작 시 백엔드 확인 (비동기 연결 — 이벤트 루프를 막지 않음)"""
+    global _backend
+    async with async_engine.connect() as conn:
+        _backend = await conn.run_sync(detect)
+    return _backend
+
+
+def backend() -> str | None:
+    """확인된 백엔드. lifespan 없이 앱을 쓰는 스크립트에서는 처음 부를 때 동기 연결로 확인"""
+    global _backend
+    if _backend is _UNKNOWN:
+        with sync_engine.connect() as conn:
+            _backend = detect(conn)
+    return _backend
+
+
+def install(engine: Engine) -> str | None:
+    """검색 인덱스를 (없으면) 만들고 사용할 백엔드를 정함"""
+    global _backend
+    with engine.begin() as conn:
+        _backend = create_index(conn)
+    return _backend
+
+
+def _rebuild(conn: Connection) -> None:
+    if conn.dialect.name == "sqlite":
+        conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+    elif conn.dialect.name == "postgresql":
+        conn.execute(text("REINDEX INDEX ix_posts_search_vector"))
+
+
+def rebuild(engine: Engine) -> None:
+    """posts 테이블 기준으로 검색 인덱스 전체 재구축"""
+    with engine.begin() as conn:
+        _rebuild(conn)
+
+
+def _use_index(q: str) -> bool:
+    if settings.SEARCH_BACKEND == "like" or backend() is None:
+        return False
+    return _backend != "sqlite" or len(q) >= TRIGRAM_MIN_LEN
+
+
+def _phrase(q: str) -> str:
+    """검색어 전체를 하나의 FTS5 구문으로 — 사용자 입력의 FTS 문법 문자로 인한 오류 방지"""
+    return '"' + q.replace('"', '""') + '"'
+
+
+def apply(query, q: str):
+    """
+    목록 쿼리(select)에 검색 조건을 붙임.
+    반환: (query, rank) — rank는 작을수록 관련도가 높음. LIKE 폴백이면 rank는 None
+    """
+    if not _use_index(q):
+        return query.filter((Post.title.contains(q)) | (Post.content.contains(q))), None
+
+    if _backend == "sqlite":
+        fts = literal_column(FTS_TABLE)
+        query = (
+            query.join(_fts, _fts.c.rowid == Post.post_id)
+                 .filter(fts.op("MATCH")(_phrase(q)))
+        )
+        return query, func.bm25(fts)
+
+    vector = literal_column("posts.search_vector")
+    tsquery = func.plainto_tsquery("simple", q)
+    return query.filter(vector.op("@@")(tsquery)), -func.ts_rank(vector, tsquery)
+
+
+async def snippets(db: AsyncSession, q: str, post_ids: list[int]) -> dict[int, str]:
+    """
+    페이지에 실린 글들의 하이라이트 발췌문 {post_id: snippet}.
+    snippet()은 비싸서 목록 쿼리에 넣으면 LIMIT 전에 일치하는 모든 행에 대해 계산되므로 따로 조회
+    """
+    if not post_ids or not _use_index(q):
+        return {}
+
+    if _backend == "sqlite":
+        fts = literal_column(FTS_TABLE)
+        rows = await db.execute(
+            select(_fts.c.rowid, func.snippet(fts, -1, _MATCH_OPEN, _MATCH_CLOSE, "…", SNIPPET_TOKENS))
+            .where(fts.op("MATCH")(_phrase(q)), _fts.c.rowid.in_(post_ids))
+        )
+    else:
+        options = f"StartSel={_MATCH_OPEN}, StopSel={_MATCH_CLOSE}, MaxWords={SNIPPET_TOKENS}"
+        rows = await db.execute(
+            select(Post.post_id, func.ts_headline("simple", Post.content, func.plainto_tsquery("simple", q), options))
+            .where(Post.post_id.in_(post_ids))
+        )
+    return {post_id: _highlight(snippet) for post_id, snippet in rows}
+
+
+def _highlight(snippet: str) -> str:
+    escaped = html.escape(snippet)
+    return escaped.replace(_MATCH_OPEN, HIGHLIGHT_OPEN).replace(_MATCH_CLOSE, HIGHLIGHT_CLOSE)
@@ -1,24 +1,23 @@
+import json
+import time
 from datetime import datetime, timedelta
-from fastapi import Depends, HTTPException, status
+from typing import Optional
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
-from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.database import get_db
+from app.core.cache import TTLCache, make_backend
+from app.core.hashing import pwd_context, get_password_hash, verify_password  # noqa: F401
+from app.core import replicas
+from app.database import get_async_db, read_session
 from app.models.user import User
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # Swagger Authorize와 연동
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/users/login")
 oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/users/login", auto_error=False)
-def get_password_hash(raw: str) -> str:
-    return pwd_context.hash(raw)
-
-def verify_password(raw: str, hashed: str) -> bool:
-    return pwd_context.verify(raw, hashed)
 
 def create_access_token(subject: str, expires_minutes: int | None = None) -> str:
     """
@@ -28,12 +27,71 @@ def create_access_token(subject: str, expires_minutes: int | None = None) -> str
     payload = {"sub": subject, "exp": expire}
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
+# 검증이 끝난 토큰 → 클레임 (exp까지만 보관, 만료 후에는 다시 decode해서 만료 오류가 나도록)
+_token_claims = TTLCache(maxsize=settings.TOKEN_CACHE_MAXSIZE, name="token_claims")
+
 def decode_token(token: str) -> dict:
-    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    claims = _token_claims.get(token)
+    if claims is None:
+        claims = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        exp = claims.get("exp")
+        _token_claims.set(token, claims, ttl=exp - time.time() if exp else None)
+    return claims
+
+# ------------------------------
+# 인증 사용자 캐시 (sub → 사용자 공개 정보)
+# 인증 요청마다 users 조회를 반복하지 않도록. 비밀번호 해시는 캐시하지 않음
+# ------------------------------
+_user_cache = make_backend(
+    settings.CACHE_URL,
+    maxsize=settings.USER_CACHE_MAXSIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+    prefix="user:",
+    name="user",
+)
+_CACHED_USER_FIELDS = ("user_id", "username", "email", "created_at")
+
+def _dump_user(user: User) -> bytes:
+    data = {f: getattr(user, f) for f in _CACHED_USER_FIELDS}
+    data["created_at"] = user.created_at.isoformat() if user.created_at else None
+    return json.dumps(data).encode()
+
+def _load_user(raw: bytes) -> User:
+    """세션에 붙지 않은 User 인스턴스 — 읽기 전용 principal로만 사용"""
+    data = json.loads(raw)
+    if data["created_at"]:
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+    return User(**data)
+
+async def _get_user(db: AsyncSession, user_id: str) -> User | None:
+    cached = await _user_cache.get(user_id)
+    if cached is not None:
+        return _load_user(cached)
+    user = await db.get(User, user_id)
+    # 조회로 시작된 읽기 트랜잭션을 끝냄 — SQLite WAL에서 읽던 트랜잭션을 쓰기로 올릴 때 그 사이 다른
+    # 연결(다른 워커)이 커밋했으면 busy_timeout 없이 바로 "database is locked". 핸들러의 쓰기는 새 트랜잭션에서
+    await db.commit()
+    if user:
+        await _user_cache.set(user_id, _dump_user(user))
+    return user
+
+async def invalidate_user(user_id: str) -> None:
+    """사용자 정보가 바뀌거나 삭제되면 호출 — 다음 요청에서 DB를 다시 읽음"""
+    await _user_cache.delete(user_id)
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_change(mapper, connection, target: User) -> None:
+    # ORM으로 사용자를 수정/삭제하면 자동 무효화 (동기 문맥이라 discard 사용)
+    _user_cache.discard(target.user_id)
+
+# 읽기 요청(GET/HEAD)이 아니면 쓰기로 보고 read-your-writes 표시 (app.core.replicas)
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
-def get_current_user(
+async def get_current_user(
+    request: Request,
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> User:
     try:
         payload = decode_token(token)
@@ -43,23 +101,47 @@ def get_current_user(
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
 
-    user = db.query(User).filter(User.user_id == user_id).first()
+    user = await _get_user(db, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    if request.method not in READ_METHODS:
+        await replicas.mark_write(user.user_id)
     return user
 
 
-def get_current_user_optional(
-    db: Session = Depends(get_db),
+async def get_current_user_optional(
+    db: AsyncSession = Depends(get_async_db),
     token: Optional[str] = Depends(oauth2_scheme_optional),
 ) -> Optional[User]:
     if not token:
         return None
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = decode_token(token)
         sub: str | None = payload.get("sub")
         if not sub:
             return None
     except JWTError:
         return None
-    return db.query(User).filter(User.user_id == sub).first()
\ No newline at end of file
+    return await _get_user(db, sub)
+
+
+# ------------------------------
+# 읽기 전용 엔드포인트용 세션: 복제본에서 읽음 (설정이 없으면 primary)
+# 사용자 조회는 하지 않고 토큰의 sub만 봄 — 최근에 쓴 사용자면 primary (read-your-writes)
+# primary로 읽을 때는 요청의 get_async_db 세션(사용자 조회와 같은 세션)을 그대로 씀
+# — 세션을 따로 열면 요청 하나가 primary 연결 2개를 잡아, 동시 요청이 많을 때 풀이 서로를 기다리며 멈춤
+# ------------------------------
+async def get_read_db(token: Optional[str] = Depends(oauth2_scheme_optional),
+                      db: AsyncSession = Depends(get_async_db)):
+    user_id = None
+    if token:
+        try:
+            user_id = decode_token(token).get("sub")
+        except JWTError:
+            pass
+    replica = await replicas.choose(user_id)
+    if replica is None:
+        yield db
+        return
+    async with read_session(replica) as read_db:
+        yield read_db
@@ -0,0 +1,67 @@
+# app/core/serialization.py
+# 목적: 게시글 응답을 한 번만 만들고 pydantic-core로 바로 JSON bytes 직렬화
+# - 기존: 모델 생성(검증) → response_model 재검증 → jsonable_encoder → json.dumps
+# - 여기: model_construct(검증 생략, DB 값은 이미 스키마를 만족) → TypeAdapter.dump_json (Rust)
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.schemas.post import PostWithAuthorStatsOut, PostListItemOut
+from app.schemas.user import UserPublic
+from app.schemas.comment import CommentOut
+
+post_adapter = TypeAdapter(PostWithAuthorStatsOut)
+post_list_adapter = TypeAdapter(list[PostListItemOut])
+
+
+def post_out(post, author, likes_count: int, my_like: bool | None = None,
+             snippet: str | None = None) -> PostWithAuthorStatsOut:
+    return PostWithAuthorStatsOut.model_construct(
+        post_id=post.post_id,
+        title=post.title,
+        content=post.content,
+        author_id=post.author_id,
+        created_at=post.created_at,
+        updated_at=post.updated_at,
+        author=UserPublic.model_construct(user_id=author.user_id, username=author.username),
+        likes_count=likes_count,
+        comments_count=post.comments_count,
+        my_like=my_like,
+        snippet=snippet,
+    )
+
+
+def post_list_item(row, likes_count: int, comments_count: int, my_like: bool | None = None,
+                   snippet: str | None = None, latest_comments: list | None = None) -> PostListItemOut:
+    """목록 컬럼 조회 결과(Row)로 생성 — content 컬럼은 조회했을 때만 채움"""
+    return PostListItemOut.model_construct(
+        post_id=row.post_id,
+        title=row.title,
+        author_id=row.author_id,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        author=UserPublic.model_construct(user_id=row.author_id, username=row.username),
+        likes_count=likes_count,
+        comments_count=comments_count,
+        my_like=my_like,
+        snippet=snippet,
+        content_preview=row.content_preview,
+        content=getattr(row, "content", None),
+        latest_comments=None if latest_comments is None else [comment_out(c) for c in latest_comments],
+    )
+
+
+def comment_out(comment) -> CommentOut:
+    return CommentOut.model_construct(
+        comment_id=comment.comment_id,
+        post_id=comment.post_id,
+        author_id=comment.author_id,
+        content=comment.content,
+        created_at=comment.created_at,
+        updated_at=comment.updated_at,
+    )
+
+
+def json_response(adapter: TypeAdapter, value, status_code: int = 200,
+                  headers: dict[str, str] | None = None) -> Response:
+    return Response(adapter.dump_json(value), status_code=status_code,
+                    media_type="application/json", headers=headers)
@@ -1,18 +1,179 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import time
+
+from sqlalchemy import create_engine, event, exc, DateTime
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.core.config import settings
 
+
+class PoolStats:
+    """풀 체크아웃 통계 (/metrics 노출용)"""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.overflow_events = 0   # pool_size를 넘어 오버플로 연결을 쓴 체크아웃 수
+        self.timeouts = 0          # DB_POOL_TIMEOUT 초과로 실패한 체크아웃 수
+
+
+class MeteredPoolMixin:
+    """체크아웃 대기 시간/오버플로/타임아웃을 PoolStats에 기록"""
+    stats: PoolStats
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        waited = time.perf_counter() - started
+        self.stats.checkouts += 1
+        self.stats.wait_seconds_total += waited
+        self.stats.wait_seconds_max = max(self.stats.wait_seconds_max, waited)
+        if self.checkedout() > self.size():
+            self.stats.overflow_events += 1
+        return conn
+
+    def recreate(self):
+        # dispose() 후 새 풀에도 같은 통계를 이어서 기록
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class MeteredQueuePool(MeteredPoolMixin, QueuePool):
+    pass
+
+
+class MeteredAsyncQueuePool(MeteredPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _pool_options(url: str, poolclass) -> dict:
+    # 인메모리 SQLite는 연결 하나를 공유하는 전용 풀을 써야 하므로 기본 설정 유지
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def _configure(engine: Engine) -> None:
+    """풀 통계 부착 + SQLite PRAGMA (연결마다 적용)"""
+    engine.pool.stats = PoolStats()
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if settings.SQLITE_WAL:
+            # 읽기가 쓰기 잠금에 막히지 않도록 WAL — DB 파일에 영구 적용됨
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        # SQLite는 FK(ON DELETE CASCADE 포함)를 연결마다 켜야 적용됨 — 기본은 꺼져 있어 자식 행이 고아로 남음
+        cursor.execute(f"PRAGMA foreign_keys={'ON' if settings.SQLITE_FOREIGN_KEYS else 'OFF'}")
+        cursor.close()
+
+
 # SQLite는 스레드 옵션 필요
 connect_args = {"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {}
 
-engine = create_engine(settings.DATABASE_URL, connect_args=connect_args)
+# 동기 엔진: 스키마 생성, 관리 명령(app.cli) 등 요청 밖 작업용
+engine = create_engine(
+    settings.DATABASE_URL, connect_args=connect_args,
+    **_pool_options(settings.DATABASE_URL, MeteredQueuePool),
+)
+_configure(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
-# FastAPI 의존성용 세션
+# 비동기 드라이버 매핑 (DATABASE_URL에 드라이버를 직접 지정했다면 그대로 사용)
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def to_async_url(url: str) -> str:
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.drivername)
+    return parsed.set(drivername=driver).render_as_string(hide_password=False) if driver else url
+
+
+# 비동기 엔진: 라우터(요청 처리)용
+# expire_on_commit=False — 커밋 후 속성 접근이 암묵적 I/O(비동기에서는 불가)를 일으키지 않도록
+async_engine = create_async_engine(
+    to_async_url(settings.DATABASE_URL),
+    **_pool_options(settings.DATABASE_URL, MeteredAsyncQueuePool),
+)
+_configure(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+# 읽기 복제본 (DATABASE_REPLICA_URLS) — 읽기 전용 엔드포인트만 사용, 어느 복제본을 쓸지는 app.core.replicas가 결정
+REPLICA_URLS = [url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+replica_engines = [
+    create_async_engine(to_async_url(url), **_pool_options(url, MeteredAsyncQueuePool))
+    for url in REPLICA_URLS
+]
+for _replica in replica_engines:
+    _configure(_replica.sync_engine)
+
+
+class RoutingSession(Session):
+    """info["replica"]로 지정한 복제본에서 읽고, 쓰기(flush, INSERT/UPDATE/DELETE 문)는 항상 primary로
+    복제본이 없거나(None) 쓰기 중이면 기본 bind(primary)"""
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        replica = self.info.get("replica")
+        if replica is None or self._flushing or isinstance(clause, UpdateBase):
+            return super().get_bind(mapper, clause=clause, **kw)
+        return replica.sync_engine
+
+
+ReadSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False,
+                                      sync_session_class=RoutingSession)
+
+# 풀 이름 → 엔진 (/metrics 노출용)
+POOLS = {
+    "sync": engine,
+    "async": async_engine.sync_engine,
+    **{f"replica{i}": eng.sync_engine for i, eng in enumerate(replica_engines)},
+}
+
+# 생성/수정 시각 컬럼 타입
+# SQLite의 CURRENT_TIMESTAMP는 'YYYY-MM-DD HH:MM:SS'(초 단위) 문자열로 저장되므로
+# 바인딩 값도 같은 포맷으로 맞춰야 키셋 커서 비교(=, <, >)가 문자열 기준으로 어긋나지 않는다
+Timestamp = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(
+        storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+    ),
+    "sqlite",
+)
+
+# FastAPI 의존성용 세션 (동기)
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+# FastAPI 의존성용 세션 (비동기)
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# 읽기 전용 세션 (replica=None이면 primary) — 의존성은 사용자별 라우팅이 필요해 app.core.security.get_read_db
+def read_session(replica=None):
+    return ReadSessionLocal(info={"replica": replica})
@@ -1,21 +1,51 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from app.database import Base, engine
+from app.database import async_engine
 from app.routers import user, post
 from app.core.config import settings
-from app.models import user as user_model
-from app.models import post as post_model
+from app.core import hashing, like_buffer, ranking, replicas, purge, search, instrumentation
 from app.routers import comment as comment_router
-from app.models import comment as comment_model
-from app.models import like as like_model
-app = FastAPI(title=settings.PROJECT_NAME)
+from app.routers import metrics as metrics_router
+from app.routers import events as events_router
+from app.routers import bulk as bulk_router
+
+
+# 워커별 백그라운드 주기 작업 — 시작 순서대로 켜고 반대 순서로 끔
+PERIODIC_TASKS = (like_buffer.flusher, ranking.refresher, replicas.checker, purge.purger)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await search.load()  # 검색 백엔드 확인 — 첫 검색 요청에서 스키마를 조회하지 않도록
+    for task in PERIODIC_TASKS:
+        task.start()
+    yield
+    # 종료 시 주기 작업 중단 → 버퍼에 남은 좋아요 반영 → 복제본/비동기 풀 연결, 해시 워커 프로세스 정리
+    for task in reversed(PERIODIC_TASKS):
+        await task.stop()
+    await like_buffer.drain()
+    await replicas.dispose()
+    await async_engine.dispose()
+    hashing.shutdown()
+
+
+app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
+
+# 요청 계측: 라우트별 지연/SQL 문 수 (/metrics), Server-Timing 헤더
+app.add_middleware(instrumentation.RequestMetricsMiddleware)
+instrumentation.install()
 
-# 추후 모델 추가 시 자동 생성
-Base.metadata.create_all(bind=engine)
+# 스키마는 마이그레이션으로 관리 (python -m app.cli migrate) — 워커는 기동 시 DB를 건드리지 않음
+# 모델은 라우터가 필요한 것만 import (app.models 패키지가 관계 대상까지 함께 등록)
 
 # 라우터 등록
 app.include_router(user.router, prefix="/users", tags=["Users"])
 app.include_router(post.router, prefix="/posts", tags=["Posts"])
 app.include_router(comment_router.router, prefix="/comments", tags=["Comments"])
+app.include_router(metrics_router.router, prefix="/metrics", tags=["Metrics"])
+app.include_router(events_router.router, prefix="/events", tags=["Events"])
+app.include_router(bulk_router.router, prefix="/bulk", tags=["Bulk"])
 @app.get("/")
-def root():
+async def root():
     return {"message": "Welcome to FastAPI Board API"}
@@ -1,2 +1,4 @@
 from .user import User  # noqa
-from .post import Post  # noqa
\ No newline at end of file
+from .post import Post  # noqa
+from .comment import Comment  # noqa
+from .like import Like  # noqa
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, func, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Text, func, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, Timestamp
 
 class Comment(Base):
     __tablename__ = "comments"
@@ -10,8 +10,8 @@ class Comment(Base):
     author_id  = Column(String(30), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False, index=True)
     content    = Column(Text, nullable=False)
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(Timestamp, server_default=func.now())
+    updated_at = Column(Timestamp, onupdate=func.now())
 
     # 관계
     author = relationship("User", back_populates="comments")
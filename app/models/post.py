@@ -1,9 +1,9 @@
 # app/models/post.py
 # 목적: 게시글 테이블 정의 + 작성자(User)와의 관계 설정
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, func, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Text, Float, Boolean, func, ForeignKey, Index, true
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, Timestamp
 
 class Post(Base):
     __tablename__ = "posts"
@@ -18,15 +18,45 @@ class Post(Base):
     # 작성자(FK) — User.user_id를 참조(문자열 PK)
     author_id = Column(String(30), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False, index=True)
 
+    # 좋아요 수 (likes 테이블 집계를 매 요청마다 하지 않도록 비정규화, toggle_like에서 갱신)
+    likes_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # 댓글 수 (같은 이유로 비정규화, 댓글 생성/삭제 시 같은 트랜잭션에서 갱신)
+    comments_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # 인기 피드 점수 (app.core.ranking이 미리 계산). 좋아요/댓글 수가 바뀌면 score_dirty로 표시 → 다음 갱신 때 재계산
+    hot_score = Column(Float, nullable=False, default=0, server_default="0")
+    top_score = Column(Float, nullable=False, default=0, server_default="0")
+    score_dirty = Column(Boolean, nullable=False, default=True, server_default=true())
+
+    # 제목/본문 수정 횟수 — ETag 검증자. updated_at은 초 단위(SQLite)라 같은 초의 두 수정을 구분 못 함
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+
     # 생성/수정 시각
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(Timestamp, server_default=func.now())
+    updated_at = Column(Timestamp, onupdate=func.now())
+    # 소프트 삭제 시각 — 자식 행이 많은 글은 이것만 찍고 모든 조회에서 뺀 뒤 나중에 정리 (app.core.purge)
+    deleted_at = Column(Timestamp)
 
     # ORM 관계: Post.author ↔ User.posts
+    # passive_deletes: 글을 지울 때 자식 행을 메모리로 읽어 한 건씩 지우지 않고 DB의 ON DELETE CASCADE에 맡김
     author = relationship("User", back_populates="posts")
-    comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan")
-    likes = relationship("Like", back_populates="post", cascade="all, delete-orphan")
+    comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan", passive_deletes=True)
+    likes = relationship("Like", back_populates="post", cascade="all, delete-orphan", passive_deletes=True)
 
     __table_args__ = (
         Index("ix_posts_author_created", "author_id", "created_at"),
+        Index("ix_posts_created", "created_at", "post_id"),  # 목록 키셋 페이지네이션
+        Index("ix_posts_hot", "hot_score", "post_id"),        # sort=hot 키셋 페이지네이션
+        Index("ix_posts_top", "top_score", "post_id"),        # sort=top
+        # 재계산 대상만 담는 부분 인덱스 — 갱신 비용이 테이블 크기가 아니라 최근 활동량에 비례
+        Index("ix_posts_score_dirty", "post_id",
+              sqlite_where=score_dirty == true(), postgresql_where=score_dirty == true()),
+        # 정리 대기 글만 담는 부분 인덱스 (조회 필터와 정리 작업이 씀)
+        Index("ix_posts_deleted", "post_id",
+              sqlite_where=deleted_at.isnot(None), postgresql_where=deleted_at.isnot(None)),
     )
+
+
+# 글 내용이 아닌 값(카운터, 인기 점수, 삭제 표시)만 바꾸는 UPDATE에 섞어 쓰는 값
+# updated_at을 자기 자신으로 지정해 onupdate(func.now())로 "수정됨" 표시가 찍히지 않게 함
+KEEP_UPDATED_AT = {"updated_at": Post.updated_at}
@@ -0,0 +1,66 @@
+# app/routers/bulk.py
+# 목적: 백필/보관용 대량 내보내기·가져오기 (NDJSON — 한 줄 = JSON 객체 하나, app.core.bulk)
+#   GET  /bulk/posts?after=&author_id=    글 내보내기 (post_id 순)
+#   GET  /bulk/comments?after=&post_id=   댓글 내보내기 (comment_id 순)
+#   POST /bulk/posts                      PostCreate 줄들 → 로그인 사용자 글로 추가
+#   POST /bulk/comments                   CommentCreate 줄들 → 로그인 사용자 댓글로 추가
+# 내보낸 줄을 그대로 가져오기 본문으로 쓸 수 있음 (ID/카운터/시각은 무시하고 새로 부여)
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db
+from app.models.user import User
+from app.schemas.bulk import ImportResult
+from app.core.security import get_current_user
+from app.core import bulk, response_cache
+
+router = APIRouter()  # 최종 prefix는 main에서 "/bulk"
+
+AFTER_DESCRIPTION = "이 ID 다음부터 (끊긴 내보내기 이어받기)"
+
+
+def _ndjson(stmt) -> StreamingResponse:
+    return StreamingResponse(bulk.export_ndjson(stmt), media_type=bulk.NDJSON_MEDIA_TYPE)
+
+
+# ------------------------------
+# 내보내기 (인증 필요 — 전체 덤프는 비용이 큼)
+# ------------------------------
+@router.get("/posts", response_class=StreamingResponse)
+async def export_posts(after: int = Query(0, ge=0, description=AFTER_DESCRIPTION),
+                       author_id: Optional[str] = Query(None),
+                       current_user: User = Depends(get_current_user)):
+    return _ndjson(bulk.posts_query(after, author_id))
+
+
+@router.get("/comments", response_class=StreamingResponse)
+async def export_comments(after: int = Query(0, ge=0, description=AFTER_DESCRIPTION),
+                          post_id: Optional[int] = Query(None, ge=1),
+                          current_user: User = Depends(get_current_user)):
+    return _ndjson(bulk.comments_query(after, post_id))
+
+
+# ------------------------------
+# 가져오기 — 본문을 읽는 대로 검증/삽입 (전체를 메모리에 올리지 않음)
+# ------------------------------
+@router.post("/posts", response_model=ImportResult)
+async def import_posts(request: Request,
+                       db: AsyncSession = Depends(get_async_db),
+                       current_user: User = Depends(get_current_user)):
+    result = await bulk.import_posts(db, request.stream(), current_user.user_id)
+    if result.inserted:
+        await response_cache.post_pages.invalidate()
+    return result
+
+
+@router.post("/comments", response_model=ImportResult)
+async def import_comments(request: Request,
+                          db: AsyncSession = Depends(get_async_db),
+                          current_user: User = Depends(get_current_user)):
+    result = await bulk.import_comments(db, request.stream(), current_user.user_id)
+    if result.inserted:
+        await response_cache.post_pages.invalidate()
+    return result
@@ -1,26 +1,31 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from app.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, tuple_
+from app.database import get_async_db
 from app.models.comment import Comment
-from app.models.post import Post
 from app.models.user import User
-from app.schemas.comment import CommentCreate, CommentUpdate, CommentOut
-from app.core.security import get_current_user
+from app.schemas.comment import CommentCreate, CommentUpdate, CommentOut, PostCommentsOut
+from app.core.security import get_current_user, get_read_db
+from app.core.pagination import encode_cursor, decode_cursor, NEXT_CURSOR_HEADER
+from app.core import http_cache, comments, response_cache, events, purge
+from app.core.batch import parse_ids, MAX_BATCH_IDS
+from app.core.instrumentation import query_budget
 
 router = APIRouter()  # 최종 prefix는 main에서 "/comments"
 
 @router.get("/health")
-def comments_health():
+async def comments_health():
     return {"ok": True, "scope": "comments"}
 
 # 생성 (인증 필요)
-@router.post("", response_model=CommentOut, status_code=status.HTTP_201_CREATED)
-def create_comment(payload: CommentCreate,
-                   db: Session = Depends(get_db),
-                   current_user: User = Depends(get_current_user)):
-    post = db.query(Post).filter(Post.post_id == payload.post_id).first()
-    if not post:
+@router.post("", response_model=CommentOut, status_code=status.HTTP_201_CREATED, dependencies=[query_budget(4)])
+async def create_comment(payload: CommentCreate,
+                         db: AsyncSession = Depends(get_async_db),
+                         current_user: User = Depends(get_current_user)):
+    # 글 존재 확인 겸 댓글 수 +1 (UPDATE ... RETURNING, 댓글 INSERT와 같은 트랜잭션)
+    comments_count = await comments.adjust_count(db, payload.post_id, 1)
+    if comments_count is None:
         raise HTTPException(status_code=404, detail="Post not found")
 
     c = Comment(
@@ -29,33 +34,87 @@ def create_comment(payload: CommentCreate,
         content=payload.content,
     )
     db.add(c)
-    db.commit()
-    db.refresh(c)
+    await db.commit()
+    await db.refresh(c)
+    # 목록 응답에 댓글 수/최신 댓글이 실리므로 캐시된 목록 무효화
+    await response_cache.post_pages.invalidate()
+    events.publish("comment.created", c.post_id, comment_id=c.comment_id, author_id=c.author_id,
+                   content=c.content, created_at=c.created_at, comments_count=comments_count)
     return c
 
 # 목록 (공개) — 특정 게시글의 댓글
-@router.get("", response_model=List[CommentOut])
-def list_comments(post_id: int = Query(..., ge=1),  # ✅ 필수
-                  skip: int = Query(0, ge=0),
-                  limit: int = Query(20, ge=1, le=100),
-                  db: Session = Depends(get_db)):
-    q = db.query(Comment).filter(Comment.post_id == post_id).order_by(Comment.created_at.asc())
-    return q.offset(skip).limit(limit).all()
+@router.get("", response_model=List[CommentOut], dependencies=[query_budget(1)])
+async def list_comments(request: Request,
+                        response: Response,
+                        post_id: int = Query(..., ge=1),  # ✅ 필수
+                        skip: int = Query(0, ge=0),
+                        limit: int = Query(20, ge=1, le=100),
+                        cursor: Optional[str] = Query(None, description=f"이전 응답의 {NEXT_CURSOR_HEADER} 값 (지정 시 skip 무시)"),
+                        db: AsyncSession = Depends(get_read_db)):
+    q = (
+        select(Comment)
+          .where(Comment.post_id == post_id, Comment.post_id.not_in(purge.PURGING))  # 정리 중인 글의 댓글 제외
+          .order_by(Comment.created_at.asc(), Comment.comment_id.asc())
+    )
+
+    # 커서 모드: ix_comments_post_created (post_id, created_at) 인덱스 범위 스캔
+    if cursor:
+        after_created, after_id = decode_cursor(cursor)
+        q = q.filter(tuple_(Comment.created_at, Comment.comment_id) > (after_created, after_id))
+    else:
+        q = q.offset(skip)
+
+    rows = (await db.scalars(q.limit(limit + 1))).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].created_at, rows[-1].comment_id)
+
+    # 조건부 GET: 본문은 이미 읽었지만 직렬화/전송은 생략
+    etag = http_cache.make_etag(
+        [(c.comment_id, c.updated_at, c.content) for c in rows], NEXT_CURSOR_HEADER in response.headers
+    )
+    response.headers.update(http_cache.cache_headers(etag, None, private=False))
+    if http_cache.is_not_modified(request, etag):
+        return http_cache.not_modified(dict(response.headers))
+    return rows
+
+# 배치 목록 (공개) — 여러 게시글의 앞쪽 댓글 K개씩, 글 수와 무관하게 쿼리 1번
+@router.get("/batch", response_model=List[PostCommentsOut], dependencies=[query_budget(1)])
+async def list_comments_batch(post_ids: str = Query(..., description=f"쉼표 구분 글 ID (최대 {MAX_BATCH_IDS}개)"),
+                              per_post: int = Query(3, ge=1, le=20),
+                              db: AsyncSession = Depends(get_read_db)):
+    ids = parse_ids(post_ids, "post_ids")
+    # 글별 순번(ROW_NUMBER)을 매겨 앞쪽 K개만 — ix_comments_post_created 인덱스 순서와 같음
+    by_post = await comments.per_post(db, ids, per_post)
+    return [PostCommentsOut(post_id=post_id, comments=rows) for post_id, rows in by_post.items()]
+
+def _visible(comment_id: int):
+    """댓글 하나 — 소프트 삭제(정리 중)된 글의 댓글은 없는 것으로 (조회/수정/삭제 공통)"""
+    return select(Comment).where(Comment.comment_id == comment_id, Comment.post_id.not_in(purge.PURGING))
 
 # 상세 (공개)
-@router.get("/{comment_id}", response_model=CommentOut)
-def get_comment(comment_id: int, db: Session = Depends(get_db)):
-    c = db.query(Comment).filter(Comment.comment_id == comment_id).first()
+@router.get("/{comment_id}", response_model=CommentOut, dependencies=[query_budget(1)])
+async def get_comment(comment_id: int, request: Request, response: Response,
+                      db: AsyncSession = Depends(get_read_db)):
+    c = await db.scalar(_visible(comment_id))
     if not c:
         raise HTTPException(status_code=404, detail="Comment not found")
+
+    # 댓글 응답은 본문 수정 시각만으로 결정되므로 If-Modified-Since도 허용
+    etag = http_cache.make_etag(c.comment_id, c.updated_at, c.content)
+    last_modified = http_cache.last_modified_of(c.created_at, c.updated_at)
+    headers = http_cache.cache_headers(etag, last_modified, private=False)
+    if http_cache.is_not_modified(request, etag, last_modified):
+        return http_cache.not_modified(headers)
+    response.headers.update(headers)
     return c
 
 # 수정 (작성자만)
-@router.patch("/{comment_id}", response_model=CommentOut)
-def update_comment(comment_id: int, payload: CommentUpdate,
-                   db: Session = Depends(get_db),
-                   current_user: User = Depends(get_current_user)):
-    c = db.query(Comment).filter(Comment.comment_id == comment_id).first()
+@router.patch("/{comment_id}", response_model=CommentOut, dependencies=[query_budget(4)])
+async def update_comment(comment_id: int, payload: CommentUpdate,
+                         db: AsyncSession = Depends(get_async_db),
+                         current_user: User = Depends(get_current_user)):
+    c = await db.scalar(_visible(comment_id))
     if not c:
         raise HTTPException(status_code=404, detail="Comment not found")
     if c.author_id != current_user.user_id:
@@ -64,21 +123,27 @@ def update_comment(comment_id: int, payload: CommentUpdate,
     if payload.content is not None:
         c.content = payload.content
 
-    db.commit()
-    db.refresh(c)
+    await db.commit()
+    await db.refresh(c)
+    await response_cache.post_pages.invalidate()
+    events.publish("comment.updated", c.post_id, comment_id=c.comment_id, content=c.content,
+                   updated_at=c.updated_at)
     return c
 
 # 삭제 (작성자만)
-@router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_comment(comment_id: int,
-                   db: Session = Depends(get_db),
-                   current_user: User = Depends(get_current_user)):
-    c = db.query(Comment).filter(Comment.comment_id == comment_id).first()
+@router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[query_budget(4)])
+async def delete_comment(comment_id: int,
+                         db: AsyncSession = Depends(get_async_db),
+                         current_user: User = Depends(get_current_user)):
+    c = await db.scalar(_visible(comment_id))
     if not c:
         raise HTTPException(status_code=404, detail="Comment not found")
     if c.author_id != current_user.user_id:
         raise HTTPException(status_code=403, detail="You are not the author of this comment")
 
-    db.delete(c)
-    db.commit()
+    comments_count = await comments.adjust_count(db, c.post_id, -1)
+    await db.delete(c)
+    await db.commit()
+    await response_cache.post_pages.invalidate()
+    events.publish("comment.deleted", c.post_id, comment_id=comment_id, comments_count=comments_count)
     return
@@ -0,0 +1,76 @@
+# app/routers/events.py
+# 목적: 실시간 변경 알림 — 폴링 대신 구독 (app.core.events)
+#   GET /events?post_id=      SSE (text/event-stream), 하트비트 주석으로 연결 유지
+#   WS  /events/ws?post_id=   WebSocket, 이벤트마다 JSON 텍스트 한 개
+#   post_id를 생략하면 게시판 전체 구독
+# 이벤트: post.created / post.updated / post.deleted / post.likes(좋아요 수, 묶어서 발행)
+#         comment.created / comment.updated / comment.deleted / lagged(대기열이 넘쳐 버린 수 → 다시 조회)
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app.core import events
+from app.core.config import settings
+
+router = APIRouter()  # 최종 prefix는 main에서 "/events"
+
+HEARTBEAT = b": ping\n\n"
+SLOW_CONSUMER_CLOSE_CODE = 1008  # policy violation — 재접속 후 다시 조회
+
+
+@router.get("", response_class=StreamingResponse)
+async def stream_events(post_id: Optional[int] = Query(None, ge=1, description="생략하면 게시판 전체")):
+    async def body():
+        # 구독은 본문이 실제로 시작될 때 — 응답이 보내지지 못하면 본문이 돌지 않아 finally도 없음
+        sub = events.subscribe(post_id)
+        try:
+            yield b"retry: 3000\n\n"
+            while True:
+                try:
+                    event = await sub.get(timeout=settings.EVENTS_HEARTBEAT_SECONDS)
+                except events.SlowConsumer:
+                    yield b"event: overflow\ndata: {}\n\n"
+                    return
+                yield HEARTBEAT if event is None else event.sse()
+        finally:
+            events.unsubscribe(sub)
+
+    # 프록시(nginx) 버퍼링/캐시로 이벤트가 늦게 도착하지 않도록
+    return StreamingResponse(body(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@router.websocket("/ws")
+async def websocket_events(websocket: WebSocket, post_id: Optional[int] = Query(None, ge=1)):
+    await websocket.accept()
+    # 클라이언트가 보내는 메시지는 쓰지 않지만, 읽어야 연결 종료를 알 수 있음
+    closed = asyncio.ensure_future(_wait_closed(websocket))
+    sub = events.subscribe(post_id)  # 바로 아래 try의 finally가 해제
+    try:
+        while not closed.done():
+            getter = asyncio.ensure_future(sub.get(timeout=settings.EVENTS_HEARTBEAT_SECONDS))
+            await asyncio.wait({getter, closed}, return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                getter.cancel()
+                break
+            try:
+                event = getter.result()
+            except events.SlowConsumer:
+                await websocket.close(code=SLOW_CONSUMER_CLOSE_CODE, reason="slow consumer")
+                break
+            if event is not None:
+                await websocket.send_text(event.json().decode())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        closed.cancel()
+        events.unsubscribe(sub)
+
+
+async def _wait_closed(websocket: WebSocket) -> None:
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core import metrics
+
+router = APIRouter()  # 최종 prefix는 main에서 "/metrics"
+
+# Prometheus 스크레이프용 (text exposition format)
+@router.get("", response_class=PlainTextResponse)
+async def get_metrics():
+    return metrics.render()
@@ -1,144 +1,295 @@
 # app/routers/post.py
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlalchemy import select, tuple_, func
 
-from app.database import get_db
+from app.database import get_async_db
 from app.models.post import Post
 from app.models.like import Like
 from app.models.user import User
-from app.schemas.post import PostCreate, PostUpdate, PostWithAuthorStatsOut
-from app.schemas.like import LikeToggleOut
-from app.core.security import get_current_user, get_current_user_optional
+from app.schemas.post import PostCreate, PostUpdate, PostWithAuthorStatsOut, PostListItemOut
+from app.schemas.like import LikeToggleOut, MyLikesOut
+from app.core.security import get_current_user, get_current_user_optional, get_read_db
+from app.core.pagination import (
+    encode_cursor, decode_cursor, encode_score_cursor, decode_score_cursor, NEXT_CURSOR_HEADER,
+)
+from app.core import search, http_cache, response_cache, likes, like_buffer, comments, events, purge
+from app.core.ranking import SORT_COLUMNS
+from app.core.batch import parse_ids, MAX_BATCH_IDS
+from app.core.instrumentation import query_budget
+from app.core.serialization import post_adapter, post_list_adapter, post_out, post_list_item, json_response
 
 router = APIRouter()
 
+# 목록 응답의 content_preview 길이 (문자 수)
+CONTENT_PREVIEW_CHARS = 200
+# 목록에 함께 싣는 최신 댓글 수 상한 (comments=N)
+MAX_PREVIEW_COMMENTS = 10
+
 # ------------------------------
 # 게시글 생성
 # ------------------------------
-@router.post("", response_model=PostWithAuthorStatsOut, status_code=status.HTTP_201_CREATED)
-def create_post(payload: PostCreate,
-                db: Session = Depends(get_db),
-                current_user: User = Depends(get_current_user)):
+@router.post("", response_model=PostWithAuthorStatsOut, status_code=status.HTTP_201_CREATED, dependencies=[query_budget(3)])
+async def create_post(payload: PostCreate,
+                      db: AsyncSession = Depends(get_async_db),
+                      current_user: User = Depends(get_current_user)):
     post = Post(
         title=payload.title,
         content=payload.content,
         author_id=current_user.user_id,
     )
     db.add(post)
-    db.commit()
-    db.refresh(post)
-    return PostWithAuthorStatsOut(
-        post_id=post.post_id,
-        title=post.title,
-        content=post.content,
-        author_id=post.author_id,
-        created_at=post.created_at,
-        updated_at=post.updated_at,
-        author=post.author,
-        likes_count=0,
-        my_like=False
-    )
+    await db.commit()
+    await db.refresh(post)
+    await response_cache.post_pages.invalidate()
+    events.publish("post.created", post.post_id, title=post.title, author_id=post.author_id,
+                   created_at=post.created_at)
+    return json_response(post_adapter, post_out(post, current_user, likes_count=0, my_like=False),
+                         status_code=status.HTTP_201_CREATED)
 
 # ------------------------------
 # 게시글 목록 (작성자+좋아요 통계)
 # ------------------------------
-@router.get("", response_model=List[PostWithAuthorStatsOut])
-def list_posts(q: Optional[str] = Query(None, description="제목/본문 키워드"),
-               skip: int = Query(0, ge=0),
-               limit: int = Query(20, ge=1, le=100),
-               db: Session = Depends(get_db),
-               current_user: Optional[User] = Depends(get_current_user_optional)):
-
-    # 좋아요 수 서브쿼리
-    likes_sq = (
-        db.query(Like.post_id, func.count(Like.like_id).label("likes_count"))
-          .group_by(Like.post_id)
-          .subquery()
-    )
+@router.get("", response_model=List[PostListItemOut], dependencies=[query_budget(6)])
+async def list_posts(request: Request,
+                     q: Optional[str] = Query(None, description="제목/본문 키워드"),
+                     skip: int = Query(0, ge=0),
+                     limit: int = Query(20, ge=1, le=100),
+                     cursor: Optional[str] = Query(None, description=f"이전 응답의 {NEXT_CURSOR_HEADER} 값 (지정 시 skip 무시)"),
+                     sort: str = Query("latest", pattern="^(latest|relevance|hot|top)$", description="relevance: 검색어 관련도순 (q 필요, skip 사용), hot: 최근 인기순, top: 누적 인기순"),
+                     fields: Optional[str] = Query(None, pattern="^content$", description="content: 전체 본문 포함 (기본은 content_preview만)"),
+                     ids: Optional[str] = Query(None, description=f"배치 조회: 쉼표 구분 글 ID (최대 {MAX_BATCH_IDS}개, 지정 시 검색/페이지 인자 무시)"),
+                     comments_preview: int = Query(0, ge=0, le=MAX_PREVIEW_COMMENTS, alias="comments", description="글마다 최신 댓글 N개 포함 (latest_comments)"),
+                     db: AsyncSession = Depends(get_read_db),
+                     current_user: Optional[User] = Depends(get_current_user_optional)):
+    post_ids = parse_ids(ids) if ids is not None else None
+
+    # 익명 요청: 직렬화된 응답을 캐시에서 바로 반환 (쓰기 시 무효화)
+    if current_user is None and response_cache.post_pages.enabled:
+        async def build():
+            headers, result = await _list_page(db, q, skip, limit, cursor, sort, fields, post_ids, comments_preview, None)
+            return headers, post_list_adapter.dump_json(result)
+
+        key = (q, sort, cursor, None if cursor else skip, limit, fields, post_ids, comments_preview)
+        headers, body = await response_cache.post_pages.get_or_build(key, build)
+        if http_cache.is_not_modified(request, headers["ETag"]):
+            return http_cache.not_modified(headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    headers, result = await _list_page(db, q, skip, limit, cursor, sort, fields, post_ids, comments_preview,
+                                       current_user, request)
+    if result is None:
+        return http_cache.not_modified(headers)
+    return json_response(post_list_adapter, result, headers=headers)
+
 
+async def _list_page(db: AsyncSession, q: Optional[str], skip: int, limit: int, cursor: Optional[str],
+                     sort: str, fields: Optional[str], ids: Optional[List[int]], comments_preview: int,
+                     current_user: Optional[User], request: Optional[Request] = None,
+                     ) -> tuple[dict[str, str], Optional[List[PostListItemOut]]]:
+    """(헤더, 페이지). request가 주어지고 클라이언트 사본이 최신이면 페이지는 None (304)"""
+    # 1단계: 페이지에 실릴 글의 ID와 검증자(수정 횟수/시각, 좋아요/댓글 수)만 조회 — 본문은 읽지 않음
+    # 제목/content_preview는 version이 대신함 (수정마다 +1)
+    # 좋아요/댓글 수는 posts.likes_count/comments_count 컬럼에서 바로 읽음 (likes/comments 집계 없음)
+    # 소프트 삭제돼 정리 중인 글은 제외 (app.core.purge)
     query = (
-        db.query(Post, func.coalesce(likes_sq.c.likes_count, 0).label("likes_count"))
-          .options(joinedload(Post.author))
-          .outerjoin(likes_sq, Post.post_id == likes_sq.c.post_id)
-          .order_by(Post.created_at.desc())
+        select(Post.post_id, Post.version, Post.created_at, Post.updated_at, Post.likes_count, Post.comments_count)
+          .where(purge.ALIVE)
     )
+    headers: dict[str, str] = {}
 
-    if q:
-        query = query.filter((Post.title.contains(q)) | (Post.content.contains(q)))
-
-    rows = query.offset(skip).limit(limit).all()
+    if ids is not None:
+        # 배치 조회: 요청한 순서대로, 없는 글은 빠짐 — 글 수와 무관하게 쿼리 수 고정
+        order = {post_id: i for i, post_id in enumerate(ids)}
+        rows = (await db.execute(query.where(Post.post_id.in_(ids)))).all()
+        page = sorted(rows, key=lambda row: order[row.post_id])
+    else:
+        page = await _page_validators(db, query, q, skip, limit, cursor, sort, headers)
+    post_ids = [row.post_id for row in page]
 
-    # 내 좋아요 여부 조회
+    # 내 좋아요 여부 조회 — 이 페이지 글로 한정 (uq_likes_post_user 인덱스 조회, 전체 좋아요 이력은 읽지 않음)
     my_liked_ids: set[int] = set()
-    if current_user:
-        liked_rows = db.query(Like.post_id).filter(Like.user_id == current_user.user_id).all()
-        my_liked_ids = {r.post_id for r in liked_rows}
-
-    result: List[PostWithAuthorStatsOut] = []
-    for post, likes_count in rows:
-        result.append(
-            PostWithAuthorStatsOut(
-                post_id=post.post_id,
-                title=post.title,
-                content=post.content,
-                author_id=post.author_id,
-                created_at=post.created_at,
-                updated_at=post.updated_at,
-                author=post.author,
-                likes_count=int(likes_count),
-                my_like=(post.post_id in my_liked_ids) if current_user else None,
+    if current_user and post_ids:
+        liked_rows = await db.scalars(
+            select(Like.post_id).where(
+                Like.user_id == current_user.user_id,
+                Like.post_id.in_(post_ids),
             )
         )
-    return result
+        my_liked_ids = set(liked_rows)
+
+    # 좋아요 쓰기 버퍼에 아직 반영 안 된 상태 덮어쓰기 (버퍼를 안 쓰면 DB 값 그대로)
+    counts = {row.post_id: like_buffer.count(row.post_id, row.likes_count) for row in page}
+    if current_user:
+        my_liked_ids = {
+            post_id for post_id in post_ids
+            if like_buffer.liked(post_id, current_user.user_id, post_id in my_liked_ids)
+        }
+
+    # 최신 댓글 미리보기: 페이지 전체를 윈도 쿼리 한 번으로 (댓글 수정은 글 검증자에 안 보이므로 ETag에 포함)
+    previews = await comments.per_post(db, post_ids, comments_preview, newest=True) \
+        if comments_preview and post_ids else {}
+    preview_validators = [
+        (c.comment_id, c.updated_at, c.content) for post_comments in previews.values() for c in post_comments
+    ]
+
+    # 조건부 GET: 검증자가 같으면 본문을 읽기 전에 304
+    etag = http_cache.make_etag(
+        [(*row, counts[row.post_id]) for row in page], sorted(my_liked_ids), NEXT_CURSOR_HEADER in headers,
+        preview_validators,
+    )
+    headers.update(http_cache.cache_headers(etag, None, private=current_user is not None))
+    if request is not None and http_cache.is_not_modified(request, etag):
+        return headers, None
+
+    # 2단계: 목록에 필요한 컬럼만 조회 (1단계 순서 유지)
+    # ORM 엔티티/identity map 없이 Row 튜플로 받고, 본문은 SQL에서 잘라 앞부분만 전송받음
+    # 작성자는 username만 — users 행 전체(비밀번호 해시 포함)를 읽지 않음
+    columns = [
+        Post.post_id, Post.title, Post.author_id, Post.created_at, Post.updated_at, User.username,
+        func.substr(Post.content, 1, CONTENT_PREVIEW_CHARS).label("content_preview"),
+    ]
+    if fields == "content":
+        columns.append(Post.content)
+    rows = {
+        row.post_id: row
+        for row in await db.execute(
+            select(*columns).join(User, User.user_id == Post.author_id).where(Post.post_id.in_(post_ids))
+        )
+    } if post_ids else {}
+
+    # 검색 하이라이트는 이 페이지 글에 대해서만 계산
+    snippets = await search.snippets(db, q, post_ids) if q and ids is None else {}
+
+    result: List[PostListItemOut] = []
+    for validator in page:
+        row = rows.get(validator.post_id)
+        if row is None:  # 두 단계 사이에 삭제된 글
+            continue
+        result.append(post_list_item(
+            row,
+            likes_count=counts[validator.post_id],
+            comments_count=validator.comments_count,
+            my_like=(row.post_id in my_liked_ids) if current_user else None,
+            snippet=snippets.get(row.post_id),
+            latest_comments=previews.get(row.post_id) if comments_preview else None,
+        ))
+    return headers, result
+
+
+async def _page_validators(db: AsyncSession, query, q: Optional[str], skip: int, limit: int,
+                           cursor: Optional[str], sort: str, headers: dict[str, str]) -> list:
+    """검색/정렬/페이지 인자를 적용해 검증자 행 조회. 다음 페이지가 있으면 headers에 커서 추가"""
+    rank = None
+    if q:
+        query, rank = search.apply(query, q)
+
+    # 인기순: 미리 계산된 점수 컬럼 — ix_posts_hot/ix_posts_top 역방향 범위 스캔 (요청 시 집계 없음)
+    score = SORT_COLUMNS.get(sort)
+    if sort == "relevance" and rank is not None:
+        # 관련도순은 키셋 커서를 만들 수 없어 skip으로만 페이지 이동
+        query = query.order_by(rank, Post.created_at.desc(), Post.post_id.desc())
+        cursor = None
+    elif score is not None:
+        query = query.add_columns(score.label("score")).order_by(score.desc(), Post.post_id.desc())
+    else:
+        query = query.order_by(Post.created_at.desc(), Post.post_id.desc())
+
+    # 커서 모드: (정렬 키, post_id) 키셋 — 인덱스 범위 스캔, 앞 페이지를 읽고 버리지 않음
+    if cursor and score is not None:
+        after_score, after_id = decode_score_cursor(cursor)
+        query = query.filter(tuple_(score, Post.post_id) < (after_score, after_id))
+    elif cursor:
+        after_created, after_id = decode_cursor(cursor)
+        query = query.filter(tuple_(Post.created_at, Post.post_id) < (after_created, after_id))
+    else:
+        query = query.offset(skip)
+
+    # 한 건 더 읽어서 다음 페이지 존재 여부 판단
+    page = (await db.execute(query.limit(limit + 1))).all()
+    if len(page) > limit:
+        page = page[:limit]
+        if score is not None:
+            headers[NEXT_CURSOR_HEADER] = encode_score_cursor(page[-1].score, page[-1].post_id)
+        elif sort != "relevance" or rank is None:
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(page[-1].created_at, page[-1].post_id)
+    return page
+
+# ------------------------------
+# 내 좋아요 여부 일괄 조회 (인증 필요)
+# ------------------------------
+@router.get("/my-likes", response_model=MyLikesOut, dependencies=[query_budget(2)])
+async def my_likes(ids: str = Query(..., description=f"쉼표 구분 글 ID (최대 {MAX_BATCH_IDS}개)"),
+                   db: AsyncSession = Depends(get_async_db),
+                   current_user: User = Depends(get_current_user)):
+    post_ids = parse_ids(ids)
+    liked = set(await db.scalars(
+        select(Like.post_id).where(Like.user_id == current_user.user_id, Like.post_id.in_(post_ids))
+    ))
+    return MyLikesOut(liked_post_ids=[
+        post_id for post_id in post_ids
+        if like_buffer.liked(post_id, current_user.user_id, post_id in liked)
+    ])
 
 # ------------------------------
 # 게시글 상세
 # ------------------------------
-@router.get("/{post_id}", response_model=PostWithAuthorStatsOut)
-def get_post(post_id: int,
-             db: Session = Depends(get_db),
-             current_user: Optional[User] = Depends(get_current_user_optional)):
-    post = (
-        db.query(Post)
-          .options(joinedload(Post.author))
-          .filter(Post.post_id == post_id)
-          .first()
-    )
-    if not post:
+@router.get("/{post_id}", response_model=PostWithAuthorStatsOut, dependencies=[query_budget(4)])
+async def get_post(post_id: int,
+                   request: Request,
+                   db: AsyncSession = Depends(get_read_db),
+                   current_user: Optional[User] = Depends(get_current_user_optional)):
+    # 검증자(수정 횟수/시각, 좋아요/댓글 수)만 먼저 조회 — 304면 본문을 읽지 않음
+    # 수정 시각은 초 단위라 같은 초의 두 수정은 version으로 구분
+    validators = (await db.execute(
+        select(Post.version, Post.created_at, Post.updated_at, Post.likes_count, Post.comments_count)
+          .where(Post.post_id == post_id, purge.ALIVE)
+    )).first()
+    if not validators:
         raise HTTPException(status_code=404, detail="Post not found")
 
-    likes_count = db.query(func.count(Like.like_id)).filter(Like.post_id == post_id).scalar() or 0
     my_like = None
     if current_user:
-        my_like = db.query(Like).filter(
-            Like.post_id == post_id, Like.user_id == current_user.user_id
-        ).first() is not None
-
-    return PostWithAuthorStatsOut(
-        post_id=post.post_id,
-        title=post.title,
-        content=post.content,
-        author_id=post.author_id,
-        created_at=post.created_at,
-        updated_at=post.updated_at,
-        author=post.author,
-        likes_count=int(likes_count),
-        my_like=my_like,
+        my_like = await db.scalar(
+            select(Like.like_id).where(Like.post_id == post_id, Like.user_id == current_user.user_id)
+        ) is not None
+        my_like = like_buffer.liked(post_id, current_user.user_id, my_like)
+    likes_count = like_buffer.count(post_id, validators.likes_count)
+
+    # Last-Modified는 본문 수정 시각만 반영하고 좋아요 수 변화는 모르므로
+    # 304 판단은 ETag로만 함 (If-Modified-Since 단독 요청은 전체 응답)
+    etag = http_cache.make_etag(tuple(validators), likes_count, my_like)
+    last_modified = http_cache.last_modified_of(validators.created_at, validators.updated_at)
+    headers = http_cache.cache_headers(etag, last_modified, private=current_user is not None)
+    if http_cache.is_not_modified(request, etag):
+        return http_cache.not_modified(headers)
+
+    post = await db.scalar(
+        select(Post)
+          .options(joinedload(Post.author).load_only(User.user_id, User.username))
+          .where(Post.post_id == post_id)
     )
+    if not post:
+        raise HTTPException(status_code=404, detail="Post not found")
+
+    return json_response(post_adapter, post_out(post, post.author, likes_count, my_like), headers=headers)
 
 # ------------------------------
 # 게시글 수정 (작성자 본인만)
 # ------------------------------
-@router.patch("/{post_id}", response_model=PostWithAuthorStatsOut)
-def update_post(post_id: int, payload: PostUpdate,
-                db: Session = Depends(get_db),
-                current_user: User = Depends(get_current_user)):
-    post = db.query(Post).filter(Post.post_id == post_id).first()
-    if not post:
+@router.patch("/{post_id}", response_model=PostWithAuthorStatsOut, dependencies=[query_budget(4)])
+async def update_post(post_id: int, payload: PostUpdate,
+                      db: AsyncSession = Depends(get_async_db),
+                      current_user: User = Depends(get_current_user)):
+    # 글과 내 좋아요 여부를 한 번에 (응답의 my_like — 작성자도 자기 글에 좋아요 가능)
+    has_like = select(Like.like_id).where(Like.post_id == Post.post_id, Like.user_id == current_user.user_id).exists()
+    row = (await db.execute(select(Post, has_like).where(Post.post_id == post_id))).first()
+    if not row or row[0].deleted_at is not None:
         raise HTTPException(status_code=404, detail="Post not found")
+    post, my_like = row
     if post.author_id != current_user.user_id:
         raise HTTPException(status_code=403, detail="You are not the author")
 
@@ -146,64 +297,83 @@ def update_post(post_id: int, payload: PostUpdate,
         post.title = payload.title
     if payload.content is not None:
         post.content = payload.content
+    if payload.title is not None or payload.content is not None:
+        post.version = Post.version + 1  # ETag 검증자 (같은 초의 수정도 구분)
 
-    db.commit()
-    db.refresh(post)
-
-    likes_count = db.query(func.count(Like.like_id)).filter(Like.post_id == post_id).scalar() or 0
-    return PostWithAuthorStatsOut(
-        post_id=post.post_id,
-        title=post.title,
-        content=post.content,
-        author_id=post.author_id,
-        created_at=post.created_at,
-        updated_at=post.updated_at,
-        author=post.author,
-        likes_count=int(likes_count),
-        my_like=False
-    )
+    await db.commit()
+    await db.refresh(post)
+    await response_cache.post_pages.invalidate()
+    events.publish("post.updated", post_id, title=post.title, updated_at=post.updated_at)
+
+    # get_post와 같은 값 — 좋아요 쓰기 버퍼에 아직 반영 안 된 상태 덮어쓰기
+    likes_count = like_buffer.count(post_id, post.likes_count)
+    my_like = like_buffer.liked(post_id, current_user.user_id, my_like)
+    return json_response(post_adapter, post_out(post, current_user, likes_count, my_like))
 
 # ------------------------------
 # 게시글 삭제 (작성자 본인만)
+# 자식 행(좋아요/댓글)은 DB의 ON DELETE CASCADE가 지움 — 아주 많으면 소프트 삭제 후 백그라운드 정리 (app.core.purge)
 # ------------------------------
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_post(post_id: int,
-                db: Session = Depends(get_db),
-                current_user: User = Depends(get_current_user)):
-    post = db.query(Post).filter(Post.post_id == post_id).first()
-    if not post:
+async def delete_post(post_id: int,
+                      db: AsyncSession = Depends(get_async_db),
+                      current_user: User = Depends(get_current_user)):
+    post = await db.get(Post, post_id)
+    if not post or post.deleted_at is not None:
         raise HTTPException(status_code=404, detail="Post not found")
     if post.author_id != current_user.user_id:
         raise HTTPException(status_code=403, detail="You are not the author")
 
-    db.delete(post)
-    db.commit()
+    if purge.should_defer(post):
+        await purge.soft_delete(db, post)
+    else:
+        await db.delete(post)  # passive_deletes — 자식 행을 읽지 않고 DELETE 한 문장
+        await db.commit()
+    like_buffer.forget_post(post_id)
+    await response_cache.post_pages.invalidate()
+    events.publish("post.deleted", post_id)
     return
 
 # ------------------------------
-# 좋아요 토글 (인증 필요)
+# 좋아요 (인증 필요)
+# POST는 토글, PUT/DELETE는 멱등 — 원자적 SQL(app.core.likes)로 처리해 동시 요청에도 500 없음
+# LIKE_BUFFER_ENABLED면 쓰기 버퍼(app.core.like_buffer)에 기록하고 묶어서 반영
 # ------------------------------
-@router.post("/{post_id}/like", response_model=LikeToggleOut)
-def toggle_like(post_id: int,
-                db: Session = Depends(get_db),
-                current_user: User = Depends(get_current_user)):
-    post = db.query(Post).filter(Post.post_id == post_id).first()
-    if not post:
+async def _like_response(db: AsyncSession, post_id: int, liked: bool, changed: bool,
+                         count: Optional[int]) -> LikeToggleOut:
+    if count is None:
         raise HTTPException(status_code=404, detail="Post not found")
+    await db.commit()
+    if changed:
+        await response_cache.post_pages.invalidate()
+        events.likes_changed(post_id, count)
+    return LikeToggleOut(liked=liked, likes_count=count)
 
-    like = db.query(Like).filter(
-        Like.post_id == post_id, Like.user_id == current_user.user_id
-    ).first()
 
-    if like:
-        db.delete(like)
-        db.commit()
-        liked = False
-    else:
-        new_like = Like(post_id=post_id, user_id=current_user.user_id)
-        db.add(new_like)
-        db.commit()
-        liked = True
+def _likes():
+    """좋아요 쓰기 경로 — 버퍼 모드면 메모리에 기록 후 주기적으로 반영, 아니면 바로 DB"""
+    return like_buffer if like_buffer.enabled() else likes
+
+
+@router.post("/{post_id}/like", response_model=LikeToggleOut, dependencies=[query_budget(4)])
+async def toggle_like(post_id: int,
+                      db: AsyncSession = Depends(get_async_db),
+                      current_user: User = Depends(get_current_user)):
+    liked, count = await _likes().toggle(db, post_id, current_user.user_id)
+    return await _like_response(db, post_id, liked, True, count)
+
+
+@router.put("/{post_id}/like", response_model=LikeToggleOut, dependencies=[query_budget(4)])
+async def put_like(post_id: int,
+                   db: AsyncSession = Depends(get_async_db),
+                   current_user: User = Depends(get_current_user)):
+    changed, count = await _likes().like(db, post_id, current_user.user_id)
+    return await _like_response(db, post_id, True, changed, count)
+
 
-    likes_count = db.query(func.count(Like.like_id)).filter(Like.post_id == post_id).scalar() or 0
-    return LikeToggleOut(liked=liked, likes_count=int(likes_count))
+@router.delete("/{post_id}/like", response_model=LikeToggleOut, dependencies=[query_budget(4)])
+async def delete_like(post_id: int,
+                      db: AsyncSession = Depends(get_async_db),
+                      current_user: User = Depends(get_current_user)):
+    changed, count = await _likes().unlike(db, post_id, current_user.user_id)
+    return await _like_response(db, post_id, False, changed, count)
@@ -1,50 +1,65 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_async_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserOut, TokenOut
-from app.core.security import get_password_hash, verify_password, create_access_token, get_current_user
+from app.core.security import create_access_token, get_current_user
+from app.core.hashing import hash_password_async, verify_and_update_async
 
 router = APIRouter()
 
 @router.get("/health")
-def users_health():
+async def users_health():
     return {"ok": True, "scope": "users"}
 
 @router.post("/signup", response_model=UserOut, status_code=status.HTTP_201_CREATED)
-def signup(data: UserCreate, db: Session = Depends(get_db)):
+async def signup(data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     # user_id / username / email 중복 체크
-    if db.query(User).filter(
+    if await db.scalar(select(User).where(
         (User.user_id == data.user_id) | (User.username == data.username) | (User.email == data.email)
-    ).first():
+    )):
         raise HTTPException(status_code=400, detail="user_id or username or email already exists")
+    # 해시 계산 동안 DB 연결을 붙잡고 있지 않도록 읽기 트랜잭션을 먼저 끝냄
+    await db.commit()
 
     user = User(
         user_id=data.user_id,
         username=data.username,
         email=data.email,
-        password=get_password_hash(data.password),
+        # bcrypt는 전용 프로세스 풀에서 실행 (포화 시 429, 워커가 죽은 풀을 되살리지 못하면 503)
+        password=await hash_password_async(data.password),
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user
 
 @router.post("/login", response_model=TokenOut)
-def login(form: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(form: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
 
-    user = db.query(User).filter(User.username == form.username).first()
+    user = await db.scalar(select(User).where(User.username == form.username))
     if not user:
-        user = db.query(User).filter(User.user_id == form.username).first()
+        user = await db.get(User, form.username)
 
-    if not user or not verify_password(form.password, user.password):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    # 해시 검증 동안 DB 연결을 붙잡고 있지 않도록 읽기 트랜잭션을 먼저 끝냄 (로그인 폭주 시 풀 고갈 방지)
+    await db.commit()
+    ok, new_hash = await verify_and_update_async(form.password, user.password)
+    if not ok:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
+    # 라운드 설정이 바뀐 예전 해시는 로그인 성공 시 새 해시로 교체
+    if new_hash:
+        user.password = new_hash
+        await db.commit()
+
     token = create_access_token(subject=user.user_id)
     return {"access_token": token, "token_type": "bearer"}
 
 @router.get("/me", response_model=UserOut)
-def me(current_user: User = Depends(get_current_user)):
+async def me(current_user: User = Depends(get_current_user)):
     return current_user
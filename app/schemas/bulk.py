@@ -0,0 +1,14 @@
+# app/schemas/bulk.py
+# 목적: 대량 가져오기(/bulk) 결과
+from pydantic import BaseModel
+
+
+class ImportRowError(BaseModel):
+    line: int            # 1부터 (빈 줄 포함)
+    errors: list[dict]   # pydantic 오류 형식 {type, loc, msg}
+
+
+class ImportResult(BaseModel):
+    inserted: int = 0
+    failed: int = 0
+    errors: list[ImportRowError] = []  # 앞쪽 BULK_MAX_ERRORS개까지 (failed는 전체 수)
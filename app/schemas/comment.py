@@ -19,3 +19,8 @@ class CommentOut(CommentBase):
     created_at: datetime | None = None
     updated_at: datetime | None = None
     model_config = ConfigDict(from_attributes=True)
+
+class PostCommentsOut(BaseModel):
+    """배치 조회: 글별 앞쪽 댓글 K개"""
+    post_id: int
+    comments: list[CommentOut]
@@ -3,3 +3,6 @@ from pydantic import BaseModel
 class LikeToggleOut(BaseModel):
     liked: bool        # 이번 요청 결과: 좋아요 상태
     likes_count: int   # 현재 총 좋아요 수
+
+class MyLikesOut(BaseModel):
+    liked_post_ids: list[int]  # 요청한 글 중 내가 좋아요한 글 (요청 순서)
@@ -5,6 +5,7 @@ from typing import Optional
 from pydantic import BaseModel, Field
 from pydantic import ConfigDict
 from app.schemas.user import UserPublic
+from app.schemas.comment import CommentOut
 class PostBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=200)
     content: str = Field(..., min_length=1)
@@ -32,4 +33,22 @@ class PostWithAuthorOut(PostOut):
 
 class PostWithAuthorStatsOut(PostWithAuthorOut):
     likes_count: int
-    my_like: bool | None = None
\ No newline at end of file
+    comments_count: int = 0
+    my_like: bool | None = None
+    snippet: str | None = None  # 검색(q) 시 일치 부분 하이라이트 — HTML 이스케이프된 본문 + <mark>…</mark>
+
+class PostListItemOut(BaseModel):
+    """목록용 — 본문 대신 앞부분(content_preview), 전체 본문은 fields=content일 때만"""
+    post_id: int
+    title: str
+    author_id: str
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    author: UserPublic
+    likes_count: int
+    comments_count: int = 0
+    my_like: bool | None = None
+    snippet: str | None = None
+    content_preview: str
+    content: str | None = None
+    latest_comments: list[CommentOut] | None = None  # comments=N일 때 최신 댓글 N개 (최신순)
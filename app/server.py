@@ -0,0 +1,206 @@
+# app/server.py
+# 목적: 운영 서버 진입점 — uvicorn 워커 프로세스 N개 (httptools 파서, uvloop가 설치돼 있으면 uvloop 루프)
+# 실행: python -m app.server [--workers N] [--host H] [--port P] [--migrate]   (기본값은 SERVER_* 설정)
+# - 프리포크: 부모가 app.main을 한 번 import(--migrate면 마이그레이션도)하고 listen 소켓을 연 뒤 워커를 fork
+#   → 워커마다 import(~0.6초)를 반복하지 않고 코드/모듈 메모리를 공유, 커널이 같은 소켓의 연결을 워커들에 분배
+#   부모에서 만든 DB 풀에 남은 연결은 워커에서 dispose(close=False)로 버림 (부모 소유 소켓을 닫지도 공유하지도 않게)
+# - SIGTERM/SIGINT: 워커에 SIGTERM → 새 연결을 받지 않고 진행 중인 요청을 마무리(SERVER_GRACEFUL_TIMEOUT_SECONDS)
+#   → 그래도 남은 워커는 SIGKILL
+# - 죽었거나 한도(SERVER_MAX_REQUESTS, SERVER_MAX_RSS_MB)에 닿아 스스로 종료한 워커는 새로 fork
+# - fork가 없는 플랫폼(Windows)은 uvicorn 자체 멀티프로세스(spawn)로 대신 — 프리로드/RSS 한도 없음
+# 워커별 상태(좋아요 버퍼, 이벤트 구독, 프로세스 내 캐시, 해시 프로세스 풀)는 워커마다 따로 생김
+import argparse
+import logging
+import os
+import random
+import signal
+import socket
+import threading
+import time
+
+import uvicorn
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.server")
+
+APP = "app.main:app"
+RSS_CHECK_SECONDS = 10
+RESPAWN_BACKOFF_SECONDS = 1.0  # 기동 직후 죽는 워커를 곧바로 다시 띄우며 CPU를 태우지 않게
+KILL_MARGIN_SECONDS = 5
+
+
+def _options(host: str, port: int) -> dict:
+    """uvicorn.Config / uvicorn.run 공통 옵션"""
+    max_requests = settings.SERVER_MAX_REQUESTS
+    if max_requests and settings.SERVER_MAX_REQUESTS_JITTER:
+        max_requests += random.randint(0, settings.SERVER_MAX_REQUESTS_JITTER)
+    return {
+        "host": host,
+        "port": port,
+        "loop": "auto",  # uvloop가 있으면 uvloop, 없으면 asyncio
+        "http": "httptools",
+        "ws": "websockets-sansio",
+        "lifespan": "on",
+        "backlog": settings.SERVER_BACKLOG,
+        "timeout_keep_alive": settings.SERVER_KEEPALIVE_SECONDS,
+        "timeout_graceful_shutdown": settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        "limit_concurrency": settings.SERVER_LIMIT_CONCURRENCY or None,
+        "limit_max_requests": max_requests or None,
+        "access_log": settings.SERVER_ACCESS_LOG,
+        "server_header": False,
+        "proxy_headers": True,
+    }
+
+
+def _raise_nofile_limit() -> None:
+    """열린 파일 수 soft 한도를 hard까지 — keep-alive/SSE/WebSocket 연결이 많은 워커용 (워커가 상속)"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def _rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:  # /proc가 없는 플랫폼(macOS): 최대 RSS (bytes 단위)
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**20
+
+
+# ------------------------------
+# 워커 (fork된 자식)
+# ------------------------------
+def _after_fork() -> None:
+    """부모에서 만든 풀의 연결은 부모 소유 — 닫지 않고 버린 뒤 워커가 새로 연결"""
+    from app.database import POOLS
+
+    for engine in POOLS.values():
+        engine.dispose(close=False)
+    random.seed()
+
+
+def _watch_rss(server: uvicorn.Server) -> None:
+    while not server.should_exit:
+        time.sleep(RSS_CHECK_SECONDS)
+        rss = _rss_mb()
+        if rss > settings.SERVER_MAX_RSS_MB:
+            logger.warning("worker %d RSS %.0fMB > SERVER_MAX_RSS_MB, draining for restart", os.getpid(), rss)
+            server.should_exit = True  # 요청 수 한도와 같은 경로로 마무리 후 종료
+
+
+def _run_worker(app, sock: socket.socket, host: str, port: int) -> None:
+    _after_fork()
+    server = uvicorn.Server(uvicorn.Config(app, **_options(host, port)))
+    if settings.SERVER_MAX_RSS_MB > 0:
+        threading.Thread(target=_watch_rss, args=(server,), daemon=True).start()
+    server.run(sockets=[sock])  # SIGTERM/SIGINT는 uvicorn이 받아 graceful shutdown
+
+
+def _fork_worker(app, sock: socket.socket, host: str, port: int) -> int:
+    pid = os.fork()
+    if pid:
+        return pid
+    code = 0
+    try:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)  # 부모의 핸들러 대신 uvicorn이 설치
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        _run_worker(app, sock, host, port)
+    except BaseException:
+        logger.exception("worker %d crashed", os.getpid())
+        code = 1
+    finally:
+        os._exit(code)
+
+
+# ------------------------------
+# 감독 (부모)
+# ------------------------------
+def _supervise(app, sock: socket.socket, workers: int, host: str, port: int) -> None:
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    started: dict[int, float] = {}
+    for _ in range(workers):
+        started[_fork_worker(app, sock, host, port)] = time.monotonic()
+    logger.info("serving on %s:%d with %d workers %s", host, port, workers, sorted(started))
+
+    while not stopping:
+        time.sleep(0.2)
+        while started:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                break
+            lifetime = time.monotonic() - started.pop(pid, 0.0)
+            code = os.waitstatus_to_exitcode(status)
+            if stopping:
+                break
+            logger.warning("worker %d exited (code %d) after %.0fs, respawning", pid, code, lifetime)
+            if code != 0 and lifetime < RESPAWN_BACKOFF_SECONDS:
+                time.sleep(RESPAWN_BACKOFF_SECONDS)
+            started[_fork_worker(app, sock, host, port)] = time.monotonic()
+
+    # 드레인: 워커가 새 연결을 받지 않고 진행 중인 요청을 끝낼 때까지 대기
+    logger.info("draining %d workers", len(started))
+    for pid in started:
+        _signal(pid, signal.SIGTERM)
+    deadline = time.monotonic() + settings.SERVER_GRACEFUL_TIMEOUT_SECONDS + KILL_MARGIN_SECONDS
+    while started and time.monotonic() < deadline:
+        pid, _ = os.waitpid(-1, os.WNOHANG)
+        if pid:
+            started.pop(pid, None)
+        else:
+            time.sleep(0.1)
+    for pid in started:
+        logger.warning("worker %d did not drain in time, killing", pid)
+        _signal(pid, signal.SIGKILL)
+    sock.close()
+
+
+def _signal(pid: int, sig: int) -> None:
+    try:
+        os.kill(pid, sig)
+    except ProcessLookupError:
+        pass
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.server")
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS, help="0이면 CPU 수")
+    parser.add_argument("--host", default=settings.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT)
+    parser.add_argument("--migrate", action="store_true", help="워커를 띄우기 전에 마이그레이션 적용")
+    args = parser.parse_args(argv)
+    workers = args.workers or os.cpu_count() or 1
+
+    logging.basicConfig(format="%(asctime)s [%(process)d] %(levelname)s %(name)s: %(message)s")
+    logger.setLevel(logging.INFO)  # 감독 로그만 INFO (다른 라이브러리는 기본 WARNING, 워커 로그는 uvicorn 설정)
+    _raise_nofile_limit()
+    if args.migrate:
+        from app.cli import migrate
+        migrate()
+
+    if not hasattr(os, "fork"):
+        uvicorn.run(APP, workers=workers, **_options(args.host, args.port))
+        return
+
+    from app.main import app  # 프리로드 — 워커는 fork로 이 상태를 물려받음
+
+    config = uvicorn.Config(app, **_options(args.host, args.port))
+    sock = config.bind_socket()  # SO_REUSEADDR + listen(SERVER_BACKLOG), 워커에 상속
+    _supervise(app, sock, workers, args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
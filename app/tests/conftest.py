@@ -0,0 +1,56 @@
+# app/tests/conftest.py
+# 목적: 테스트 공용 — 임시 SQLite DB로 설정을 바꾼 뒤 앱 import, 마이그레이션, 사용자/글 픽스처
+# app 모듈 import 전에 환경변수를 채워야 Settings()가 임시 DB를 바라본다 (benchmarks.common과 같은 방식)
+import itertools
+import os
+import tempfile
+
+_tmpdir = tempfile.mkdtemp(prefix="board-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmpdir, 'test.db')}"
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ["QUERY_BUDGET_ENFORCE"] = "true"  # 쿼리 예산을 넘는 요청은 예외로 실패
+os.environ["RESPONSE_CACHE_TTL_SECONDS"] = "0"
+os.environ["HOT_REFRESH_SECONDS"] = "0"
+os.environ["POST_PURGE_SECONDS"] = "0"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.cli import migrate  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.database import engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.post import Post  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+_ids = itertools.count()
+
+
+@pytest.fixture(scope="session")
+def client():
+    migrate()
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def make_user(client):
+    """사용자 행을 바로 만들고 (user_id, 인증 헤더) 반환 — 비밀번호 해시는 더미 값"""
+    def make() -> tuple[str, dict]:
+        user_id = f"user{next(_ids):05d}"
+        with engine.begin() as conn:
+            conn.execute(User.__table__.insert(), {"user_id": user_id, "username": user_id,
+                                                   "email": f"{user_id}@example.com", "password": "x"})
+        return user_id, {"Authorization": f"Bearer {create_access_token(subject=user_id)}"}
+    return make
+
+
+@pytest.fixture
+def make_post(client):
+    def make(author_id: str) -> int:
+        with engine.begin() as conn:
+            return conn.execute(
+                Post.__table__.insert().returning(Post.post_id),
+                {"title": "title", "content": "content", "author_id": author_id},
+            ).scalar_one()
+    return make
@@ -0,0 +1,104 @@
+# app/tests/test_bulk.py
+# NDJSON 대량 내보내기/가져오기: 내보낸 줄을 그대로 다시 가져오기, 잘못된 줄은 줄 번호와 함께 건너뜀,
+# 줄의 ID는 무시하고 새로 부여 (같은 ID가 두 번 나와도 충돌 없음), 없는 글의 댓글은 실패로 집계
+import json
+
+from app.core import bulk
+from app.core.config import settings
+
+
+def _export(client, url: str, headers: dict, **params) -> list[dict]:
+    r = client.get(url, params=params, headers=headers)
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith(bulk.NDJSON_MEDIA_TYPE)
+    return [json.loads(line) for line in r.text.splitlines()]
+
+
+def _import(client, url: str, headers: dict, lines: list) -> dict:
+    body = "\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines)
+    r = client.post(url, content=body.encode(), headers=headers)
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def test_post_export_import_round_trip(client, make_user, monkeypatch):
+    monkeypatch.setattr(settings, "BULK_CHUNK_ROWS", 2)  # 청크 여러 개로 나눠 읽고/넣기
+    author_id, headers = make_user()
+    importer_id, importer_headers = make_user()
+    for i in range(5):
+        client.post("/posts", json={"title": f"bulk {i}", "content": f"body {i}"}, headers=headers).raise_for_status()
+    exported = _export(client, "/bulk/posts", headers, author_id=author_id)
+
+    result = _import(client, "/bulk/posts", importer_headers, exported)
+
+    assert result == {"inserted": 5, "failed": 0, "errors": []}
+    imported = _export(client, "/bulk/posts", headers, author_id=importer_id)
+    assert [(p["title"], p["content"]) for p in imported] == [(p["title"], p["content"]) for p in exported]
+    # ID/카운터/작성자는 새로 부여
+    assert {p["author_id"] for p in imported} == {importer_id}
+    assert min(p["post_id"] for p in imported) > max(p["post_id"] for p in exported)
+
+
+def test_comment_import_updates_counts(client, make_user, make_post):
+    user_id, headers = make_user()
+    post_id = make_post(user_id)
+    for content in ("one", "two"):
+        client.post("/comments", json={"post_id": post_id, "content": content}, headers=headers).raise_for_status()
+    exported = _export(client, "/bulk/comments", headers, post_id=post_id)
+
+    result = _import(client, "/bulk/comments", headers, exported)
+
+    assert (result["inserted"], result["failed"]) == (2, 0)
+    assert [c["content"] for c in _export(client, "/bulk/comments", headers, post_id=post_id)] == \
+        ["one", "two", "one", "two"]
+    assert client.get(f"/posts/{post_id}").json()["comments_count"] == 4
+
+
+def test_malformed_lines_are_skipped_with_line_numbers(client, make_user):
+    user_id, headers = make_user()
+    lines = [
+        {"title": "ok 1", "content": "c"},
+        "{not json",
+        "",  # 빈 줄은 건너뛰지만 줄 번호는 셈
+        {"title": "", "content": "c"},
+        {"content": "no title"},
+        {"title": "ok 2", "content": "c"},
+    ]
+
+    result = _import(client, "/bulk/posts", headers, lines)
+
+    assert (result["inserted"], result["failed"]) == (2, 3)
+    assert [e["line"] for e in result["errors"]] == [2, 4, 5]
+    assert result["errors"][0]["errors"][0]["type"] == "json_invalid"
+    assert result["errors"][1]["errors"][0]["loc"] == ["title"]
+    assert result["errors"][2]["errors"][0]["type"] == "missing"
+    assert [p["title"] for p in _export(client, "/bulk/posts", headers, author_id=user_id)] == ["ok 1", "ok 2"]
+
+
+def test_duplicate_ids_get_new_rows(client, make_user):
+    user_id, headers = make_user()
+    line = {"post_id": 1, "title": "dup", "content": "c", "author_id": "someone-else"}
+
+    result = _import(client, "/bulk/posts", headers, [line, line])
+
+    assert result == {"inserted": 2, "failed": 0, "errors": []}
+    posts = _export(client, "/bulk/posts", headers, author_id=user_id)
+    assert len({p["post_id"] for p in posts}) == 2
+
+
+def test_comment_for_missing_post_fails_only_that_line(client, make_user, make_post, monkeypatch):
+    monkeypatch.setattr(settings, "BULK_MAX_ERRORS", 1)
+    user_id, headers = make_user()
+    post_id = make_post(user_id)
+    missing = post_id + 10_000
+
+    result = _import(client, "/bulk/comments", headers, [
+        {"post_id": missing, "content": "lost"},
+        {"post_id": post_id, "content": "kept"},
+        {"post_id": missing, "content": "lost too"},
+    ])
+
+    # failed는 전체 수, errors는 BULK_MAX_ERRORS개까지
+    assert (result["inserted"], result["failed"]) == (1, 2)
+    assert [(e["line"], e["errors"][0]["type"]) for e in result["errors"]] == [(1, "post_not_found")]
+    assert client.get(f"/posts/{post_id}").json()["comments_count"] == 1
@@ -0,0 +1,77 @@
+# app/tests/test_events.py
+# 실시간 알림: 좋아요/댓글이 구독자에게 전달되고, 클라이언트가 끊으면 구독이 해제됨 (WebSocket, SSE)
+import time
+
+import pytest
+
+from app.core import events
+from app.core.config import settings
+from app.routers.events import stream_events
+
+
+@pytest.fixture(autouse=True)
+def no_coalesce(monkeypatch):
+    """좋아요 수를 모으지 않고 바로 발행 — 이벤트를 기다리는 시간을 줄임"""
+    monkeypatch.setattr(settings, "EVENTS_COALESCE_MS", 0)
+
+
+def _wait_subscribers(expected: int) -> None:
+    """구독/해제는 앱 쪽 태스크에서 일어나므로 잠깐 기다림"""
+    for _ in range(100):
+        if events.subscribers() == expected:
+            return
+        time.sleep(0.01)
+    assert events.subscribers() == expected
+
+
+def test_like_and_comment_reach_websocket_subscriber(client, make_user, make_post):
+    user_id, headers = make_user()
+    post_id = make_post(user_id)
+    before = events.subscribers()
+
+    with client.websocket_connect(f"/events/ws?post_id={post_id}") as ws:
+        _wait_subscribers(before + 1)
+        client.put(f"/posts/{post_id}/like", headers=headers).raise_for_status()
+        like = ws.receive_json()
+        comment_id = client.post("/comments", json={"post_id": post_id, "content": "hi"},
+                                 headers=headers).json()["comment_id"]
+        comment = ws.receive_json()
+
+    assert (like["type"], like["post_id"], like["data"]["likes_count"]) == ("post.likes", post_id, 1)
+    assert (comment["type"], comment["data"]["comment_id"]) == ("comment.created", comment_id)
+    _wait_subscribers(before)  # 연결을 닫으면 구독 해제
+
+
+def test_websocket_for_other_post_gets_nothing(client, make_user, make_post):
+    user_id, headers = make_user()
+    post_id, other_id = make_post(user_id), make_post(user_id)
+
+    with client.websocket_connect(f"/events/ws?post_id={other_id}") as ws:
+        client.put(f"/posts/{post_id}/like", headers=headers).raise_for_status()
+        client.put(f"/posts/{other_id}/like", headers=headers).raise_for_status()
+        event = ws.receive_json()
+
+    # 다른 글의 이벤트가 먼저 오지 않음
+    assert (event["type"], event["post_id"]) == ("post.likes", other_id)
+
+
+def test_sse_stream_unsubscribes_when_client_goes_away(client, make_user, make_post):
+    user_id, _ = make_user()
+    post_id = make_post(user_id)
+    before = events.subscribers()
+
+    async def run() -> tuple[bytes, bytes, int]:
+        body = (await stream_events(post_id)).body_iterator
+        first = await body.__anext__()  # 본문이 시작될 때 구독
+        events.publish("comment.created", post_id, comment_id=1)
+        event = await body.__anext__()
+        subscribed = events.subscribers()
+        await body.aclose()  # 클라이언트 연결이 끊겨 서버가 본문을 닫음
+        return first, event, subscribed
+
+    first, event, subscribed = client.portal.call(run)
+
+    assert first.startswith(b"retry:")
+    assert event.startswith(b"id: ") and b"event: comment.created\n" in event
+    assert subscribed == before + 1
+    assert events.subscribers() == before
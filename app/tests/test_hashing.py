@@ -0,0 +1,44 @@
+# app/tests/test_hashing.py
+# bcrypt 프로세스 풀: 워커가 죽어도(OOM kill 등) 이후 가입/로그인이 500이 되지 않아야 함
+from concurrent.futures.process import BrokenProcessPool
+
+from app.core import hashing
+from app.core.config import settings
+
+
+def _signup(client, name: str):
+    return client.post("/users/signup", json={"user_id": name, "username": name,
+                                              "email": f"{name}@example.com", "password": "secret-pw"})
+
+
+def test_killed_hash_worker_is_replaced(client, monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+    assert _signup(client, "poolkill1").status_code == 201
+    pool = hashing._pool
+    for process in list(pool._processes.values()):
+        process.kill()
+        process.join()
+
+    assert _signup(client, "poolkill2").status_code == 201
+    r = client.post("/users/login", data={"username": "poolkill2", "password": "secret-pw"})
+    assert r.status_code == 200
+    assert hashing._pool is not pool
+
+
+class _BrokenPool:
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, **kwargs):
+        pass
+
+
+def test_pool_that_stays_broken_returns_503(client, monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+    monkeypatch.setattr(hashing, "_get_pool", _BrokenPool)
+
+    r = _signup(client, "poolbroken")
+
+    assert r.status_code == 503
+    assert r.headers["Retry-After"] == "1"
+    assert hashing._pending == 0
@@ -0,0 +1,60 @@
+# app/tests/test_http_cache.py
+# 조건부 GET: 같은 초에 두 번 수정해도(updated_at은 초 단위) 새 ETag로 200 — 옛 사본에 304를 주면 안 됨
+from sqlalchemy import select, update
+
+from app.database import engine
+from app.models.post import Post
+
+
+def _updated_at(post_id: int):
+    with engine.connect() as conn:
+        return conn.scalar(select(Post.updated_at).where(Post.post_id == post_id))
+
+
+def _set_updated_at(post_id: int, value) -> None:
+    with engine.begin() as conn:
+        conn.execute(update(Post).where(Post.post_id == post_id).values(updated_at=value))
+
+
+def _edit_twice_in_same_second(client, post_id: int, headers: dict, url: str, params: dict | None = None):
+    """첫 수정 뒤 받은 ETag, 두 번째 수정 뒤 그 ETag로 보낸 조건부 GET 응답"""
+    client.patch(f"/posts/{post_id}", json={"title": "first"}, headers=headers).raise_for_status()
+    first = client.get(url, params=params)
+    assert first.status_code == 200
+    edited_at = _updated_at(post_id)
+
+    client.patch(f"/posts/{post_id}", json={"title": "second"}, headers=headers).raise_for_status()
+    _set_updated_at(post_id, edited_at)  # 두 수정이 같은 초에 일어난 경우
+
+    second = client.get(url, params=params, headers={"If-None-Match": first.headers["ETag"]})
+    return first, second
+
+
+def test_detail_etag_changes_on_edit_within_same_second(client, make_user, make_post):
+    user_id, headers = make_user()
+    post_id = make_post(user_id)
+
+    first, second = _edit_twice_in_same_second(client, post_id, headers, f"/posts/{post_id}")
+
+    assert second.status_code == 200
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert second.json()["title"] == "second"
+
+
+def test_list_etag_changes_on_edit_within_same_second(client, make_user, make_post):
+    user_id, headers = make_user()
+    post_id = make_post(user_id)
+
+    first, second = _edit_twice_in_same_second(client, post_id, headers, "/posts", {"ids": str(post_id)})
+
+    assert second.status_code == 200
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert [p["title"] for p in second.json()] == ["second"]
+
+
+def test_unchanged_post_is_not_modified(client, make_user, make_post):
+    user_id, _ = make_user()
+    post_id = make_post(user_id)
+    etag = client.get(f"/posts/{post_id}").headers["ETag"]
+
+    assert client.get(f"/posts/{post_id}", headers={"If-None-Match": etag}).status_code == 304
@@ -0,0 +1,75 @@
+# app/tests/test_like_buffer.py
+# 좋아요 쓰기 버퍼: 반영(flush) 도중 글이 삭제되면 그 글의 좋아요는 쓰지도, 다시 대기열에 넣지도 않음
+import asyncio
+
+import pytest
+from sqlalchemy import delete, func, select
+
+from app.core import like_buffer
+from app.core.config import settings
+from app.database import engine
+from app.models.like import Like
+from app.models.post import Post
+
+
+@pytest.fixture
+def buffered_like(client, make_user, make_post, monkeypatch):
+    """버퍼에만 기록된 좋아요 (post_id, user_id) — 반영 작업은 돌지 않으므로 flush()를 직접 부름"""
+    monkeypatch.setattr(settings, "LIKE_BUFFER_ENABLED", True)
+    user_id, headers = make_user()
+    post_id = make_post(user_id)
+    assert client.put(f"/posts/{post_id}/like", headers=headers).json()["liked"] is True
+    yield post_id, user_id
+    like_buffer.forget_post(post_id)
+
+
+def _flush_while_post_deleted(client, monkeypatch, post_id: int, user_id: str, fail: bool) -> bool:
+    """반영이 시작된 뒤 글을 지우고 forget_post — 그 시점의 내 좋아요 오버레이 값 반환"""
+    apply = like_buffer._apply
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_apply(db, batch):
+        started.set()
+        await release.wait()
+        await apply(db, batch)
+        if fail:
+            raise RuntimeError("flush failed")
+
+    monkeypatch.setattr(like_buffer, "_apply", slow_apply)
+
+    async def run() -> bool:
+        task = asyncio.create_task(like_buffer.flush())
+        await started.wait()
+        with engine.begin() as conn:
+            conn.execute(delete(Post).where(Post.post_id == post_id))
+        like_buffer.forget_post(post_id)
+        overlay = like_buffer.liked(post_id, user_id, False)
+        release.set()
+        try:
+            await task
+        except RuntimeError:
+            pass
+        return overlay
+
+    return client.portal.call(run)
+
+
+def _likes(post_id: int) -> int:
+    with engine.connect() as conn:
+        return conn.scalar(select(func.count()).select_from(Like).where(Like.post_id == post_id))
+
+
+def test_forget_post_drops_in_flight_likes(client, buffered_like, monkeypatch):
+    overlay = _flush_while_post_deleted(client, monkeypatch, *buffered_like, fail=False)
+
+    assert overlay is False
+    assert _likes(buffered_like[0]) == 0
+    assert like_buffer._flushing == {}
+
+
+def test_failed_flush_does_not_requeue_deleted_post(client, buffered_like, monkeypatch):
+    post_id, user_id = buffered_like
+
+    _flush_while_post_deleted(client, monkeypatch, post_id, user_id, fail=True)
+
+    assert not [key for key in like_buffer._pending if key[0] == post_id]
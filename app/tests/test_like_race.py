@@ -0,0 +1,55 @@
+# app/tests/test_like_race.py
+# 좋아요 동시성: 같은 글에 병렬 토글/PUT/DELETE — 5xx가 없고 posts.likes_count가 likes 행 수와 같아야 함
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func, select
+
+from app.database import engine
+from app.models.like import Like
+from app.models.post import Post
+
+
+def _counts(post_id: int) -> tuple[int, int]:
+    """(posts.likes_count, 실제 likes 행 수)"""
+    with engine.connect() as conn:
+        return (
+            conn.scalar(select(Post.likes_count).where(Post.post_id == post_id)),
+            conn.scalar(select(func.count()).select_from(Like).where(Like.post_id == post_id)),
+        )
+
+
+def _fire(client, jobs: list[tuple[str, str, dict]]) -> list[int]:
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        return list(pool.map(lambda job: client.request(job[0], job[1], headers=job[2]).status_code, jobs))
+
+
+def test_parallel_like_requests_keep_count_consistent(client, make_user, make_post):
+    users = [make_user() for _ in range(20)]
+    post_id = make_post(users[0][0])
+    rng = random.Random(11)
+    jobs = [(rng.choice(["POST", "POST", "PUT", "DELETE"]), f"/posts/{post_id}/like", headers)
+            for _, headers in users for _ in range(10)]
+    rng.shuffle(jobs)
+
+    statuses = _fire(client, jobs)
+
+    assert not [code for code in statuses if code >= 500]
+    likes_count, actual = _counts(post_id)
+    assert likes_count == actual
+
+
+def test_parallel_put_and_delete_are_idempotent(client, make_user, make_post):
+    user_id, headers = make_user()
+    post_id = make_post(user_id)
+    url = f"/posts/{post_id}/like"
+
+    statuses = _fire(client, [("PUT", url, headers)] * 20)
+    assert set(statuses) == {200}
+    assert _counts(post_id) == (1, 1)
+    assert client.put(url, headers=headers).json() == {"liked": True, "likes_count": 1}
+
+    statuses = _fire(client, [("DELETE", url, headers)] * 20)
+    assert set(statuses) == {200}
+    assert _counts(post_id) == (0, 0)
+    assert client.delete(url, headers=headers).json() == {"liked": False, "likes_count": 0}
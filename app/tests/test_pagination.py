@@ -0,0 +1,101 @@
+# app/tests/test_pagination.py
+# 키셋 커서: 잘못된 커서는 400, created_at이 같은 행도 빠짐/중복 없이 이어짐, 마지막 페이지에는 X-Next-Cursor 없음
+import base64
+import json
+from datetime import datetime
+
+import pytest
+
+from app.core.pagination import NEXT_CURSOR_HEADER, encode_cursor
+from app.database import engine
+from app.models.comment import Comment
+from app.models.post import Post
+
+TIED_AT = datetime(2000, 1, 1)  # 다른 테스트의 글(현재 시각)보다 오래된 같은 시각
+
+
+def _raw_cursor(value) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip("=")
+
+
+def _walk(client, url: str, params: dict) -> list[list[dict]]:
+    """커서를 따라 끝까지 — 페이지 목록. 마지막 페이지만 커서 헤더가 없어야 함"""
+    pages = []
+    while True:
+        r = client.get(url, params=params)
+        assert r.status_code == 200, r.text
+        pages.append(r.json())
+        if NEXT_CURSOR_HEADER not in r.headers:
+            return pages
+        assert len(pages) < 20
+        params = {**params, "cursor": r.headers[NEXT_CURSOR_HEADER]}
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    _raw_cursor("abc"),
+    _raw_cursor([1, 2, 3]),
+    _raw_cursor(["not a date", 1]),
+    _raw_cursor([None, 1]),
+    _raw_cursor([TIED_AT.isoformat(), "x"]),
+    base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+])
+@pytest.mark.parametrize("url,params", [("/posts", {}), ("/comments", {"post_id": 1})])
+def test_invalid_cursor_is_400(client, url, params, cursor):
+    r = client.get(url, params={**params, "cursor": cursor})
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Invalid cursor"
+
+
+@pytest.mark.parametrize("cursor", [_raw_cursor(["1.5", 1]), _raw_cursor([True, 1]), _raw_cursor([1.5, "x"])])
+def test_invalid_score_cursor_is_400(client, cursor):
+    assert client.get("/posts", params={"sort": "hot", "cursor": cursor}).status_code == 400
+
+
+def test_post_cursor_pages_through_tied_created_at(client, make_user):
+    user_id, _ = make_user()
+    with engine.begin() as conn:
+        ids = [
+            conn.execute(
+                Post.__table__.insert().returning(Post.post_id),
+                {"title": f"tied {i}", "content": "content", "author_id": user_id, "created_at": TIED_AT},
+            ).scalar_one()
+            for i in range(4)
+        ]
+    # 같은 시각의 글 바로 앞에서 시작 — 그보다 오래된 글은 없으므로 이 4개만
+    start = encode_cursor(TIED_AT.replace(second=1), 0)
+
+    pages = _walk(client, "/posts", {"limit": 2, "cursor": start})
+
+    # 행 수가 limit의 배수여도 마지막 페이지에는 다음 커서가 없음 (빈 페이지를 한 번 더 부르지 않음)
+    assert [len(page) for page in pages] == [2, 2]
+    assert [post["post_id"] for page in pages for post in page] == sorted(ids, reverse=True)
+
+
+def test_comment_cursor_pages_through_tied_created_at(client, make_user, make_post):
+    user_id, _ = make_user()
+    post_id = make_post(user_id)
+    with engine.begin() as conn:
+        ids = [
+            conn.execute(
+                Comment.__table__.insert().returning(Comment.comment_id),
+                {"post_id": post_id, "author_id": user_id, "content": f"c{i}", "created_at": TIED_AT},
+            ).scalar_one()
+            for i in range(5)
+        ]
+
+    pages = _walk(client, "/comments", {"post_id": post_id, "limit": 2})
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [c["comment_id"] for page in pages for c in page] == sorted(ids)
+
+
+def test_single_page_has_no_next_cursor(client, make_user, make_post):
+    user_id, headers = make_user()
+    post_id = make_post(user_id)
+    client.post("/comments", json={"post_id": post_id, "content": "only"}, headers=headers).raise_for_status()
+
+    r = client.get("/comments", params={"post_id": post_id, "limit": 5})
+
+    assert len(r.json()) == 1
+    assert NEXT_CURSOR_HEADER not in r.headers
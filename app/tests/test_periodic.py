@@ -0,0 +1,52 @@
+# app/tests/test_periodic.py
+# 백그라운드 주기 작업: wake()면 주기를 기다리지 않고 실행, 실패해도 다음 주기에 계속, stop() 뒤에는 멈춤
+import asyncio
+import logging
+
+from app.core.periodic import PeriodicTask
+
+
+def test_periodic_task_wakes_survives_errors_and_stops(client, caplog):
+    calls = []
+
+    async def job():
+        calls.append(len(calls))
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+
+    task = PeriodicTask("test job", job, interval=lambda: 60)
+
+    async def run() -> None:
+        task.start()
+        assert task.running
+        for expected in (1, 2):
+            task.wake()
+            for _ in range(100):
+                if len(calls) == expected:
+                    break
+                await asyncio.sleep(0.01)
+        await task.stop()
+        task.wake()  # 멈춘 뒤에는 무시
+        await asyncio.sleep(0.01)
+
+    with caplog.at_level(logging.ERROR, logger="app.core.periodic"):
+        client.portal.call(run)
+
+    assert calls == [0, 1]  # 첫 실행이 실패해도 다음 wake에 다시 실행
+    assert not task.running
+    assert [r.getMessage() for r in caplog.records] == ["test job failed"]
+
+
+def test_disabled_periodic_task_does_not_start(client):
+    async def job():
+        raise AssertionError("should not run")
+
+    task = PeriodicTask("off", job, interval=lambda: 0, enabled=lambda: False)
+
+    async def run() -> None:
+        task.start()
+        task.wake()
+        await task.stop()
+
+    client.portal.call(run)
+    assert not task.running
@@ -0,0 +1,33 @@
+# app/tests/test_posts.py
+# 게시글 응답 일관성: 수정 응답의 좋아요 수/내 좋아요가 상세 조회와 같아야 함, 카운터 갱신은 "수정됨"이 아님
+from app.core import like_buffer
+from app.core.config import settings
+
+
+def test_update_response_matches_detail_with_like_buffer(client, make_user, make_post, monkeypatch):
+    user_id, headers = make_user()
+    post_id = make_post(user_id)
+    # 버퍼 모드: 반영 작업이 돌지 않으므로 좋아요는 메모리에만 있음
+    monkeypatch.setattr(settings, "LIKE_BUFFER_ENABLED", True)
+    try:
+        assert client.put(f"/posts/{post_id}/like", headers=headers).json() == {"liked": True, "likes_count": 1}
+
+        updated = client.patch(f"/posts/{post_id}", json={"title": "edited"}, headers=headers).json()
+        detail = client.get(f"/posts/{post_id}", headers=headers).json()
+    finally:
+        like_buffer.forget_post(post_id)
+
+    assert (updated["likes_count"], updated["my_like"]) == (1, True)
+    assert (updated["likes_count"], updated["my_like"]) == (detail["likes_count"], detail["my_like"])
+
+
+def test_likes_and_comments_do_not_mark_post_edited(client, make_user, make_post):
+    user_id, headers = make_user()
+    post_id = make_post(user_id)
+    client.put(f"/posts/{post_id}/like", headers=headers).raise_for_status()
+    client.post("/comments", json={"post_id": post_id, "content": "hi"}, headers=headers).raise_for_status()
+
+    detail = client.get(f"/posts/{post_id}").json()
+
+    assert (detail["likes_count"], detail["comments_count"]) == (1, 1)
+    assert detail["updated_at"] is None
@@ -0,0 +1,83 @@
+# app/tests/test_purge.py
+# 글 삭제: 보통은 ON DELETE CASCADE로 자식 행까지 한 번에, 자식이 많으면 소프트 삭제 후 청크 단위 정리
+# 소프트 삭제된 글과 그 댓글은 정리 전에도 조회/수정/삭제에서 빠짐
+import pytest
+from sqlalchemy import func, select
+
+from app.core import purge
+from app.core.config import settings
+from app.database import engine
+from app.models.comment import Comment
+from app.models.like import Like
+from app.models.post import Post
+
+
+@pytest.fixture
+def busy_post(client, make_user, make_post):
+    """좋아요 3개 + 댓글 3개인 글 — (post_id, 작성자 헤더, 댓글 ID 목록)"""
+    author_id, headers = make_user()
+    post_id = make_post(author_id)
+    for _ in range(3):
+        _, liker = make_user()
+        client.put(f"/posts/{post_id}/like", headers=liker).raise_for_status()
+    comment_ids = [
+        client.post("/comments", json={"post_id": post_id, "content": f"c{i}"}, headers=headers).json()["comment_id"]
+        for i in range(3)
+    ]
+    return post_id, headers, comment_ids
+
+
+def _rows(post_id: int) -> tuple[int, int, int]:
+    """(글, 좋아요, 댓글) 행 수"""
+    with engine.connect() as conn:
+        return tuple(
+            conn.scalar(select(func.count()).select_from(model).where(model.post_id == post_id))
+            for model in (Post, Like, Comment)
+        )
+
+
+def test_hard_delete_cascades_to_children(client, busy_post):
+    post_id, headers, _ = busy_post
+    assert _rows(post_id) == (1, 3, 3)
+
+    assert client.delete(f"/posts/{post_id}", headers=headers).status_code == 204
+
+    assert _rows(post_id) == (0, 0, 0)
+
+
+def test_soft_deleted_post_and_comments_are_hidden(client, busy_post, monkeypatch):
+    monkeypatch.setattr(settings, "POST_PURGE_THRESHOLD", 1)
+    post_id, headers, comment_ids = busy_post
+
+    assert client.delete(f"/posts/{post_id}", headers=headers).status_code == 204
+
+    assert _rows(post_id) == (1, 3, 3)  # 행은 정리 전까지 남음
+    assert client.get(f"/posts/{post_id}").status_code == 404
+    assert client.get("/posts", params={"ids": str(post_id)}).json() == []
+    assert client.delete(f"/posts/{post_id}", headers=headers).status_code == 404
+    assert client.put(f"/posts/{post_id}/like", headers=headers).status_code == 404
+    assert client.post("/comments", json={"post_id": post_id, "content": "late"}, headers=headers).status_code == 404
+    assert client.get("/comments", params={"post_id": post_id}).json() == []
+    comment_id = comment_ids[0]
+    assert client.get(f"/comments/{comment_id}").status_code == 404
+    assert client.patch(f"/comments/{comment_id}", json={"content": "edited"}, headers=headers).status_code == 404
+    assert client.delete(f"/comments/{comment_id}", headers=headers).status_code == 404
+    assert _rows(post_id) == (1, 3, 3)
+
+    client.portal.call(purge.purge)  # 다음 테스트에 대기 글을 남기지 않음
+    assert _rows(post_id) == (0, 0, 0)
+
+
+def test_purge_deletes_soft_deleted_post_in_chunks(client, busy_post, monkeypatch):
+    monkeypatch.setattr(settings, "POST_PURGE_THRESHOLD", 1)
+    monkeypatch.setattr(settings, "POST_PURGE_CHUNK_ROWS", 2)  # 자식 3행 → 청크 2개씩
+    monkeypatch.setattr(settings, "POST_PURGE_PAUSE_MS", 0)
+    post_id, headers, _ = busy_post
+    client.delete(f"/posts/{post_id}", headers=headers).raise_for_status()
+    before = dict(purge.purged_total)
+
+    assert client.portal.call(purge.purge) == 1
+
+    assert _rows(post_id) == (0, 0, 0)
+    assert purge.purged_total == {"posts": before["posts"] + 1, "rows": before["rows"] + 6}
+    assert client.portal.call(purge.purge) == 0  # 남은 대기 글 없음
@@ -0,0 +1,54 @@
+# app/tests/test_query_budget.py
+# 쿼리 예산: conftest가 QUERY_BUDGET_ENFORCE를 켜므로 query_budget(N)을 넘는 요청은 예외로 실패
+# 테스트마다 새 작성자 — 사용자 캐시가 비어 있는 가장 나쁜 경우 (사용자 조회 1문 포함)
+import pytest
+
+# (method, url 템플릿, 요청 kwargs) — {post_id}는 준비한 글
+ANONYMOUS = [
+    ("GET", "/posts", {}),
+    ("GET", "/posts", {"params": {"sort": "hot"}}),
+    ("GET", "/posts", {"params": {"q": "content"}}),
+    ("GET", "/posts", {"params": {"comments": 3, "fields": "content"}}),
+    ("GET", "/posts", {"params": {"ids": "{post_id}"}}),
+    ("GET", "/posts/{post_id}", {}),
+]
+AUTHENTICATED = ANONYMOUS + [
+    ("GET", "/posts/my-likes", {"params": {"ids": "{post_id}"}}),
+    ("POST", "/posts", {"json": {"title": "new", "content": "body"}}),
+    ("PATCH", "/posts/{post_id}", {"json": {"title": "edited"}}),
+    ("POST", "/posts/{post_id}/like", {}),
+    ("PUT", "/posts/{post_id}/like", {}),
+    ("DELETE", "/posts/{post_id}/like", {}),
+]
+
+
+def _fill(kwargs: dict, post_id: int) -> dict:
+    params = {key: str(value).format(post_id=post_id) for key, value in kwargs.get("params", {}).items()}
+    return {**kwargs, "params": params} if params else kwargs
+
+
+@pytest.fixture
+def post(client, make_user, make_post):
+    """좋아요와 댓글이 달린 글과 작성자 인증 헤더 (작성자는 아직 요청한 적 없음 — 사용자 캐시가 빔)"""
+    user_id, headers = make_user()
+    post_id = make_post(user_id)
+    other_id, other_headers = make_user()
+    client.put(f"/posts/{post_id}/like", headers=other_headers).raise_for_status()
+    client.post("/comments", json={"post_id": post_id, "content": "hello"}, headers=other_headers).raise_for_status()
+    return post_id, headers
+
+
+def _request(client, method: str, url: str, kwargs: dict, post_id: int, headers: dict | None):
+    r = client.request(method, url.format(post_id=post_id), headers=headers, **_fill(kwargs, post_id))
+    assert r.status_code < 400, r.text
+    return r
+
+
+@pytest.mark.parametrize("method,url,kwargs", ANONYMOUS)
+def test_anonymous_requests_stay_within_budget(client, post, method, url, kwargs):
+    _request(client, method, url, kwargs, post[0], None)
+
+
+@pytest.mark.parametrize("method,url,kwargs", AUTHENTICATED)
+def test_authenticated_requests_stay_within_budget(client, post, method, url, kwargs):
+    _request(client, method, url, kwargs, *post)
@@ -0,0 +1,42 @@
+# app/tests/test_response_cache.py
+# 익명 목록 응답 캐시: 댓글 생성/수정/삭제 뒤에는 캐시된 페이지가 아니라 새 댓글 수/미리보기가 보여야 함
+import pytest
+
+from app.core import response_cache
+
+
+@pytest.fixture
+def page_cache(monkeypatch):
+    """conftest는 응답 캐시를 끄므로(TTL 0) 이 테스트에서만 켬"""
+    cache = response_cache.post_pages
+    monkeypatch.setattr(cache, "ttl", 60)
+    return cache
+
+
+def _page(client, post_id: int) -> dict:
+    (post,) = client.get("/posts", params={"ids": str(post_id), "comments": 1}).json()
+    return post
+
+
+def _preview(post: dict) -> list[str]:
+    return [c["content"] for c in post["latest_comments"]]
+
+
+def test_comment_writes_invalidate_cached_pages(client, make_user, make_post, page_cache):
+    user_id, headers = make_user()
+    post_id = make_post(user_id)
+    assert _page(client, post_id)["comments_count"] == 0
+    hits = page_cache.hits
+    assert _page(client, post_id)["comments_count"] == 0
+    assert page_cache.hits == hits + 1  # 두 번째는 캐시에서
+
+    comment = client.post("/comments", json={"post_id": post_id, "content": "first"}, headers=headers).json()
+    post = _page(client, post_id)
+    assert (post["comments_count"], _preview(post)) == (1, ["first"])
+
+    client.patch(f"/comments/{comment['comment_id']}", json={"content": "edited"}, headers=headers).raise_for_status()
+    assert _preview(_page(client, post_id)) == ["edited"]
+
+    client.delete(f"/comments/{comment['comment_id']}", headers=headers).raise_for_status()
+    post = _page(client, post_id)
+    assert (post["comments_count"], _preview(post)) == (0, [])
@@ -0,0 +1,35 @@
+# app/tests/test_search.py
+# 검색 백엔드는 앱 시작 때 확인 — 새 워커의 첫 검색 요청도 스키마 조회 없이 (쿼리 예산 안), 발췌문은 본문을 HTML 이스케이프
+import re
+
+from app.core import search
+
+
+def _statements(response) -> int:
+    return int(re.search(r'desc="(\d+) queries"', response.headers["server-timing"]).group(1))
+
+
+def test_first_search_after_startup_runs_no_extra_statement(client, make_user, make_post, monkeypatch):
+    user_id, headers = make_user()
+    make_post(user_id)
+    client.get("/users/me", headers=headers)  # 사용자 캐시를 채워 두 검색의 조건을 같게
+    monkeypatch.setattr(search, "_backend", search._UNKNOWN)  # 막 뜬 워커
+    client.portal.call(search.load)  # lifespan 시작과 같은 확인
+
+    first = client.get("/posts", params={"q": "content"}, headers=headers)
+    second = client.get("/posts", params={"q": "content"}, headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert search._backend == "sqlite"
+    assert _statements(first) == _statements(second)
+
+
+def test_snippet_escapes_post_content(client, make_user):
+    user_id, headers = make_user()
+    content = '<img src=x onerror=alert(1)> "needle" & more'
+    client.post("/posts", json={"title": "xss", "content": content}, headers=headers).raise_for_status()
+
+    (post,) = client.get("/posts", params={"q": "onerror=alert"}).json()
+
+    assert post["snippet"] == ('&lt;img src=x <mark>onerror=alert</mark>(1)&gt; '
+                               '&quot;needle&quot; &amp; more')
@@ -0,0 +1,119 @@
+# benchmarks/bulk.py
+# 목적: 대량 가져오기/내보내기(/bulk) 처리량과 메모리
+#   single: POST /posts 한 건씩 (요청 1번 + 커밋 1번) — 기존 백필 방식, BASELINE건으로 행/초 추정
+#   import: POST /bulk/posts, /bulk/comments 에 NDJSON 본문을 스트리밍으로 전송 (검증 + 청크 executemany)
+#   export: GET /bulk/posts, /bulk/comments 본문 생성기를 끝까지 소비 (서버 측 커서)
+#   rss: 단계 동안 늘어난 프로세스 최대 RSS — 행 수와 무관하게 일정해야 함
+# 실행: python -m benchmarks.bulk [행 수]   (기본 1000000, 글과 댓글 각각)
+import asyncio
+import os
+import sys
+import time
+
+os.environ.setdefault("RESPONSE_CACHE_TTL_SECONDS", "0")
+os.environ.setdefault("HOT_REFRESH_SECONDS", "0")
+
+import httpx  # noqa: E402
+from pydantic_core import to_json  # noqa: E402
+
+from benchmarks.common import seed_users, auth_headers, client, app  # noqa: E402
+from app.core import bulk  # noqa: E402
+from app.database import async_engine  # noqa: E402
+
+BASELINE = 1_000
+BODY_CHUNK = 64 * 1024
+CONTENT = "lorem ipsum " * 16
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+class _PeakRss:
+    """단계 동안 RSS 최댓값 (생성기 소비 중간중간 sample())"""
+
+    def __init__(self):
+        self.start = self.peak = _rss_mb()
+
+    def sample(self) -> None:
+        self.peak = max(self.peak, _rss_mb())
+
+    @property
+    def grown_mb(self) -> float:
+        return round(self.peak - self.start, 1)
+
+
+async def _body(rows, peak: _PeakRss):
+    buf = []
+    size = 0
+    for row in rows:
+        line = to_json(row) + b"\n"
+        buf.append(line)
+        size += len(line)
+        if size >= BODY_CHUNK:
+            yield b"".join(buf)
+            buf, size = [], 0
+            peak.sample()
+    if buf:
+        yield b"".join(buf)
+
+
+async def _import(path: str, rows, headers: dict) -> dict:
+    peak = _PeakRss()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as c:
+        t0 = time.perf_counter()
+        r = await c.post(path, content=_body(rows, peak), headers=headers)
+        elapsed = time.perf_counter() - t0
+    result = r.raise_for_status().json()
+    return {"inserted": result["inserted"], "failed": result["failed"], "seconds": round(elapsed, 1),
+            "rows/s": round(result["inserted"] / elapsed), "rss_grown_mb": peak.grown_mb}
+
+
+async def _export(stmt) -> dict:
+    peak = _PeakRss()
+    rows = size = 0
+    t0 = time.perf_counter()
+    async for chunk in bulk.export_ndjson(stmt):
+        rows += chunk.count(b"\n")
+        size += len(chunk)
+        peak.sample()
+    elapsed = time.perf_counter() - t0
+    return {"rows": rows, "mb": round(size / 2**20, 1), "seconds": round(elapsed, 1),
+            "rows/s": round(rows / elapsed), "rss_grown_mb": peak.grown_mb}
+
+
+async def _run(n: int, headers: dict) -> None:
+    try:
+        posts = ({"title": f"post {i}", "content": CONTENT} for i in range(n))
+        print(f"import posts     {await _import('/bulk/posts', posts, headers)}")
+        comments = ({"post_id": 1 + i % n, "content": f"comment {i}"} for i in range(n))
+        print(f"import comments  {await _import('/bulk/comments', comments, headers)}")
+        print(f"export posts     {await _export(bulk.posts_query())}")
+        print(f"export comments  {await _export(bulk.comments_query())}")
+    finally:
+        await async_engine.dispose()
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    (author,) = seed_users(1)
+    headers = auth_headers(author)
+
+    c = client()
+    t0 = time.perf_counter()
+    for i in range(BASELINE):
+        c.post("/posts", json={"title": f"single {i}", "content": CONTENT}, headers=headers).raise_for_status()
+    elapsed = time.perf_counter() - t0
+    print(f"rows={n} chunk={bulk.settings.BULK_CHUNK_ROWS}")
+    print(f"single POST /posts x{BASELINE}  rows/s={round(BASELINE / elapsed)} "
+          f"(1M rows ≈ {round(1_000_000 / (BASELINE / elapsed) / 60)} min)")
+    asyncio.run(_run(n, headers))
+
+
+if __name__ == "__main__":
+    main()
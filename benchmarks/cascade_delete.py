@@ -0,0 +1,149 @@
+# benchmarks/cascade_delete.py
+# 목적: 자식 행(좋아요+댓글)이 아주 많은 글 삭제 비용 — 삭제 방식별 소요 시간, 메모리, 다른 쓰기가 막히는 시간
+#   orm:     예전 방식 — ORM cascade가 자식을 모두 읽어 와 한 건씩 DELETE (--orm-rows개로 따로 측정)
+#   cascade: DELETE /posts/{id} → posts 한 문장, 자식은 DB의 ON DELETE CASCADE (문장이 끝날 때까지 쓰기 잠금)
+#   soft:    DELETE /posts/{id} → deleted_at만 찍고 응답, purge()가 POST_PURGE_CHUNK_ROWS행씩 나눠 정리
+#   probe:   삭제/정리 동안 다른 글에 좋아요 PUT/DELETE를 계속 보내 지연(쓰기 잠금 대기)과 실패(잠금 시간 초과) 집계
+# 실행: python -m benchmarks.cascade_delete [--children 1000000] [--orm-rows 100000]
+import argparse
+import asyncio
+import os
+import resource
+import time
+from collections import Counter
+
+os.environ.setdefault("RESPONSE_CACHE_TTL_SECONDS", "0")
+os.environ.setdefault("HOT_REFRESH_SECONDS", "0")
+os.environ.setdefault("POST_PURGE_SECONDS", "0")  # 정리는 이 스크립트가 직접 실행해 시간 측정
+
+import httpx  # noqa: E402
+from sqlalchemy import func, select, update  # noqa: E402
+from sqlalchemy.orm import selectinload  # noqa: E402
+
+from benchmarks.common import (  # noqa: E402
+    app, engine, auth_headers, percentiles, seed_users, seed_posts, seed_comments, seed_likes,
+)
+from app.core import purge  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.database import SessionLocal, async_engine  # noqa: E402
+from app.models.comment import Comment  # noqa: E402
+from app.models.like import Like  # noqa: E402
+from app.models.post import Post  # noqa: E402
+
+PROBE_INTERVAL = 0.02  # 초
+
+
+def _max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _seed_children(post_id: int, users: list[str], n: int) -> None:
+    """좋아요 n/2(사용자마다 1개) + 댓글 n/2, 카운터도 맞춤"""
+    likes = n // 2
+    seed_likes([(post_id, user_id) for user_id in users[:likes]])
+    with engine.begin() as conn:
+        conn.execute(update(Post).where(Post.post_id == post_id).values(likes_count=likes))
+    seed_comments(post_id, n - likes, users[0])
+
+
+def _children(post_id: int) -> int:
+    with engine.connect() as conn:
+        return sum(conn.scalar(select(func.count()).where(table.c.post_id == post_id))
+                   for table in (Like.__table__, Comment.__table__))
+
+
+class _Probe:
+    """다른 글에 좋아요 PUT/DELETE를 번갈아 보내며 지연/상태 기록"""
+
+    def __init__(self, client: httpx.AsyncClient, post_id: int, headers: dict):
+        self.client, self.url, self.headers = client, f"/posts/{post_id}/like", headers
+        self.latencies: list[float] = []
+        self.statuses: Counter = Counter()
+        self._stop = asyncio.Event()
+
+    async def run(self) -> None:
+        methods = ("PUT", "DELETE")
+        i = 0
+        while not self._stop.is_set():
+            t0 = time.perf_counter()
+            r = await self.client.request(methods[i % 2], self.url, headers=self.headers)
+            self.latencies.append((time.perf_counter() - t0) * 1000)
+            self.statuses[r.status_code] += 1
+            i += 1
+            await asyncio.sleep(PROBE_INTERVAL)
+
+    def stop(self) -> dict:
+        self._stop.set()
+        return {"writes": len(self.latencies), **percentiles(self.latencies),
+                "max_ms": round(max(self.latencies, default=0), 1), "statuses": dict(self.statuses)}
+
+
+async def _delete_over_http(post_id: int, probe_post: int, author: str, probe_user: str, then_purge: bool) -> dict:
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            probe = _Probe(client, probe_post, auth_headers(probe_user))
+            task = asyncio.create_task(probe.run())
+            await asyncio.sleep(0.5)  # 삭제 전 기준 지연
+            t0 = time.perf_counter()
+            r = await client.delete(f"/posts/{post_id}", headers=auth_headers(author))
+            result = {"status": r.status_code, "response_s": round(time.perf_counter() - t0, 2)}
+            if then_purge:
+                t1 = time.perf_counter()
+                await purge.purge()
+                result["purge_s"] = round(time.perf_counter() - t1, 2)
+            result["total_s"] = round(time.perf_counter() - t0, 2)
+            probe_result = probe.stop()
+            await task
+    finally:
+        await async_engine.dispose()
+    return {**result, "probe": probe_result}
+
+
+def _orm_delete(post_id: int) -> dict:
+    """passive_deletes 이전 동작 재현: 자식 컬렉션을 세션에 올린 뒤 delete → 자식마다 DELETE"""
+    rss = _max_rss_mb()
+    t0 = time.perf_counter()
+    with SessionLocal() as db:
+        post = db.scalar(select(Post).options(selectinload(Post.likes), selectinload(Post.comments))
+                         .where(Post.post_id == post_id))
+        db.delete(post)
+        db.commit()
+    return {"seconds": round(time.perf_counter() - t0, 2), "max_rss_grown_mb": round(_max_rss_mb() - rss, 1)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="자식 행이 많은 글 삭제")
+    parser.add_argument("--children", type=int, default=1_000_000, help="글 하나의 좋아요+댓글 수")
+    parser.add_argument("--orm-rows", type=int, default=100_000, help="예전 ORM cascade 측정용 자식 수 (0이면 생략)")
+    args = parser.parse_args()
+
+    users = seed_users(max(args.children, args.orm_rows) // 2 + 1)
+    author, probe_user = users[0], users[-1]
+    seed_posts(4, author)  # 1: cascade, 2: soft, 3: orm, 4: probe
+    print(f"children={args.children} chunk={settings.POST_PURGE_CHUNK_ROWS} "
+          f"threshold={settings.POST_PURGE_THRESHOLD} busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}ms")
+
+    _seed_children(1, users, args.children)
+    threshold = settings.POST_PURGE_THRESHOLD
+    settings.POST_PURGE_THRESHOLD = 0  # 항상 바로 삭제
+    rss = _max_rss_mb()
+    result = asyncio.run(_delete_over_http(1, 4, author, probe_user, then_purge=False))
+    print(f"cascade  {result} max_rss_grown_mb={round(_max_rss_mb() - rss, 1)} left={_children(1)}")
+
+    _seed_children(2, users, args.children)
+    settings.POST_PURGE_THRESHOLD = threshold
+    rss = _max_rss_mb()
+    result = asyncio.run(_delete_over_http(2, 4, author, probe_user, then_purge=True))
+    print(f"soft     {result} max_rss_grown_mb={round(_max_rss_mb() - rss, 1)} left={_children(2)}")
+
+    if args.orm_rows:
+        _seed_children(3, users, args.orm_rows)
+        result = _orm_delete(3)
+        rate = args.orm_rows / result["seconds"]
+        print(f"orm      rows={args.orm_rows} {result} "
+              f"(x{args.children // args.orm_rows} ≈ {round(args.children / rate)}s for {args.children} rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# benchmarks/comment_preview.py
+# 목적: 목록 화면에 "댓글 N개" + 최신 댓글을 보여 줄 때의 요청/SQL 수 비교
+#   per_post: GET /posts 후 글마다 GET /comments?post_id= (클라이언트 N+1)
+#   embedded: GET /posts?comments=3 한 번 — comments_count 컬럼 + 윈도 쿼리 1번
+# 실행: python -m benchmarks.comment_preview [글 수] [글당 댓글 수]
+import os
+import sys
+
+os.environ.setdefault("RESPONSE_CACHE_TTL_SECONDS", "0")  # 응답 캐시 제외
+
+from benchmarks.common import seed_users, seed_posts, seed_comments, client, measure  # noqa: E402
+from app.core import instrumentation  # noqa: E402
+
+PREVIEW = 3
+PAGE = 20
+
+
+def _statements(fn) -> int:
+    before = sum(route.statements_total for route in instrumentation.ROUTES.values())
+    fn()
+    return sum(route.statements_total for route in instrumentation.ROUTES.values()) - before
+
+
+def main() -> None:
+    n_posts = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    per_post = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    (author,) = seed_users(1)
+    seed_posts(n_posts, author)
+    for post_id in range(n_posts - PAGE + 1, n_posts + 1):  # 첫 페이지 글에 댓글
+        seed_comments(post_id, per_post, author)
+    c = client()
+
+    def per_post_calls():
+        for post in c.get("/posts", params={"limit": PAGE}).json():
+            c.get("/comments", params={"post_id": post["post_id"], "limit": 100}).raise_for_status()
+
+    def embedded():
+        c.get("/posts", params={"limit": PAGE, "comments": PREVIEW}).raise_for_status()
+
+    print(f"posts={n_posts} page={PAGE} comments/post={per_post} preview={PREVIEW}")
+    for name, fn in (("per_post", per_post_calls), ("embedded", embedded)):
+        requests = 1 + PAGE if name == "per_post" else 1
+        print(f"{name:<9} requests={requests:<3} sql={_statements(fn):<3} {measure(fn)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# benchmarks/common.py
+# 목적: 벤치마크 스크립트 공용 — 임시 DB 설정, 대량 시드, 시간 측정
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+# app 모듈 import 전에 환경변수를 채워야 Settings()가 임시 DB를 바라본다
+_tmpdir = tempfile.mkdtemp(prefix="board-bench-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_tmpdir, 'bench.db')}")
+os.environ.setdefault("SECRET_KEY", "bench-secret")
+
+import httpx  # noqa: E402
+from sqlalchemy import update  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.cli import migrate  # noqa: E402
+from app.main import app  # noqa: E402
+from app.database import engine  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.post import Post  # noqa: E402
+from app.models.comment import Comment  # noqa: E402
+from app.models.like import Like  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+
+CHUNK = 10_000
+BASE_TIME = datetime(2024, 1, 1)
+
+# 앱은 기동 시 스키마를 만들지 않으므로 배포 때처럼 마이그레이션 먼저 (이미 최신이면 아무 일 없음)
+migrate()
+
+
+def bulk_insert(table, rows):
+    with engine.begin() as conn:
+        for i in range(0, len(rows), CHUNK):
+            conn.execute(table.insert(), rows[i:i + CHUNK])
+
+
+def seed_users(n: int, prefix: str = "user") -> list[str]:
+    """비밀번호 해시는 더미 값 — 로그인 벤치가 아니면 bcrypt 비용을 치를 필요 없음"""
+    ids = [f"{prefix}{i:07d}" for i in range(n)]
+    bulk_insert(User.__table__, [
+        {"user_id": uid, "username": uid, "email": f"{uid}@example.com", "password": "x"}
+        for uid in ids
+    ])
+    return ids
+
+
+def seed_posts(n: int, author_id: str, body_size: int = 200) -> None:
+    """created_at을 1초 간격으로 흩뿌려 정렬/커서가 실제 데이터처럼 동작하게 함"""
+    body = "lorem ipsum " * (body_size // 12 + 1)
+    bulk_insert(Post.__table__, [
+        {"title": f"post {i}", "content": body[:body_size], "author_id": author_id,
+         "created_at": BASE_TIME + timedelta(seconds=i)}
+        for i in range(n)
+    ])
+
+
+def seed_comments(post_id: int, n: int, author_id: str) -> None:
+    bulk_insert(Comment.__table__, [
+        {"post_id": post_id, "author_id": author_id, "content": f"comment {i}",
+         "created_at": BASE_TIME + timedelta(seconds=i)}
+        for i in range(n)
+    ])
+    with engine.begin() as conn:
+        conn.execute(update(Post).where(Post.post_id == post_id).values(comments_count=Post.comments_count + n))
+
+
+def seed_likes(pairs: list[tuple[int, str]]) -> None:
+    bulk_insert(Like.__table__, [{"post_id": p, "user_id": u} for p, u in pairs])
+
+
+def client() -> TestClient:
+    return TestClient(app)
+
+
+def auth_headers(user_id: str) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(subject=user_id)}"}
+
+
+def measure(fn, repeat: int = 20) -> dict:
+    """fn을 repeat회 실행해 ms 단위 p50/p95 반환"""
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    return {
+        "p50_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 3),
+    }
+
+
+def percentiles(latencies: list[float]) -> dict:
+    """ms 단위 지연 목록 → p50/p95/p99"""
+    ordered = sorted(latencies)
+
+    def pick(q: float) -> float:
+        return round(ordered[max(int(len(ordered) * q) - 1, 0)], 2) if ordered else 0.0
+
+    return {
+        "p50_ms": round(statistics.median(ordered), 2) if ordered else 0.0,
+        "p95_ms": pick(0.95),
+        "p99_ms": pick(0.99),
+    }
+
+
+async def run_requests(jobs: list[tuple[str, str, dict]], concurrency: int, base_url: str | None = None) -> dict:
+    """(method, url, httpx kwargs) 목록을 동시성 concurrency로 in-process ASGI 호출 (base_url을 주면 실제 HTTP)
+    2xx/3xx가 아닌 응답은 errors로 집계 (예외 대신)"""
+    queue: asyncio.Queue = asyncio.Queue()
+    for job in jobs:
+        queue.put_nowait(job)
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    dropped = [0]
+
+    if base_url:
+        options = {"base_url": base_url, "timeout": 30.0,
+                   "limits": httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)}
+    else:
+        options = {"base_url": "http://bench", "transport": httpx.ASGITransport(app=app)}
+    async with httpx.AsyncClient(**options) as client:
+        async def worker():
+            while not queue.empty():
+                method, url, kwargs = queue.get_nowait()
+                t0 = time.perf_counter()
+                try:
+                    r = await client.request(method, url, **kwargs)
+                except httpx.TransportError:  # 실제 HTTP: 서버가 연결을 끊음 (워커 재시작 등)
+                    dropped[0] += 1
+                    continue
+                latencies.append((time.perf_counter() - t0) * 1000)
+                statuses[r.status_code] += 1
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - t0
+
+    return {
+        "requests": len(latencies),
+        "errors": sum(n for code, n in statuses.items() if code >= 400) + dropped[0],
+        "rps": round(len(latencies) / elapsed, 1),
+        **percentiles(latencies),
+        "statuses": {str(code): n for code, n in sorted(statuses.items())} | ({"dropped": dropped[0]} if dropped[0] else {}),
+    }
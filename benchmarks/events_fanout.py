@@ -0,0 +1,90 @@
+# benchmarks/events_fanout.py
+# 목적: 실시간 이벤트 버스(app.core.events) 팬아웃 비용 측정 — 대부분 한가한 구독자 수천 명
+#   memory:   구독자 1명당 메모리 (Subscription + 대기 중인 소비 태스크, tracemalloc)
+#   publish:  publish() 한 번이 모든 대기열에 넣는 데 걸리는 시간 (이벤트 루프를 막는 시간)
+#   delivery: publish부터 각 소비자가 받을 때까지 지연 p50/p99
+#   coalesce: 한 글에 좋아요 변화 N번 → 실제 발행된 post.likes 수
+# 구독자 절반은 게시판 전체, 나머지는 글 100개에 나눠 구독 — 이벤트는 글 하나(post_id=1)에 발행
+# 실행: python -m benchmarks.events_fanout [구독자 수...]   (기본 1000 5000 10000)
+import asyncio
+import statistics
+import sys
+import time
+import tracemalloc
+
+import benchmarks.common  # noqa: F401  임시 DB/SECRET_KEY 환경변수
+from app.core import events  # noqa: E402
+from app.core.config import settings  # noqa: E402
+
+POSTS = 100
+ROUNDS = 20
+LIKES = 1_000
+
+
+async def _consume(sub: events.Subscription, latencies: list[float], sent: list[float]) -> None:
+    while True:
+        await sub.get()
+        latencies.append(time.perf_counter() - sent[0])
+
+
+async def _fanout(n: int) -> dict:
+    latencies: list[float] = []
+    sent = [0.0]
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    subs = [events.subscribe(None if i % 2 == 0 else 1 + i % POSTS) for i in range(n)]
+    tasks = [asyncio.create_task(_consume(sub, latencies, sent)) for sub in subs]
+    await asyncio.sleep(0)  # 모든 소비자가 get()에서 대기하도록
+    per_sub = (tracemalloc.get_traced_memory()[0] - before) / n
+    tracemalloc.stop()
+
+    receivers = len(events._board) + len(events._by_post.get(1, ()))
+    publish_ms = []
+    for _ in range(ROUNDS):
+        latencies.clear()
+        sent[0] = time.perf_counter()
+        events.publish("comment.created", 1, comment_id=1, content="x" * 100)
+        publish_ms.append((time.perf_counter() - sent[0]) * 1000)
+        while len(latencies) < receivers:
+            await asyncio.sleep(0)
+    latencies.sort()
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    for sub in subs:
+        events.unsubscribe(sub)
+    return {
+        "receivers": receivers,
+        "bytes/sub": round(per_sub),
+        "publish_ms": round(statistics.median(publish_ms), 3),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)] * 1000, 2),
+    }
+
+
+async def _coalesce() -> tuple[int, int]:
+    sub = events.subscribe(1)
+    before = events.published_total
+    for i in range(LIKES):
+        events.likes_changed(1, i + 1)
+    await asyncio.sleep(settings.EVENTS_COALESCE_MS / 1000 + 0.05)
+    last = None
+    while sub._queue:
+        last = await sub.get()
+    events.unsubscribe(sub)
+    return events.published_total - before, last.data["likes_count"]
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 5_000, 10_000]
+    for n in sizes:
+        print(f"subscribers={n:<6} " + " ".join(f"{k}={v}" for k, v in asyncio.run(_fanout(n)).items()))
+    published, last = asyncio.run(_coalesce())
+    print(f"coalesce likes_changed x{LIKES} within {settings.EVENTS_COALESCE_MS}ms "
+          f"-> published={published} likes_count={last}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/feed.py
+# 목적: 인기 피드(sort=hot) 비용 측정
+#   refresh: 최근 활동이 있는 글 K개만 score_dirty일 때 ranking.refresh() 시간 — 테이블 크기와 무관해야 함
+#   page:    GET /posts?sort=hot 첫 페이지/커서 페이지 지연 (점수 인덱스 범위 스캔) vs 기본 최신순
+# 실행: python -m benchmarks.feed [글 수...]   (기본 10000 100000)
+import asyncio
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("RESPONSE_CACHE_TTL_SECONDS", "0")  # 응답 캐시 제외
+os.environ.setdefault("HOT_REFRESH_SECONDS", "0")
+
+from sqlalchemy import text, update  # noqa: E402
+
+from benchmarks.common import seed_users, seed_posts, client, engine, measure  # noqa: E402
+from app.core import ranking  # noqa: E402
+from app.database import async_engine  # noqa: E402
+from app.models.post import KEEP_UPDATED_AT, Post  # noqa: E402
+
+ACTIVE = (10, 100, 1_000)
+
+
+def _touch(post_ids: list[int]) -> None:
+    """좋아요가 들어온 것처럼 카운터를 올리고 재계산 대상으로 표시"""
+    with engine.begin() as conn:
+        conn.execute(
+            update(Post).where(Post.post_id.in_(post_ids))
+            .values(likes_count=Post.likes_count + 1, score_dirty=True, **KEEP_UPDATED_AT)
+        )
+
+
+async def _refresh_times(total: int, rng: random.Random) -> dict:
+    times = {}
+    try:
+        await ranking.refresh()  # 새로 넣은 글 전체 (마이그레이션 직후 백필과 같은 경로)
+        for k in ACTIVE:
+            _touch(rng.sample(range(1, total + 1), k))
+            t0 = time.perf_counter()
+            n = await ranking.refresh()
+            times[k] = (n, round((time.perf_counter() - t0) * 1000, 2))
+    finally:
+        await async_engine.dispose()
+    return times
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    rng = random.Random(42)
+    (author,) = seed_users(1)
+    c = client()
+    seeded = 0
+    for size in sizes:
+        seed_posts(size - seeded, author)
+        seeded = size
+        with engine.begin() as conn:
+            conn.execute(text("UPDATE posts SET score_dirty = 1"))
+
+        print(f"posts={size}")
+        for k, (n, ms) in asyncio.run(_refresh_times(size, rng)).items():
+            print(f"  refresh active={k:<5} recomputed={n:<5} {ms}ms")
+
+        cursor = c.get("/posts", params={"sort": "hot"}).headers["X-Next-Cursor"]
+        print(f"  latest   page1  {measure(lambda: c.get('/posts'))}")
+        print(f"  hot      page1  {measure(lambda: c.get('/posts', params={'sort': 'hot'}))}")
+        print(f"  hot      cursor {measure(lambda: c.get('/posts', params={'sort': 'hot', 'cursor': cursor}))}")
+
+
+if __name__ == "__main__":
+    main()
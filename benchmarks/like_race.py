@@ -0,0 +1,65 @@
+# benchmarks/like_race.py
+# 목적: 좋아요 동시성 스트레스 — 같은 글에 병렬 토글/PUT/DELETE를 쏟아부어
+#   1) 5xx(IntegrityError 등)가 없고 2) posts.likes_count가 likes 행 수와 일치하는지 확인
+# 실행: python -m benchmarks.like_race [사용자 수] [사용자당 요청 수]
+import asyncio
+import random
+import sys
+import time
+from collections import Counter
+
+import httpx
+from sqlalchemy import text
+
+from benchmarks.common import app, engine, seed_users, seed_posts, auth_headers
+from app.database import async_engine
+
+POSTS = 5
+
+
+async def run(users: list[str], per_user: int) -> Counter:
+    rng = random.Random(11)
+    jobs = []
+    for user_id in users:
+        headers = auth_headers(user_id)
+        for _ in range(per_user):
+            method = rng.choice(["POST", "POST", "PUT", "DELETE"])  # 토글 위주, 더블클릭 흉내
+            jobs.append((method, f"/posts/{rng.randint(1, POSTS)}/like", headers))
+    rng.shuffle(jobs)
+
+    statuses: Counter = Counter()
+    # 처리되지 않은 예외도 500 응답으로 세도록 raise_app_exceptions=False
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            async def fire(method, url, headers):
+                r = await client.request(method, url, headers=headers)
+                statuses[r.status_code] += 1
+            await asyncio.gather(*(fire(*job) for job in jobs))
+    finally:
+        await async_engine.dispose()
+    return statuses
+
+
+def main() -> None:
+    n_users = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    per_user = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    users = seed_users(n_users)
+    seed_posts(POSTS, users[0])
+
+    t0 = time.perf_counter()
+    statuses = asyncio.run(run(users, per_user))
+    print(f"requests={n_users * per_user} in {time.perf_counter() - t0:.1f}s statuses={dict(statuses)}")
+
+    with engine.connect() as conn:
+        mismatched = conn.execute(text(
+            "SELECT p.post_id, p.likes_count, COUNT(l.like_id) AS actual FROM posts p "
+            "LEFT JOIN likes l ON l.post_id = p.post_id GROUP BY p.post_id HAVING p.likes_count != COUNT(l.like_id)"
+        )).all()
+    print("likes_count consistent" if not mismatched else f"MISMATCH: {mismatched}")
+    if mismatched or any(code >= 500 for code in statuses):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
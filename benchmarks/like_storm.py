@@ -0,0 +1,84 @@
+# benchmarks/like_storm.py
+# 목적: 인기 글 하나에 좋아요가 몰릴 때 처리량 비교 — 바로 커밋(direct) vs 쓰기 버퍼(buffered)
+#   각 사용자가 같은 글에 토글을 반복, 끝난 뒤 버퍼를 비우고 likes_count == COUNT(likes) 확인
+# 실행: python -m benchmarks.like_storm [사용자 수] [사용자당 토글 수] [동시성]
+import asyncio
+import statistics
+import sys
+import time
+
+import httpx
+from sqlalchemy import text
+
+from benchmarks.common import app, engine, seed_users, seed_posts, auth_headers
+from app.core import like_buffer
+from app.core.config import settings
+from app.database import async_engine
+
+
+async def _storm(post_id: int, users: list[str], per_user: int, concurrency: int) -> dict:
+    jobs: asyncio.Queue = asyncio.Queue()
+    for _ in range(per_user):
+        for user_id in users:
+            jobs.put_nowait(auth_headers(user_id))
+    total = jobs.qsize()
+    latencies: list[float] = []
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            while not jobs.empty():
+                headers = jobs.get_nowait()
+                t0 = time.perf_counter()
+                (await client.post(f"/posts/{post_id}/like", headers=headers)).raise_for_status()
+                latencies.append((time.perf_counter() - t0) * 1000)
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - t0
+    latencies.sort()
+    return {
+        "rps": round(total / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p99_ms": round(latencies[max(int(len(latencies) * 0.99) - 1, 0)], 2),
+    }
+
+
+async def run(users: list[str], per_user: int, concurrency: int) -> None:
+    settings.LIKE_BUFFER_ENABLED = False
+    print(f"direct:   {await _storm(1, users, per_user, concurrency)}")
+
+    settings.LIKE_BUFFER_ENABLED = True
+    like_buffer.flusher.start()
+    result = await _storm(2, users, per_user, concurrency)
+    await like_buffer.flusher.stop()  # 종료 훅과 같은 경로로 남은 변경 반영
+    await like_buffer.drain()
+    print(f"buffered: {result} flushed={like_buffer.flushed_total}")
+    await async_engine.dispose()
+
+
+def main() -> None:
+    n_users = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    per_user = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    users = seed_users(n_users)
+    seed_posts(2, users[0])
+    print(f"users={n_users} toggles/user={per_user} concurrency={concurrency} "
+          f"flush={settings.LIKE_BUFFER_FLUSH_MS}ms")
+
+    asyncio.run(run(users, per_user, concurrency))
+
+    with engine.connect() as conn:
+        rows = conn.execute(text(
+            "SELECT p.post_id, p.likes_count, COUNT(l.like_id) FROM posts p "
+            "LEFT JOIN likes l ON l.post_id = p.post_id GROUP BY p.post_id"
+        )).all()
+    for post_id, stored, actual in rows:
+        print(f"post {post_id}: likes_count={stored} likes rows={actual}" + ("" if stored == actual else "  MISMATCH"))
+    expected = n_users * (per_user % 2)
+    if any(stored != actual or actual != expected for _, stored, actual in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# benchmarks/load.py
+# 목적: 동시 요청 부하에서 처리량(req/s)과 p50/p99 지연 측정 — 앱을 in-process ASGI로 호출
+# 실행: python -m benchmarks.load [동시성] [총 요청 수]
+import asyncio
+import random
+import sys
+
+from benchmarks.common import seed_users, seed_posts, seed_comments, auth_headers, run_requests
+from app.database import async_engine
+from app.core import metrics
+
+POSTS = 10_000
+
+
+async def run(requests: list[tuple[str, str, dict]], concurrency: int) -> dict:
+    try:
+        return await run_requests(requests, concurrency)
+    finally:
+        # 풀에 남은 aiosqlite 연결 스레드를 루프 종료 전에 정리
+        await async_engine.dispose()
+
+
+def read_mix(n: int, user_id: str) -> list[tuple[str, str, dict]]:
+    """목록 60% / 상세 30% / 댓글 10%, 절반은 로그인 사용자"""
+    rng = random.Random(7)
+    headers = auth_headers(user_id)
+    mix = []
+    for _ in range(n):
+        kwargs = {"headers": headers} if rng.random() < 0.5 else {}
+        roll = rng.random()
+        if roll < 0.6:
+            mix.append(("GET", "/posts", kwargs))
+        elif roll < 0.9:
+            mix.append(("GET", f"/posts/{rng.randint(1, POSTS)}", kwargs))
+        else:
+            mix.append(("GET", "/comments", {"params": {"post_id": 1}, **kwargs}))
+    return mix
+
+
+def main() -> None:
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    total = int(sys.argv[2]) if len(sys.argv) > 2 else 3000
+    (author,) = seed_users(1)
+    seed_posts(POSTS, author)
+    seed_comments(1, 200, author)
+
+    result = asyncio.run(run(read_mix(total, author), concurrency))
+    print(f"concurrency={concurrency} {result}")
+    # 풀 크기 조정 참고용: 체크아웃 대기/오버플로/타임아웃
+    print("".join(line + "\n" for line in metrics.render().splitlines()
+                  if line.startswith("db_pool_") and 'pool="async"' in line), end="")
+
+
+if __name__ == "__main__":
+    main()
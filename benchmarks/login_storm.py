@@ -0,0 +1,78 @@
+# benchmarks/login_storm.py
+# 목적: 로그인 폭주(bcrypt) 중에도 읽기 요청 지연이 유지되는지 측정
+# 실행: python -m benchmarks.login_storm [로그인 요청 수]
+#   PASSWORD_HASH_WORKERS=0 으로 실행하면 스레드풀 실행(이전 방식)과 비교 가능
+import asyncio
+import statistics
+import sys
+import time
+from collections import Counter
+
+import httpx
+
+from benchmarks.common import app, seed_users, seed_posts, bulk_insert
+from app.core.config import settings
+from app.core.hashing import get_password_hash
+from app.database import async_engine
+from app.models.user import User
+
+READS = 400
+READ_CONCURRENCY = 10
+LOGIN_CONCURRENCY = 40
+
+
+async def _reads(client: httpx.AsyncClient, latencies: list[float]) -> None:
+    async def worker(n: int):
+        for _ in range(n):
+            t0 = time.perf_counter()
+            (await client.get("/posts")).raise_for_status()
+            latencies.append((time.perf_counter() - t0) * 1000)
+    await asyncio.gather(*(worker(READS // READ_CONCURRENCY) for _ in range(READ_CONCURRENCY)))
+
+
+async def _logins(client: httpx.AsyncClient, total: int, statuses: Counter) -> None:
+    remaining = [total]
+
+    async def worker():
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            r = await client.post("/users/login", data={"username": "stormer", "password": "password123"})
+            statuses[r.status_code] += 1
+    await asyncio.gather(*(worker() for _ in range(LOGIN_CONCURRENCY)))
+
+
+def _summary(latencies: list[float]) -> str:
+    latencies.sort()
+    return f"p50={statistics.median(latencies):.1f}ms p99={latencies[int(len(latencies) * 0.99) - 1]:.1f}ms"
+
+
+async def run(logins: int) -> None:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        quiet: list[float] = []
+        await _reads(client, quiet)
+        print(f"reads, no logins:    {_summary(quiet)}")
+
+        storm: list[float] = []
+        statuses: Counter = Counter()
+        t0 = time.perf_counter()
+        await asyncio.gather(_reads(client, storm), _logins(client, logins, statuses))
+        elapsed = time.perf_counter() - t0
+        print(f"reads, login storm:  {_summary(storm)}")
+        print(f"logins: {dict(statuses)} in {elapsed:.1f}s")
+    await async_engine.dispose()
+
+
+def main() -> None:
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    (author,) = seed_users(1)
+    seed_posts(1000, author)
+    bulk_insert(User.__table__, [{"user_id": "stormer", "username": "stormer", "email": "stormer@example.com",
+                                  "password": get_password_hash("password123")}])
+    print(f"bcrypt rounds={settings.BCRYPT_ROUNDS} workers={settings.PASSWORD_HASH_WORKERS} "
+          f"queue={settings.PASSWORD_HASH_QUEUE} logins={logins}")
+    asyncio.run(run(logins))
+
+
+if __name__ == "__main__":
+    main()
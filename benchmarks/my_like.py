@@ -0,0 +1,23 @@
+# benchmarks/my_like.py
+# 목적: 좋아요 이력이 많은 사용자의 GET /posts 응답 시간 (my_like 계산 비용 회귀 확인)
+# 실행: python -m benchmarks.my_like [사용자 좋아요 수]
+import sys
+
+from benchmarks.common import seed_users, seed_posts, seed_likes, client, auth_headers, measure
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    light, heavy = seed_users(2)
+    seed_posts(total, light)
+    seed_likes([(post_id, heavy) for post_id in range(1, total + 1)])
+
+    c = client()
+    print(f"posts={total}, heavy user likes={total}, limit=20")
+    for label, headers in [("anonymous", {}), ("no likes", auth_headers(light)), ("heavy liker", auth_headers(heavy))]:
+        stats = measure(lambda: c.get("/posts", headers=headers))
+        print(f"{label:<12} p50={stats['p50_ms']:.2f}ms p95={stats['p95_ms']:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
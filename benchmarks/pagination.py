@@ -0,0 +1,49 @@
+# benchmarks/pagination.py
+# 목적: skip(offset) vs cursor(keyset) 페이지 깊이별 응답 시간 비교
+# 실행: python -m benchmarks.pagination [게시글 수]
+import sys
+
+from app.core.pagination import NEXT_CURSOR_HEADER
+from benchmarks.common import seed_users, seed_posts, seed_comments, client, measure
+
+LIMIT = 20
+DEPTHS = [1, 10, 100, 500, 2000]
+
+
+def _cursor_at(c, url: str, base: dict, page: int) -> str | None:
+    """page번째 페이지를 요청할 커서 (커서 체인을 따라가서 구함)"""
+    cursor = None
+    for _ in range(page - 1):
+        r = c.get(url, params={**base, "limit": LIMIT, **({"cursor": cursor} if cursor else {})})
+        r.raise_for_status()
+        cursor = r.headers.get(NEXT_CURSOR_HEADER)
+    return cursor
+
+
+def run(url: str, base: dict, c, total: int) -> None:
+    print(f"\n{url} {base}  (rows={total}, limit={LIMIT})")
+    print(f"{'page':>6} {'skip p50':>10} {'cursor p50':>11}")
+    for page in DEPTHS:
+        if (page - 1) * LIMIT >= total:
+            break
+        skip = (page - 1) * LIMIT
+        cursor = _cursor_at(c, url, base, page)
+        offset_stats = measure(lambda: c.get(url, params={**base, "limit": LIMIT, "skip": skip}))
+        params = {**base, "limit": LIMIT, **({"cursor": cursor} if cursor else {})}
+        cursor_stats = measure(lambda: c.get(url, params=params))
+        print(f"{page:>6} {offset_stats['p50_ms']:>9.2f}ms {cursor_stats['p50_ms']:>10.2f}ms")
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    (author,) = seed_users(1)
+    seed_posts(total, author)
+    seed_comments(1, total, author)
+
+    c = client()
+    run("/posts", {}, c, total)
+    run("/comments", {"post_id": 1}, c, total)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/projection.py
+# 목적: 목록 2단계 조회에서 엔티티 로드(joinedload) vs 컬럼 프로젝션의 전송 바이트/메모리 비교
+#   entities: select(Post) + joinedload(Post.author) — 본문 전체 + users 행 전체(비밀번호 해시 포함)
+#   columns:  목록 컬럼 + username + SQL에서 자른 content_preview (GET /posts 기본)
+#   columns+content: fields=content 요청
+# 실행: python -m benchmarks.projection [본문 길이] [limit]
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault("RESPONSE_CACHE_TTL_SECONDS", "0")  # 엔드포인트 측정 시 응답 캐시 제외
+
+from sqlalchemy import select, func  # noqa: E402
+from sqlalchemy.orm import Session, joinedload  # noqa: E402
+
+from benchmarks.common import seed_users, seed_posts, client, engine  # noqa: E402
+from app.models.post import Post  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.routers.post import CONTENT_PREVIEW_CHARS  # noqa: E402
+
+
+def _statements(ids: list[int]) -> dict:
+    columns = [
+        Post.post_id, Post.title, Post.author_id, Post.created_at, Post.updated_at, User.username,
+        func.substr(Post.content, 1, CONTENT_PREVIEW_CHARS).label("content_preview"),
+    ]
+    joined = select(*columns).join(User, User.user_id == Post.author_id).where(Post.post_id.in_(ids))
+    return {
+        "entities": select(Post).options(joinedload(Post.author)).where(Post.post_id.in_(ids)),
+        "columns": joined,
+        "columns+content": joined.add_columns(Post.content),
+    }
+
+
+def _fetched_bytes(stmt) -> int:
+    """드라이버가 돌려준 값의 크기 합 (문자열은 UTF-8 길이)"""
+    sql = str(stmt.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(sql).fetchall()
+    return sum(len(str(v).encode()) for row in rows for v in row if v is not None)
+
+
+def _peak_kib(stmt, entities: bool) -> float:
+    with Session(engine) as session:
+        tracemalloc.start()
+        result = session.scalars(stmt).unique().all() if entities else session.execute(stmt).all()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+    return peak / 1024
+
+
+def main() -> None:
+    body_size = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    (author,) = seed_users(1)
+    seed_posts(1000, author, body_size=body_size)
+    ids = list(range(1, limit + 1))
+
+    print(f"body={body_size} chars, rows={limit}")
+    for label, stmt in _statements(ids).items():
+        print(f"{label:<16} fetched={_fetched_bytes(stmt) / 1024:8.1f}KiB "
+              f"peak_mem={_peak_kib(stmt, label == 'entities'):8.1f}KiB")
+
+    c = client()
+    for params in ({"limit": limit}, {"limit": limit, "fields": "content"}):
+        c.get("/posts", params=params)  # 워밍업
+        tracemalloc.start()
+        r = c.get("/posts", params=params)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"GET /posts {params}: response={len(r.content) / 1024:.1f}KiB peak_mem={peak / 1024:.1f}KiB")
+
+
+if __name__ == "__main__":
+    main()
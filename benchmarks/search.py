@@ -0,0 +1,50 @@
+# benchmarks/search.py
+# 목적: GET /posts?q= 검색 — 기존 LIKE 경로 vs FTS 인덱스 경로 응답 시간 비교
+# 실행: python -m benchmarks.search [게시글 수]   (예: 1000000 — 시드에 수 분 소요)
+import os
+import random
+import sys
+from datetime import timedelta
+
+# 캐시 키에 검색 백엔드가 없으므로 LIKE 결과가 FTS 측정에 그대로 재사용되지 않도록 응답 캐시 제외
+os.environ.setdefault("RESPONSE_CACHE_TTL_SECONDS", "0")
+
+from benchmarks.common import seed_users, client, measure, bulk_insert, BASE_TIME  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.models.post import Post  # noqa: E402
+
+VOCAB = [f"word{i}" for i in range(5000)] + ["게시판", "안녕하세요", "공지사항", "질문", "답변"]
+QUERIES = ["word17", "공지사항", "word4999 word1", "nomatch-term"]
+
+
+def seed_random_posts(n: int, author_id: str) -> None:
+    """단어 빈도가 치우친(Zipf 유사) 본문 — 흔한 검색어와 드문 검색어가 섞이도록"""
+    rng = random.Random(42)
+    weights = [1 / (i + 1) for i in range(len(VOCAB))]
+    rows = []
+    for i in range(n):
+        words = rng.choices(VOCAB, weights=weights, k=rng.randint(20, 120))
+        rows.append({"title": " ".join(words[:5]), "content": " ".join(words), "author_id": author_id,
+                     "created_at": BASE_TIME + timedelta(seconds=i)})
+    bulk_insert(Post.__table__, rows)
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    (author,) = seed_users(1)
+    seed_random_posts(total, author)
+
+    c = client()
+    print(f"posts={total}, limit=20")
+    print(f"{'query':<18} {'LIKE p50':>10} {'FTS p50':>10} {'FTS relevance p50':>18}")
+    for q in QUERIES:
+        settings.SEARCH_BACKEND = "like"
+        like = measure(lambda: c.get("/posts", params={"q": q}), repeat=5)
+        settings.SEARCH_BACKEND = "auto"
+        fts = measure(lambda: c.get("/posts", params={"q": q}), repeat=5)
+        ranked = measure(lambda: c.get("/posts", params={"q": q, "sort": "relevance"}), repeat=5)
+        print(f"{q:<18} {like['p50_ms']:>8.1f}ms {fts['p50_ms']:>8.1f}ms {ranked['p50_ms']:>16.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
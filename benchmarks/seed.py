@@ -0,0 +1,153 @@
+# benchmarks/seed.py
+# 목적: 벤치마크용 현실적인 데이터 생성 (대량 INSERT, 재현 가능한 난수 시드)
+# - 게시글 본문 길이: 로그정규 분포 (대부분 짧고 일부 매우 김)
+# - 작성자/댓글/좋아요: 지프(Zipf) 분포 — 소수 글·사용자에 집중
+# - 모든 사용자 비밀번호는 LOGIN_PASSWORD (해시는 한 번만 계산해 공유)
+# 실행: python -m benchmarks.seed --users 10000 --posts 1000000 --comments 3000000 --likes 5000000
+#   DATABASE_URL을 지정하면 그 DB에 생성 (없으면 benchmarks.common의 임시 DB)
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+from datetime import timedelta
+from itertools import accumulate
+
+from sqlalchemy import func, select
+
+from benchmarks.common import BASE_TIME, CHUNK, bulk_insert, engine
+from app.cli import check_counters, refresh_scores
+from app.core.hashing import get_password_hash
+from app.models.comment import Comment
+from app.models.like import Like
+from app.models.post import Post
+from app.models.user import User
+
+LOGIN_PASSWORD = "password123"
+ZIPF_S = 1.1
+BODY_POOL = 5_000  # 미리 만들어 두고 돌려 쓰는 본문 수
+TIME_SPAN = timedelta(days=365)
+
+
+def vocabulary(rng: random.Random, size: int = 3_000) -> list[str]:
+    """검색 시나리오와 공유하는 가짜 단어 (같은 시드면 같은 단어)"""
+    syllables = ["ka", "lo", "mi", "ne", "po", "ru", "si", "ta", "vo", "ze", "an", "el", "in", "or", "us"]
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def _zipf_cum_weights(n: int, rng: random.Random) -> list[float]:
+    """random.choices(cum_weights=)용 누적 가중치 — 매 호출마다 누적합을 다시 계산하지 않도록"""
+    # 순위를 섞어서 인기 글/사용자가 ID 순서와 무관하게 흩어지도록
+    ranks = list(range(1, n + 1))
+    rng.shuffle(ranks)
+    return list(accumulate(1 / r ** ZIPF_S for r in ranks))
+
+
+def _bodies(rng: random.Random, words: list[str]) -> list[str]:
+    bodies = []
+    for _ in range(BODY_POOL):
+        size = int(min(max(rng.lognormvariate(5.5, 1.0), 20), 20_000))
+        parts, length = [], 0
+        while length < size:
+            word = rng.choice(words)
+            parts.append(word)
+            length += len(word) + 1
+        bodies.append(" ".join(parts)[:size])
+    return bodies
+
+
+def _log(message: str, started: float) -> None:
+    print(f"[seed {time.perf_counter() - started:6.1f}s] {message}", file=sys.stderr)
+
+
+def seed(users: int, posts: int, comments: int, likes: int, rng_seed: int = 42) -> dict:
+    rng = random.Random(rng_seed)
+    started = time.perf_counter()
+    words = vocabulary(random.Random(rng_seed))
+
+    password = get_password_hash(LOGIN_PASSWORD)
+    user_ids = [f"user{i:07d}" for i in range(users)]
+    bulk_insert(User.__table__, [
+        {"user_id": uid, "username": uid, "email": f"{uid}@example.com", "password": password}
+        for uid in user_ids
+    ])
+    _log(f"users={users}", started)
+
+    # 좋아요 수를 먼저 정해 posts.likes_count에 바로 기록 (나중에 집계 UPDATE 불필요)
+    post_weights = _zipf_cum_weights(posts, rng)
+    like_counts: Counter = Counter()
+    for i in range(0, likes, CHUNK):
+        like_counts.update(rng.choices(range(1, posts + 1), cum_weights=post_weights, k=min(CHUNK, likes - i)))
+    for post_id, n in like_counts.items():
+        like_counts[post_id] = min(n, users)  # (글, 사용자)당 1개
+
+    author_weights = _zipf_cum_weights(users, rng)
+    bodies = _bodies(rng, words)
+    step = TIME_SPAN / max(posts, 1)
+    for start in range(0, posts, CHUNK):
+        ids = range(start + 1, min(start + CHUNK, posts) + 1)
+        authors = rng.choices(user_ids, cum_weights=author_weights, k=len(ids))
+        bulk_insert(Post.__table__, [
+            {"post_id": post_id, "title": f"{rng.choice(words)} {rng.choice(words)} {post_id}",
+             "content": rng.choice(bodies), "author_id": author,
+             "created_at": BASE_TIME + step * post_id, "likes_count": like_counts.get(post_id, 0)}
+            for post_id, author in zip(ids, authors)
+        ])
+    _log(f"posts={posts}", started)
+
+    rows = []
+    for post_id, n in like_counts.items():
+        rows.extend({"post_id": post_id, "user_id": uid} for uid in rng.sample(user_ids, n))
+        if len(rows) >= CHUNK:
+            bulk_insert(Like.__table__, rows)
+            rows = []
+    bulk_insert(Like.__table__, rows)
+    _log(f"likes={sum(like_counts.values())}", started)
+
+    for start in range(0, comments, CHUNK):
+        n = min(CHUNK, comments - start)
+        targets = rng.choices(range(1, posts + 1), cum_weights=post_weights, k=n)
+        authors = rng.choices(user_ids, cum_weights=author_weights, k=n)
+        bulk_insert(Comment.__table__, [
+            {"post_id": post_id, "author_id": author,
+             "content": " ".join(rng.choices(words, k=rng.randint(3, 30))),
+             "created_at": BASE_TIME + step * post_id + timedelta(seconds=rng.randint(0, 86_400))}
+            for post_id, author in zip(targets, authors)
+        ])
+    _log(f"comments={comments}", started)
+    check_counters(fix=True, names=["comments_count"])  # 글마다 댓글 수를 한 번의 UPDATE로 채움
+    _log("comments_count", started)
+    refresh_scores()  # 인기 피드 점수 (새 글은 모두 재계산 대상)
+    _log("feed scores", started)
+
+    return {"users": users, "posts": posts, "comments": comments, "likes": sum(like_counts.values()),
+            "rng_seed": rng_seed}
+
+
+def is_seeded() -> bool:
+    with engine.connect() as conn:
+        return bool(conn.scalar(select(func.count()).select_from(Post.__table__)))
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--users", type=int, default=2_000)
+    parser.add_argument("--posts", type=int, default=20_000)
+    parser.add_argument("--comments", type=int, default=60_000)
+    parser.add_argument("--likes", type=int, default=100_000)
+    parser.add_argument("--rng-seed", type=int, default=42)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="벤치마크 데이터 생성")
+    add_arguments(parser)
+    args = parser.parse_args()
+    if is_seeded():
+        sys.exit(f"{engine.url}: already has posts — use an empty database")
+    print(seed(args.users, args.posts, args.comments, args.likes, args.rng_seed))
+
+
+if __name__ == "__main__":
+    main()
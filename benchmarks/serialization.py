@@ -0,0 +1,73 @@
+# benchmarks/serialization.py
+# 목적: limit=100 게시글 목록의 직렬화 비용 비교 (DB 없이 ORM 대역 객체 사용)
+#   validated: 모델 생성(검증) → response_model 재검증 → JSON 변환 → json.dumps (FastAPI 기본 경로)
+#   encoder:   모델 생성(검증) → jsonable_encoder → json.dumps
+#   fast:      model_construct → TypeAdapter.dump_json (app.core.serialization)
+# 실행: python -m benchmarks.serialization [행 수]
+import json
+import sys
+from datetime import timedelta
+from types import SimpleNamespace
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from benchmarks.common import measure, BASE_TIME
+from app.core.serialization import post_out
+from app.schemas.post import PostWithAuthorStatsOut
+
+post_list_adapter = TypeAdapter(list[PostWithAuthorStatsOut])
+
+
+def _rows(n: int) -> list[SimpleNamespace]:
+    author = SimpleNamespace(user_id="author", username="author", email="author@example.com", password="x")
+    return [
+        SimpleNamespace(
+            post_id=i, title=f"post {i}", content="lorem ipsum dolor sit amet " * 20,
+            author_id=author.user_id, author=author, likes_count=i % 17,
+            created_at=BASE_TIME + timedelta(seconds=i), updated_at=None,
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def _models(rows) -> list[PostWithAuthorStatsOut]:
+    return [
+        PostWithAuthorStatsOut(
+            post_id=r.post_id, title=r.title, content=r.content, author_id=r.author_id,
+            created_at=r.created_at, updated_at=r.updated_at, author=r.author,
+            likes_count=r.likes_count, my_like=None,
+        )
+        for r in rows
+    ]
+
+
+def validated(rows) -> bytes:
+    # FastAPI serialize_response: 반환값을 response_model로 다시 검증한 뒤 JSON 호환 값으로 변환
+    value = post_list_adapter.validate_python([m.model_dump() for m in _models(rows)])
+    return json.dumps(post_list_adapter.dump_python(value, mode="json"), ensure_ascii=False,
+                      separators=(",", ":")).encode()
+
+
+def encoder(rows) -> bytes:
+    return json.dumps(jsonable_encoder(_models(rows)), ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def fast(rows) -> bytes:
+    return post_list_adapter.dump_json([post_out(r, r.author, r.likes_count) for r in rows])
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    rows = _rows(n)
+    expected = json.loads(validated(rows))
+    print(f"rows={n}")
+    for fn in (validated, encoder, fast):
+        assert json.loads(fn(rows)) == expected, f"{fn.__name__}: output differs"
+        stats = measure(lambda: fn(rows), repeat=200)
+        print(f"{fn.__name__:<10} p50={stats['p50_ms']:.3f}ms ({stats['p50_ms'] * 1000 / n:.1f}us/row) "
+              f"p95={stats['p95_ms']:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
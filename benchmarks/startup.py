@@ -0,0 +1,88 @@
+# benchmarks/startup.py
+# 목적: 워커 기동 시간 측정 — 프로세스 시작부터 첫 요청(GET /)에 응답하기까지
+#   - import: `import app.main`에 걸린 시간 (별도 프로세스에서)
+#   - ready: uvicorn 워커 K개를 동시에 띄웠을 때 각 워커가 첫 응답을 주기까지 (스케일 아웃 상황)
+#   스키마는 측정 전에 `python -m app.cli migrate`로 한 번 만들어 둠
+# 실행: python -m benchmarks.startup [반복 수] [동시 워커 수]
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+IMPORT_SNIPPET = "import time; t = time.perf_counter(); import app.main; print(time.perf_counter() - t)"
+READY_TIMEOUT = 30.0
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _import_seconds(env: dict) -> float:
+    out = subprocess.run([sys.executable, "-c", IMPORT_SNIPPET], env=env, check=True,
+                         capture_output=True, text=True).stdout
+    return float(out.strip().splitlines()[-1])
+
+
+def _ready_seconds(env: dict, workers: int) -> list[float]:
+    """워커 K개를 동시에 띄우고 각자 첫 200 응답까지 걸린 시간"""
+    ports = [_free_port() for _ in range(workers)]
+    started = time.perf_counter()
+    procs = [
+        subprocess.Popen([sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+                          "--log-level", "warning"], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for port in ports
+    ]
+    ready: dict[int, float] = {}
+    try:
+        with httpx.Client(timeout=1.0) as client:
+            while len(ready) < workers:
+                if time.perf_counter() - started > READY_TIMEOUT:
+                    raise RuntimeError(f"workers not ready after {READY_TIMEOUT}s")
+                for port in ports:
+                    if port in ready:
+                        continue
+                    try:
+                        if client.get(f"http://127.0.0.1:{port}/").status_code == 200:
+                            ready[port] = time.perf_counter() - started
+                    except httpx.TransportError:
+                        pass
+                time.sleep(0.005)
+    finally:
+        for proc in procs:
+            proc.terminate()
+        for proc in procs:
+            proc.wait()
+    return list(ready.values())
+
+
+def _summary(samples: list[float]) -> str:
+    samples = sorted(samples)
+    return f"p50={statistics.median(samples) * 1000:7.1f}ms max={samples[-1] * 1000:7.1f}ms"
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='board-bench-'), 'bench.db')}")
+    env.setdefault("SECRET_KEY", "bench-secret")
+    subprocess.run([sys.executable, "-m", "app.cli", "migrate"], env=env, check=True, stdout=subprocess.DEVNULL)
+
+    imports = [_import_seconds(env) for _ in range(runs)]
+    print(f"import app.main        {_summary(imports)}")
+    single = [t for _ in range(runs) for t in _ready_seconds(env, 1)]
+    print(f"ready (1 worker)       {_summary(single)}")
+    many = [t for _ in range(runs) for t in _ready_seconds(env, workers)]
+    print(f"ready ({workers} workers)      {_summary(many)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# benchmarks/suite.py
+# 목적: 시나리오별 부하 테스트 묶음 — 처리량과 p50/p95/p99를 JSON으로 저장하고 기준선과 비교
+#   시나리오: list / hot / search / detail / toggle_like / login / mixed (app.main.app을 in-process ASGI로 호출)
+#   DB가 비어 있으면 benchmarks.seed로 먼저 생성 (같은 DATABASE_URL을 주면 다음 실행부터 재사용)
+# 실행:
+#   python -m benchmarks.suite --out benchmarks/results/base.json
+#   python -m benchmarks.suite --baseline benchmarks/results/base.json --max-regression 10
+import argparse
+import asyncio
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import func, select
+
+from benchmarks.common import auth_headers, engine, run_requests
+from benchmarks.seed import LOGIN_PASSWORD, add_arguments, is_seeded, seed, vocabulary, _zipf_cum_weights
+from app.core.config import settings
+from app.database import async_engine
+from app.models.post import Post
+from app.models.user import User
+
+RESULTS_DIR = Path(__file__).parent / "results"
+AUTH_USERS = 100  # 로그인 사용자 요청에 쓸 토큰 수
+
+
+class Context:
+    """시나리오 생성에 필요한 데이터 규모/토큰/검색어"""
+
+    def __init__(self, rng_seed: int):
+        with engine.connect() as conn:
+            self.posts = conn.scalar(select(func.max(Post.post_id))) or 0
+            self.user_ids = list(conn.scalars(select(User.user_id).order_by(User.user_id).limit(AUTH_USERS)))
+        self.words = vocabulary(random.Random(rng_seed))
+        self.post_weights = _zipf_cum_weights(self.posts, random.Random(rng_seed + 1))
+        self.headers = [auth_headers(uid) for uid in self.user_ids]
+
+    def hot_post(self, rng: random.Random) -> int:
+        return rng.choices(range(1, self.posts + 1), cum_weights=self.post_weights)[0]
+
+    def maybe_auth(self, rng: random.Random) -> dict:
+        """절반은 익명, 절반은 로그인 사용자"""
+        return {"headers": rng.choice(self.headers)} if rng.random() < 0.5 else {}
+
+
+def _list(ctx: Context, rng: random.Random) -> tuple:
+    # 대부분 첫 페이지, 가끔 깊은 페이지
+    skip = 0 if rng.random() < 0.7 else rng.randrange(0, 2_000, 20)
+    return "GET", "/posts", {"params": {"skip": skip, "limit": 20}, **ctx.maybe_auth(rng)}
+
+
+def _hot(ctx: Context, rng: random.Random) -> tuple:
+    return "GET", "/posts", {"params": {"sort": "hot", "limit": 20}, **ctx.maybe_auth(rng)}
+
+
+def _search(ctx: Context, rng: random.Random) -> tuple:
+    return "GET", "/posts", {"params": {"q": rng.choice(ctx.words), "limit": 20}, **ctx.maybe_auth(rng)}
+
+
+def _detail(ctx: Context, rng: random.Random) -> tuple:
+    return "GET", f"/posts/{ctx.hot_post(rng)}", ctx.maybe_auth(rng)
+
+
+def _toggle_like(ctx: Context, rng: random.Random) -> tuple:
+    return "POST", f"/posts/{ctx.hot_post(rng)}/like", {"headers": rng.choice(ctx.headers)}
+
+
+def _login(ctx: Context, rng: random.Random) -> tuple:
+    return "POST", "/users/login", {"data": {"username": rng.choice(ctx.user_ids), "password": LOGIN_PASSWORD}}
+
+
+MIX = [(_list, 50), (_detail, 25), (_search, 10), (_toggle_like, 10), (_login, 5)]
+
+
+def _mixed(ctx: Context, rng: random.Random) -> tuple:
+    make = rng.choices([fn for fn, _ in MIX], weights=[w for _, w in MIX])[0]
+    return make(ctx, rng)
+
+
+# 이름 → (요청 생성기, 요청 수 배율) — 로그인은 bcrypt 비용 때문에 1/10
+SCENARIOS = {
+    "list": (_list, 1.0),
+    "hot": (_hot, 1.0),
+    "search": (_search, 1.0),
+    "detail": (_detail, 1.0),
+    "toggle_like": (_toggle_like, 1.0),
+    "login": (_login, 0.1),
+    "mixed": (_mixed, 1.0),
+}
+
+
+async def run(names: list[str], ctx: Context, requests: int, concurrency: int, rng_seed: int) -> dict:
+    results = {}
+    try:
+        for name in names:
+            make, scale = SCENARIOS[name]
+            rng = random.Random(f"{rng_seed}:{name}")
+            jobs = [make(ctx, rng) for _ in range(max(int(requests * scale), 10))]
+            results[name] = await run_requests(jobs, concurrency)
+            print(f"{name:<12} {_row(results[name])}", file=sys.stderr)
+    finally:
+        await async_engine.dispose()
+    return results
+
+
+def _row(r: dict) -> str:
+    return (f"rps={r['rps']:>8} p50={r['p50_ms']:>8}ms p95={r['p95_ms']:>8}ms p99={r['p99_ms']:>8}ms "
+            f"errors={r['errors']}")
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report: dict, baseline: dict, max_regression: float | None) -> bool:
+    """기준선 대비 변화 출력. max_regression(%)을 넘는 처리량 감소/p95 증가가 있으면 False"""
+    ok = True
+    print(f"\nvs baseline {baseline['meta'].get('commit')} ({baseline['meta'].get('timestamp')})")
+    print(f"{'scenario':<12} {'rps':>18} {'p95 ms':>22}")
+    for name, cur in report["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if not base:
+            continue
+        rps_delta = (cur["rps"] - base["rps"]) / base["rps"] * 100 if base["rps"] else 0.0
+        p95_delta = (cur["p95_ms"] - base["p95_ms"]) / base["p95_ms"] * 100 if base["p95_ms"] else 0.0
+        regressed = max_regression is not None and (rps_delta < -max_regression or p95_delta > max_regression)
+        ok = ok and not regressed
+        print(f"{name:<12} {base['rps']:>7} → {cur['rps']:>7} ({rps_delta:+5.1f}%) "
+              f"{base['p95_ms']:>7} → {cur['p95_ms']:>7} ({p95_delta:+5.1f}%)" + ("  REGRESSION" if regressed else ""))
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="보드 API 벤치마크 묶음")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="쉼표 구분 (기본: 전부)")
+    parser.add_argument("--requests", type=int, default=2_000, help="시나리오당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--out", type=Path, help=f"결과 JSON (기본: {RESULTS_DIR}/suite-<시각>.json)")
+    parser.add_argument("--baseline", type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-regression", type=float, help="허용 악화율(%%) — 넘으면 종료 코드 1")
+    add_arguments(parser)  # 시드 규모 (DB가 비어 있을 때만 사용)
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    dataset = None
+    if not is_seeded():
+        dataset = seed(args.users, args.posts, args.comments, args.likes, args.rng_seed)
+    ctx = Context(args.rng_seed)
+
+    scenarios = asyncio.run(run(names, ctx, args.requests, args.concurrency, args.rng_seed))
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": engine.dialect.name,
+            "dataset": dataset or {"posts": ctx.posts, "reused": True},
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "settings": {key: getattr(settings, key) for key in (
+                "DB_POOL_SIZE", "DB_MAX_OVERFLOW", "BCRYPT_ROUNDS", "PASSWORD_HASH_WORKERS",
+                "RESPONSE_CACHE_TTL_SECONDS", "LIKE_BUFFER_ENABLED",
+            )},
+        },
+        "scenarios": scenarios,
+    }
+
+    out = args.out or RESULTS_DIR / f"suite-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    print(f"saved {out}")
+
+    if args.baseline:
+        if not compare(report, json.loads(args.baseline.read_text()), args.max_regression):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# benchmarks/workers.py
+# 목적: 운영 서버(python -m app.server)의 워커 수별 처리량 — 실제 HTTP(keep-alive)로 suite 시나리오 실행
+#   워커 K개마다 서버를 새로 띄우고(같은 시드 DB) 시나리오별 rps/p95를 측정해 표로 출력
+#   CPU가 충분하면 서버를 CPU K개, 부하 생성기를 나머지 CPU에 고정(sched_setaffinity)해 "코어 K개"를 흉내냄
+#   CPU가 모자라면 고정 없이 실행 — 부하 생성기와 서버가 같은 코어를 나눠 쓰므로 워커를 늘려도 처리량이 늘지 않음
+# 기대치 (코어 = 워커, 부하 생성기는 별도 코어):
+#   list/detail/hot  읽기는 워커끼리 공유하는 것이 없어(SQLite WAL은 읽기끼리 막지 않음) 거의 선형
+#                    — 1→2→4 코어에서 약 1.9x/3.6x, 8코어부터는 커널/DB 파일 I/O와 부하 생성기가 한계
+#   mixed            로그인(bcrypt)은 코어 수만큼 늘지만 좋아요 쓰기는 SQLite 쓰기 잠금 하나를 나눠 씀
+#                    — 워커가 늘수록 쓰기 대기가 p99를 끌어올림 (SQLITE_BUSY_TIMEOUT_MS를 넘으면 500)
+#   1 CPU에서 잰 값 (workers=1, concurrency 64): list 163, detail 207, hot 212, mixed 36 rps
+#   — 워커 2/4/8은 0.9~0.5x (한 코어에서 프로세스 전환 비용만 늘어남)
+# 실행: python -m benchmarks.workers [--workers 1,2,4,8] [--scenarios list,detail,hot,mixed] [--clients 2]
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import Counter
+
+import httpx
+
+from benchmarks.common import run_requests
+from benchmarks.seed import add_arguments, is_seeded, seed
+from benchmarks.startup import _free_port, READY_TIMEOUT
+from benchmarks.suite import SCENARIOS, Context, _row
+
+
+def _start_server(workers: int, port: int, cpus: set[int] | None) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "app.server", "--workers", str(workers), "--port", str(port), "--host", "127.0.0.1"],
+        env={**os.environ, "SERVER_ACCESS_LOG": "false", "HOT_REFRESH_SECONDS": "0"},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        preexec_fn=(lambda: os.sched_setaffinity(0, cpus)) if cpus else None,
+    )
+    started = time.perf_counter()
+    with httpx.Client(timeout=1.0) as client:
+        while time.perf_counter() - started < READY_TIMEOUT:
+            try:
+                if client.get(f"http://127.0.0.1:{port}/").status_code == 200:
+                    return proc
+            except httpx.TransportError:
+                time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError(f"server with {workers} workers not ready after {READY_TIMEOUT}s")
+
+
+def _stop_server(proc: subprocess.Popen) -> None:
+    proc.terminate()  # SIGTERM → 워커 드레인
+    try:
+        proc.wait(timeout=60)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def _client(args: tuple) -> dict:
+    jobs, concurrency, base_url, cpus = args
+    if cpus:
+        os.sched_setaffinity(0, cpus)
+    return asyncio.run(run_requests(jobs, concurrency, base_url))
+
+
+def _load(pool, jobs: list, clients: int, concurrency: int, base_url: str, cpus: set[int] | None) -> dict:
+    """부하 생성 프로세스 clients개가 요청을 나눠 보냄 — rps는 합, 지연은 가장 나쁜 프로세스 값"""
+    parts = [(jobs[i::clients], max(concurrency // clients, 1), base_url, cpus) for i in range(clients)]
+    results = pool.map(_client, parts)
+    merged = {"requests": sum(r["requests"] for r in results), "errors": sum(r["errors"] for r in results),
+              "rps": round(sum(r["rps"] for r in results), 1)}
+    for key in ("p50_ms", "p95_ms", "p99_ms"):
+        merged[key] = max(r[key] for r in results)
+    merged["statuses"] = dict(sum((Counter(r["statuses"]) for r in results), Counter()))
+    return merged
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="워커 수별 HTTP 처리량")
+    parser.add_argument("--workers", default="1,2,4,8", help="쉼표 구분 워커 수")
+    parser.add_argument("--scenarios", default="list,detail,hot,mixed", help="쉼표 구분 (suite 시나리오)")
+    parser.add_argument("--requests", type=int, default=4_000, help="시나리오당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--clients", type=int, default=2, help="부하 생성 프로세스 수")
+    add_arguments(parser)
+    args = parser.parse_args()
+    worker_counts = [int(n) for n in args.workers.split(",")]
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+
+    if not is_seeded():
+        seed(args.users, args.posts, args.comments, args.likes, args.rng_seed)
+    ctx = Context(args.rng_seed)
+    available = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+    print(f"cpus={len(available)} clients={args.clients} concurrency={args.concurrency} requests={args.requests}")
+
+    table: dict[int, dict[str, dict]] = {}
+    with multiprocessing.get_context("fork").Pool(args.clients) as pool:
+        for workers in worker_counts:
+            pinned = len(available) >= workers + args.clients
+            server_cpus = set(available[:workers]) if pinned else None
+            client_cpus = set(available[workers:]) if pinned else None
+            port = _free_port()
+            proc = _start_server(workers, port, server_cpus)
+            try:
+                table[workers] = {}
+                for name in names:
+                    make, scale = SCENARIOS[name]
+                    rng = random.Random(f"{args.rng_seed}:{name}")
+                    jobs = [make(ctx, rng) for _ in range(max(int(args.requests * scale), 10))]
+                    result = _load(pool, jobs, args.clients, args.concurrency, f"http://127.0.0.1:{port}", client_cpus)
+                    table[workers][name] = result
+                    print(f"workers={workers:<2} {'pinned' if pinned else 'shared'} {name:<12} {_row(result)}"
+                          + (f" {result['statuses']}" if result["errors"] else ""), file=sys.stderr)
+            finally:
+                _stop_server(proc)
+
+    base = table[worker_counts[0]]
+    print(f"\n{'workers':<8}" + "".join(f"{name:>22}" for name in names))
+    for workers, results in table.items():
+        cells = [f"{results[name]['rps']:>9} ({results[name]['rps'] / base[name]['rps']:.2f}x)" if base[name]['rps']
+                 else f"{results[name]['rps']:>9}" for name in names]
+        print(f"{workers:<8}" + "".join(f"{cell:>22}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# migrations/env.py
+# 목적: Alembic 실행 환경 — DB 주소는 app 설정(DATABASE_URL), 비교 기준은 app 모델 메타데이터
+# 연결은 앱의 동기 엔진 (SQLite PRAGMA 등 같은 설정). app.cli migrate는 연결을 attributes로 넘김
+from logging.config import fileConfig
+
+from alembic import context
+from app.core import search
+from app.core.config import settings
+from app.database import Base, engine
+import app.models  # noqa: F401  모든 테이블을 메타데이터에 등록
+
+config = context.config
+# alembic CLI로 실행할 때만 로깅 설정 (앱/관리 명령 안에서는 기존 로깅 유지)
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def _include_name(name, type_, parent_names) -> bool:
+    # 검색 인덱스(FTS5 가상 테이블과 그 내부 테이블)는 모델이 아니라 0002 마이그레이션이 관리
+    return not (type_ == "table" and name.startswith(search.FTS_TABLE))
+
+
+def _configure(**kwargs) -> None:
+    context.configure(
+        target_metadata=target_metadata,
+        # SQLite는 ALTER 지원이 제한적이라 테이블 재생성 방식(batch)으로
+        render_as_batch=settings.DATABASE_URL.startswith("sqlite"),
+        compare_type=True,
+        include_name=_include_name,
+        **kwargs,
+    )
+
+
+def run_migrations_offline() -> None:
+    """DB 연결 없이 SQL만 출력 (alembic upgrade head --sql)"""
+    _configure(url=settings.DATABASE_URL, literal_binds=True, dialect_opts={"paramstyle": "named"})
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def _run(connection) -> None:
+    _configure(connection=connection)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run(connection)
+        return
+    with engine.connect() as connection:
+        _run(connection)
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,94 @@
+"""users/posts/comments/likes 초기 스키마
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "users",
+        sa.Column("user_id", sa.String(30), nullable=False),
+        sa.Column("username", sa.String(30), nullable=False),
+        sa.Column("email", sa.String(100), nullable=False),
+        sa.Column("password", sa.String(255), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("user_id"),
+        sa.UniqueConstraint("username", name="uq_users_username"),
+        sa.UniqueConstraint("email", name="uq_users_email"),
+    )
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "posts",
+        sa.Column("post_id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("author_id", sa.String(30), nullable=False),
+        sa.Column("likes_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+        sa.PrimaryKeyConstraint("post_id"),
+        sa.ForeignKeyConstraint(["author_id"], ["users.user_id"], ondelete="CASCADE"),
+    )
+    op.create_index("ix_posts_post_id", "posts", ["post_id"])
+    op.create_index("ix_posts_title", "posts", ["title"])
+    op.create_index("ix_posts_author_id", "posts", ["author_id"])
+    op.create_index("ix_posts_author_created", "posts", ["author_id", "created_at"])
+    op.create_index("ix_posts_created", "posts", ["created_at", "post_id"])
+
+    op.create_table(
+        "comments",
+        sa.Column("comment_id", sa.Integer(), nullable=False),
+        sa.Column("post_id", sa.Integer(), nullable=False),
+        sa.Column("author_id", sa.String(30), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+        sa.PrimaryKeyConstraint("comment_id"),
+        sa.ForeignKeyConstraint(["post_id"], ["posts.post_id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["author_id"], ["users.user_id"], ondelete="CASCADE"),
+    )
+    op.create_index("ix_comments_comment_id", "comments", ["comment_id"])
+    op.create_index("ix_comments_post_id", "comments", ["post_id"])
+    op.create_index("ix_comments_author_id", "comments", ["author_id"])
+    op.create_index("ix_comments_post_created", "comments", ["post_id", "created_at"])
+
+    op.create_table(
+        "likes",
+        sa.Column("like_id", sa.Integer(), nullable=False),
+        sa.Column("post_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.String(30), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("like_id"),
+        sa.ForeignKeyConstraint(["post_id"], ["posts.post_id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.user_id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("post_id", "user_id", name="uq_likes_post_user"),
+    )
+    op.create_index("ix_likes_like_id", "likes", ["like_id"])
+    op.create_index("ix_likes_post_id", "likes", ["post_id"])
+    op.create_index("ix_likes_user_id", "likes", ["user_id"])
+    op.create_index("ix_likes_post_created", "likes", ["post_id", "created_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("likes")
+    op.drop_table("comments")
+    op.drop_table("posts")
+    op.drop_table("users")
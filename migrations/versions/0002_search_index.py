@@ -0,0 +1,34 @@
+"""게시글 전문 검색 인덱스 (SQLite FTS5 / Postgres tsvector)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+
+from app.core import search
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # DDL은 app.core.search에 한 벌만 둠 (rebuild-search 명령과 공유). FTS5 미지원이면 LIKE 검색 유지
+    if context.is_offline_mode():
+        for statement in search.ddl(op.get_context().dialect.name):
+            op.execute(statement)
+        return
+    search.create_index(op.get_bind())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    search.drop_index(op.get_bind())
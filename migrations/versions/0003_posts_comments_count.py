@@ -0,0 +1,33 @@
+"""posts.comments_count 비정규화 컬럼
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # batch(테이블 재생성)를 쓰지 않고 ALTER TABLE ADD COLUMN — posts의 검색 트리거가 그대로 남도록
+    op.add_column("posts", sa.Column("comments_count", sa.Integer(), nullable=False, server_default="0"))
+    op.execute(
+        "UPDATE posts SET comments_count = "
+        "(SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.post_id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("posts", "comments_count")
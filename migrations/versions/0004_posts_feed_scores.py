@@ -0,0 +1,40 @@
+"""인기 피드 점수 컬럼 (hot_score/top_score) + 재계산 대상 표시
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 글은 모두 score_dirty=true로 시작 — 첫 갱신(또는 python -m app.cli refresh-scores)에서 계산
+    op.add_column("posts", sa.Column("hot_score", sa.Float(), nullable=False, server_default="0"))
+    op.add_column("posts", sa.Column("top_score", sa.Float(), nullable=False, server_default="0"))
+    op.add_column("posts", sa.Column("score_dirty", sa.Boolean(), nullable=False, server_default=sa.true()))
+    op.create_index("ix_posts_hot", "posts", ["hot_score", "post_id"])
+    op.create_index("ix_posts_top", "posts", ["top_score", "post_id"])
+    dirty = sa.column("score_dirty") == sa.true()
+    op.create_index("ix_posts_score_dirty", "posts", ["post_id"], sqlite_where=dirty, postgresql_where=dirty)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_posts_score_dirty", table_name="posts")
+    op.drop_index("ix_posts_top", table_name="posts")
+    op.drop_index("ix_posts_hot", table_name="posts")
+    op.drop_column("posts", "score_dirty")
+    op.drop_column("posts", "top_score")
+    op.drop_column("posts", "hot_score")
@@ -0,0 +1,32 @@
+"""글 소프트 삭제 시각 (deleted_at) + 정리 대기 글 부분 인덱스
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 자식 행 삭제는 이미 FK의 ON DELETE CASCADE (0001) — SQLite는 연결마다 PRAGMA foreign_keys=ON 필요 (app.database)
+    op.add_column("posts", sa.Column("deleted_at", sa.DateTime(timezone=True)))
+    deleted = sa.column("deleted_at").isnot(None)
+    op.create_index("ix_posts_deleted", "posts", ["post_id"], sqlite_where=deleted, postgresql_where=deleted)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_posts_deleted", table_name="posts")
+    op.drop_column("posts", "deleted_at")